@@ -0,0 +1,56 @@
+"""
+Time of `import pydbull` in a fresh interpreter (compared with importing pydantic alone, which pydbull requires).
+
+Run as `python benchmarks/import_time.py [--repeat N]`, prints a JSON object per measured statement.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS: dict[str, str] = {
+    "pydantic": "import pydantic.fields",
+    "pydbull": "import pydbull",
+    "pydbull+django": "import pydbull; pydbull.DjangoAdapter",
+}
+
+_MEASURE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, "django" in sys.modules)
+"""
+
+
+def measure(statement: str, repeat: int) -> dict[str, object]:
+    times: list[float] = []
+    django_imported = False
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", _MEASURE.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+        django_imported = output[1] == "True"
+    return {
+        "median_ms": round(statistics.median(times) * 1000, 2),
+        "min_ms": round(min(times) * 1000, 2),
+        "django_imported": django_imported,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    for name, statement in STATEMENTS.items():
+        print(json.dumps({"benchmark": "import_time", "name": name, **measure(statement, args.repeat)}))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Micro-benchmarks of the validation hot paths against an in-memory SQLite database.
+
+Run as `python benchmarks/validation.py [--repeat N] [--number N] [--filter SUBSTRING] [--compare BASELINE]`,
+prints a JSON object per case:
+- `median_us`, `min_us`: wall time of a single operation,
+- `alloc_peak_bytes`: peak of the memory allocated by a single operation (tracemalloc),
+- `alloc_blocks`: number of the memory blocks allocated by a single operation and not freed after it,
+- `queries`: number of the SQL queries issued by a single operation.
+
+Save the output of a version (`> baseline.jsonl`) and pass it by `--compare` when benchmarking another one,
+to add the `baseline_median_us` and `ratio` of each case.
+"""
+
+import argparse
+import datetime
+import decimal
+import json
+import pathlib
+import statistics
+import sys
+import time
+import tracemalloc
+import typing
+
+import django
+import django.conf
+
+django.conf.settings.configure(
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    INSTALLED_APPS=[],
+    USE_TZ=False,
+)
+django.setup()
+
+import django.core.files.base  # noqa: E402
+import django.core.validators  # noqa: E402
+import django.db  # noqa: E402
+import django.db.models  # noqa: E402
+import django.test.utils  # noqa: E402
+import pydantic  # noqa: E402
+
+import pydbull  # noqa: E402
+
+FIELD_COUNTS: tuple[int, ...] = (5, 50, 200)
+UNIQUE_COUNTS: tuple[int, ...] = (1, 5, 20)
+
+# (model field, pydantic annotation, valid value) cycled to build the models with N fields
+_FIELD_TYPES: tuple[tuple[typing.Callable[[], django.db.models.Field], type, typing.Any], ...] = (
+    (lambda: django.db.models.CharField(max_length=50), str, "value"),
+    (lambda: django.db.models.IntegerField(), int, 42),
+    (lambda: django.db.models.DecimalField(max_digits=10, decimal_places=2), decimal.Decimal, "12.50"),
+    (lambda: django.db.models.DateField(), datetime.date, "2024-01-31"),
+    (lambda: django.db.models.BooleanField(), bool, True),
+    (lambda: django.db.models.FloatField(), float, 1.5),
+    (lambda: django.db.models.EmailField(), str, "user@example.com"),
+)
+
+# name: (validator, valid value)
+_FIELD_VALIDATORS: dict[str, tuple[typing.Callable[[typing.Any], None], typing.Any]] = {
+    "email": (django.core.validators.EmailValidator(), "user@example.com"),
+    "url": (django.core.validators.URLValidator(), "https://www.example.com/path?query=1"),
+    "ipv46": (django.core.validators.validate_ipv46_address, "2001:db8::1"),
+    "prohibit_null_characters": (django.core.validators.ProhibitNullCharactersValidator(), "value"),
+    "file_extension": (
+        django.core.validators.FileExtensionValidator(["txt"]),
+        django.core.files.base.ContentFile(b"", name="file.txt"),
+    ),
+    "slug": (django.core.validators.validate_slug, "some-slug"),
+    "unicode_slug": (django.core.validators.validate_unicode_slug, "žluťoučký-kůň"),
+    "regex": (django.core.validators.RegexValidator(r"^[a-z]+$"), "value"),
+    "max_length": (django.core.validators.MaxLengthValidator(50), "value"),
+}
+
+
+class Case(typing.NamedTuple):
+    name: str
+    # Single operation to measure
+    run: typing.Callable[[], object]
+
+
+def build_model(name: str, field_count: int, unique_count: int = 0) -> type[django.db.models.Model]:
+    """
+    Django model with `field_count` fields of the `_FIELD_TYPES` (the first `unique_count` are unique,
+    constrained by a `UniqueConstraint` and a `CheckConstraint` as well) and its table.
+    """
+    attrs: dict[str, typing.Any] = {
+        f"field_{i}": _FIELD_TYPES[i % len(_FIELD_TYPES)][0]() for i in range(unique_count, field_count)
+    }
+    attrs.update({f"field_{i}": django.db.models.CharField(max_length=50, unique=True) for i in range(unique_count)})
+    constraints: list[django.db.models.BaseConstraint] = []
+    if unique_count:
+        constraints = [
+            django.db.models.UniqueConstraint(fields=list(attrs)[-min(unique_count, 2) :], name=f"{name}_unique"),
+            django.db.models.CheckConstraint(
+                condition=~django.db.models.Q(field_0=""),
+                name=f"{name}_check",
+            ),
+        ]
+    meta = type("Meta", (), {"app_label": "benchmarks", "constraints": constraints})
+    model = typing.cast(
+        "type[django.db.models.Model]",
+        type(name, (django.db.models.Model,), {"__module__": __name__, "Meta": meta, **attrs}),
+    )
+    with django.db.connection.schema_editor() as schema_editor:
+        schema_editor.create_model(model)
+    return model
+
+
+def build_validator(model: type[django.db.models.Model]) -> type[pydantic.BaseModel]:
+    """
+    Pydantic class to decorate by `@model_validator` with all the fields of the model.
+    """
+    return pydantic.create_model(
+        f"{model.__name__}Validator",
+        id=(int | None, None),
+        **{field.name: (_field_annotation(field), ...) for field in model._meta.concrete_fields if field.name != "id"},  # noqa: SLF001
+    )
+
+
+def build_record(model: type[django.db.models.Model]) -> dict[str, typing.Any]:
+    """
+    Valid data of the model.
+    """
+    return {
+        field.name: field.name if field.unique else _field_value(field)
+        for field in model._meta.concrete_fields  # noqa: SLF001
+        if field.name != "id"
+    }
+
+
+def _field_annotation(field: django.db.models.Field) -> type:
+    return next(annotation for factory, annotation, _ in _FIELD_TYPES if type(factory()) is type(field))
+
+
+def _field_value(field: django.db.models.Field) -> typing.Any:  # noqa: ANN401
+    return next(value for factory, _, value in _FIELD_TYPES if type(factory()) is type(field))
+
+
+def cases() -> typing.Iterator[Case]:
+    for field_count in FIELD_COUNTS:
+        model = build_model(f"Fields{field_count}", field_count)
+        validator = build_validator(model)
+        pyd_model = pydbull.model_validator(model, lazy=False)(validator)
+        record = build_record(model)
+        yield Case(f"decorate[{field_count}]", lambda model=model, validator=validator: _decorate(model, validator))
+        yield Case(f"model_to_pydantic[{field_count}]", lambda model=model: _model_to_pydantic(model))
+        yield Case(
+            f"validate[{field_count}]",
+            lambda pyd_model=pyd_model, record=record: pyd_model.model_validate(record),
+        )
+
+    adapter = pydbull.DjangoAdapter(django.db.models.Model)
+    field = django.db.models.CharField(max_length=50)
+    for name, (validator, value) in _FIELD_VALIDATORS.items():
+        yield Case(
+            f"field_validator[{name}]",
+            lambda validator=validator, value=value: adapter.run_extra_field_validators(field, value, [validator]),
+        )
+
+    for unique_count in UNIQUE_COUNTS:
+        model = build_model(f"Unique{unique_count}", unique_count + 2, unique_count=unique_count)
+        pyd_model = pydbull.model_validator(model, lazy=False)(build_validator(model))
+        record = build_record(model)
+        yield Case(
+            f"model_checks[{unique_count}]",
+            lambda pyd_model=pyd_model, record=record: pyd_model.model_validate(record),
+        )
+
+
+def _decorate(model: type[django.db.models.Model], validator: type[pydantic.BaseModel]) -> type[pydantic.BaseModel]:
+    return pydbull.model_validator(model, lazy=False)(validator)
+
+
+def _model_to_pydantic(model: type[django.db.models.Model]) -> type[pydantic.BaseModel]:
+    # Built again every time, not returned from the cache.
+    pydbull.model_cache.clear()
+    return pydbull.model_to_pydantic(model)
+
+
+def measure(case: Case, repeat: int, number: int) -> dict[str, object]:
+    case.run()  # warm up (e.g., the lazily compiled regular expressions)
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            case.run()
+        times.append((time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = case.run()
+        alloc_peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    alloc_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    with django.test.utils.CaptureQueriesContext(django.db.connection) as queries:
+        case.run()
+
+    return {
+        "median_us": round(statistics.median(times) * 1_000_000, 2),
+        "min_us": round(min(times) * 1_000_000, 2),
+        "alloc_peak_bytes": alloc_peak,
+        "alloc_blocks": alloc_blocks,
+        "queries": len(queries),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=100, help="Operations per repeat.")
+    parser.add_argument("--filter", default="", help="Run only the cases containing the substring.")
+    parser.add_argument("--compare", type=pathlib.Path, help="Output of a previous run to compare with.")
+    args = parser.parse_args()
+
+    baseline: dict[str, float] = {}
+    if args.compare:
+        for line in args.compare.read_text().splitlines():
+            result = json.loads(line)
+            if result.get("benchmark") == "validation":
+                baseline[result["name"]] = result["median_us"]
+
+    for case in cases():
+        if args.filter not in case.name:
+            continue
+        result: dict[str, object] = {
+            "benchmark": "validation",
+            "name": case.name,
+            **measure(case, args.repeat, args.number),
+        }
+        if case.name in baseline:
+            result["baseline_median_us"] = baseline[case.name]
+            result["ratio"] = round(typing.cast("float", result["median_us"]) / baseline[case.name], 3)
+        print(json.dumps(result))  # noqa: T201
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
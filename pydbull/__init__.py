@@ -1,7 +1,26 @@
-from .adapter import BaseAdapter as BaseAdapter, PydanticAdapter as PydanticAdapter
+from .adapter import AdapterRegistry as AdapterRegistry, BaseAdapter as BaseAdapter, FieldSpec as FieldSpec, PydanticAdapter as PydanticAdapter, adapter_registry as adapter_registry
+from ._settings import Settings as Settings, settings as settings
+from .strategy import ConstraintStrategy as ConstraintStrategy
+from .lazy import LazyModel as LazyModel
+from .mixin import PydbullModelMixin as PydbullModelMixin
+from .cache import ModelCache as ModelCache, model_cache as model_cache
+from .collector import Collector as Collector
+from .persistence import bulk_save as bulk_save
 from .model_validator import model_validator as model_validator, model_to_pydantic as model_to_pydantic, get_adapter as get_adapter, get_model as get_model
 
-try:
-    from .django import DjangoAdapter as DjangoAdapter
-except ImportError:
-    pass
+
+
+def __getattr__(name: str) -> object:
+    # Integrations are imported only when first used, so that e.g. `import pydbull` doesn't import Django.
+    if name == "DjangoAdapter":
+        try:
+            from .django import DjangoAdapter
+        except ImportError as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({e})") from e
+        globals()[name] = DjangoAdapter
+        return DjangoAdapter
+    if name == "django":
+        import importlib
+
+        return importlib.import_module(".django", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,65 @@
+import argparse
+import pathlib
+import sys
+import typing
+
+__all__ = [
+    "main",
+]
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydbull")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    generate_parser = subparsers.add_parser(
+        "generate",
+        help="Generate the source code of the pydantic models built by `model_to_pydantic` from Django models.",
+    )
+    generate_parser.add_argument(
+        "targets",
+        nargs="+",
+        metavar="app_label|model path",
+        help="App label, `<app_label>.<ModelName>` or import path of the model (e.g., `myapp.models.User`).",
+    )
+    generate_parser.add_argument("-o", "--output", help="Path of the generated module (printed if not set).")
+    generate_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write anything, exit with status 1 if the generated module is out of date.",
+    )
+    args = parser.parse_args(argv)
+    return _generate(parser, args)
+
+
+def _generate(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    import django
+
+    from pydbull import codegen
+    from pydbull.django.codegen import generate_module
+
+    django.setup()
+    header = (
+        f"Generated by `python -m pydbull generate {' '.join(args.targets)}`, do not edit.\n"
+        "Regenerate the module whenever the models change (use `--check` to check it's up to date)."
+    )
+    try:
+        source = generate_module(args.targets, header=header)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.check:
+        if args.output is None:
+            parser.error("--check requires --output.")
+        if codegen.is_stale(args.output, source):
+            sys.stderr.write(f"{args.output} is out of date, regenerate it.\n")
+            return 1
+        return 0
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        pathlib.Path(args.output).write_text(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
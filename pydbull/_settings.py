@@ -0,0 +1,29 @@
+import typing
+
+if typing.TYPE_CHECKING:
+    from pydbull.tracing import Tracer
+
+__all__ = [
+    "Settings",
+    "settings",
+]
+
+
+class Settings:
+    """
+    Global pydbull settings, e.g., `pydbull.settings.lazy = True`.
+    """
+
+    def __init__(self) -> None:
+        # Default of the `lazy` argument of `@model_validator` - build the models only when they're first used.
+        self.lazy: bool = False
+        # Maximum number of database queries run at once by the async validation (see `amodel_validate`).
+        self.async_concurrency: int = 4
+        # Default constraint strategy of the models ("db", "python", "skip" or "deferred", see `pydbull.strategy`).
+        self.constraint_strategy: str = "db"
+        # Receives the timings of the validation phases (see `pydbull.tracing`), None disables the tracing.
+        # Only the models built while it's set are traced (the others run without the tracing wrappers).
+        self.tracer: Tracer | None = None
+
+
+settings = Settings()
@@ -2,11 +2,23 @@ import types
 import typing
 
 import pydantic.fields
+import pydantic_core
 
 __all__ = [
+    "SKIP_MODEL_VALIDATORS_CONTEXT_KEY",
+    "dump_validation_error",
+    "find_loc",
+    "load_validation_error",
     "pydantic_field_is_optional",
+    "with_loc_prefix",
+    "with_loc_prefixes",
+    "with_title",
 ]
 
+# Validation context key of the list collecting the models (including the nested ones) whose extra model validators
+# are skipped, e.g., to run them later for the whole batch (see `PydbullModelMixin.validate_many`).
+SKIP_MODEL_VALIDATORS_CONTEXT_KEY: typing.Final[str] = "pydbull_skip_model_validators"
+
 
 def pydantic_field_is_optional(field: pydantic.fields.FieldInfo) -> bool:
     """
@@ -14,3 +26,90 @@ def pydantic_field_is_optional(field: pydantic.fields.FieldInfo) -> bool:
     """
     t = field.annotation
     return typing.get_origin(t) in (types.UnionType, typing.Union) and type(None) in typing.get_args(t)
+
+
+def with_title(exc: pydantic.ValidationError, title: str) -> pydantic.ValidationError:
+    """
+    Returns a copy of the validation error with a different title
+    (e.g., to match the error raised when validating the model itself).
+    """
+    return pydantic.ValidationError.from_exception_data(title, line_errors=_line_errors(exc.errors()))
+
+
+def with_loc_prefix(exc: pydantic.ValidationError, *prefix: str | int) -> pydantic.ValidationError:
+    """
+    Returns a copy of the validation error with the locations prefixed (e.g., with the field of a nested model).
+    """
+    return pydantic.ValidationError.from_exception_data(exc.title, line_errors=_line_errors(exc.errors(), prefix))
+
+
+def with_loc_prefixes(
+    title: str,
+    errors: typing.Iterable[tuple[tuple[str | int, ...], pydantic.ValidationError]],
+) -> pydantic.ValidationError:
+    """
+    Validation error combining the errors, each with its locations prefixed (e.g., with the field of a nested model).
+    """
+    return pydantic.ValidationError.from_exception_data(
+        title,
+        line_errors=[line_error for prefix, exc in errors for line_error in _line_errors(exc.errors(), prefix)],
+    )
+
+
+def find_loc(value: typing.Any, target: typing.Any) -> tuple[str | int, ...] | None:  # noqa: ANN401
+    """
+    Location of the `target` object (compared by identity) nested in the `value` (through the fields of pydantic
+    models, lists, tuples and dicts), None if it isn't there.
+    """
+    if value is target:
+        return ()
+    items: typing.Iterable[tuple[str | int, typing.Any]]
+    if isinstance(value, pydantic.BaseModel):
+        items = ((field_name, getattr(value, field_name)) for field_name in type(value).__pydantic_fields__)
+    elif isinstance(value, list | tuple):
+        items = enumerate(value)
+    elif isinstance(value, dict):
+        items = value.items()
+    else:
+        return None
+    for key, item in items:
+        if (loc := find_loc(item, target)) is not None:
+            return (key, *loc)
+    return None
+
+
+def dump_validation_error(exc: pydantic.ValidationError) -> tuple[str, list[pydantic_core.ErrorDetails]]:
+    """
+    Picklable representation of the validation error (e.g., to send it from a worker process),
+    see `load_validation_error`.
+    """
+    return exc.title, exc.errors()
+
+
+def load_validation_error(dumped: tuple[str, list[pydantic_core.ErrorDetails]]) -> pydantic.ValidationError:
+    """
+    Re-create the validation error from the result of `dump_validation_error`.
+    """
+    title, errors = dumped
+    return pydantic.ValidationError.from_exception_data(title, line_errors=_line_errors(errors))
+
+
+def _line_errors(
+    errors: typing.Iterable[pydantic_core.ErrorDetails],
+    loc_prefix: tuple[str | int, ...] = (),
+) -> list[pydantic_core.InitErrorDetails]:
+    line_errors: list[pydantic_core.InitErrorDetails] = []
+    for error in errors:
+        line_error: pydantic_core.InitErrorDetails = {
+            "type": error["type"],
+            "loc": (*loc_prefix, *error["loc"]),
+            "input": error["input"],
+        }
+        if "url" in error:
+            # Built-in error type of pydantic (the custom errors have no documentation URL).
+            if "ctx" in error:
+                line_error["ctx"] = error["ctx"]
+        else:
+            line_error["type"] = pydantic_core.PydanticCustomError(error["type"], error["msg"], error.get("ctx"))
+        line_errors.append(line_error)
+    return line_errors
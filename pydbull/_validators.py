@@ -0,0 +1,77 @@
+"""
+The pydantic validators running the validation of the model (e.g., Django), added to the pydantic models
+built by `@model_validator` / `model_to_pydantic` and to the ones generated by `pydbull.codegen`.
+"""
+
+import typing
+
+import pydantic
+
+import pydbull
+from pydbull import _utils as utils
+from pydbull import strategy as constraint_strategies
+from pydbull import tracing
+from pydbull._settings import settings
+
+__all__ = [
+    "extra_field_validator",
+    "extra_model_validator",
+    "trace_validator",
+]
+
+
+def extra_field_validator(
+    adapter: "pydbull.BaseAdapter",
+    field_name: str,
+    model_field: object,
+    validators: typing.Sequence[typing.Callable[[typing.Any], typing.Any]],
+) -> typing.Any:  # noqa: ANN401
+    """
+    Field validator running the `validators` of the model field not enforced by the pydantic field constraints.
+    """
+    validator = adapter.build_extra_field_validator(model_field, validators)
+    if settings.tracer is not None:
+        # Only the models built with the tracer set are traced, the others don't pay for the wrapper.
+        validator = tracing.traced("field_validators", validator, field=field_name)
+    # The same as putting @pydantic.field_validator(field_name) decorator on a method
+    # which contains the validator logic.
+    return pydantic.field_validator(field_name)(validator)
+
+
+def extra_model_validator(adapter: "pydbull.BaseAdapter") -> typing.Any:  # noqa: ANN401
+    """
+    Model validator running the extra model validators of the adapter by the constraint strategy of the model.
+    """
+
+    def run_extra_model_validators[T: pydantic.BaseModel](pyd_model: T, info: pydantic.ValidationInfo) -> T:
+        context = info.context if isinstance(info.context, dict) else None
+        if context is not None and (skipped := context.get(utils.SKIP_MODEL_VALIDATORS_CONTEXT_KEY)) is not None:
+            # Run separately, e.g., for the whole batch (see `PydbullModelMixin.validate_many`).
+            skipped.append(pyd_model)
+            return pyd_model
+        strategy = type(pyd_model)._pydbull_constraint_strategy(context)  # noqa: SLF001
+        if strategy == "db":
+            return adapter.run_extra_model_validators(pyd_model, info)
+        return constraint_strategies.run_model_checks(adapter, pyd_model, strategy, context)
+
+    # The same as putting @pydantic.model_validator decorator on a method which contains the validator logic.
+    return pydantic.model_validator(mode="after")(run_extra_model_validators)
+
+
+def trace_validator(adapter: "pydbull.BaseAdapter") -> typing.Any:  # noqa: ANN401
+    """
+    Model validator reporting the timings of the validation phases to `pydbull.settings.tracer`.
+    """
+
+    def trace[T: pydantic.BaseModel](
+        cls: type[T],
+        value: typing.Any,  # noqa: ANN401
+        handler: pydantic.ValidatorFunctionWrapHandler,
+    ) -> T:
+        tracer = settings.tracer
+        if tracer is None or not tracer.sample():
+            return handler(value)
+        return tracing.trace_validation(tracer, cls.__name__, lambda: handler(value), adapter.count_queries)
+
+    # The same as putting @pydantic.model_validator(mode="wrap") decorator on a classmethod.
+    return pydantic.model_validator(mode="wrap")(classmethod(trace))
@@ -1,2 +1,4 @@
+from .field_spec import *
 from .base import *
 from .pydantic_adapter import *
+from .registry import *
@@ -1,10 +1,13 @@
 import abc
+import contextlib
 import typing
 
 import annotated_types
 import pydantic.fields
 from pydantic_core import PydanticUndefinedType
 
+from pydbull.adapter.field_spec import FieldSpec
+
 __all__ = [
     "BaseAdapter",
 ]
@@ -17,6 +20,11 @@ class BaseAdapter[ModelT: object](abc.ABC):
 
     def __init__(self, model: type[ModelT]) -> None:
         self.model: type[ModelT] = model
+        self._field_specs: dict[object, FieldSpec] = {}
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # Pickled by reference to the model, the cached validation information is built again when unpickled.
+        return type(self), (self.model,)
 
     def field_pre_check(self, field: str, validator_field: pydantic.fields.FieldInfo) -> None:  # noqa: ARG002
         """
@@ -24,13 +32,85 @@ class BaseAdapter[ModelT: object](abc.ABC):
         """
         return
 
-    def run_extra_field_validators(self, field: object, value: typing.Any) -> typing.Any:  # noqa: ARG002 ANN401
+    def get_field_spec(self, field: object) -> FieldSpec:
+        """
+        Get the validation information of the field, built only once per field (see `build_field_spec`).
+        """
+        try:
+            return self._field_specs[field]
+        except KeyError:
+            spec = self._field_specs[field] = self.build_field_spec(field)
+            return spec
+
+    def build_field_spec(self, field: object) -> FieldSpec:
+        """
+        Extract the validation information of the field.
+        Subclasses can override this to extract everything at once (e.g., in a single pass over the field validators).
+        """
+        return FieldSpec(
+            default=self.get_default(field),
+            default_factory=self.get_default_factory(field),
+            max_length=self.get_max_length(field),
+            min_length=self.get_min_length(field),
+            pattern=self.get_pattern(field),
+            gt=self.get_greater_than(field),
+            ge=self.get_greater_than_or_equal(field),
+            lt=self.get_less_than(field),
+            le=self.get_less_than_or_equal(field),
+            multiple_of=self.get_multiple_of(field),
+            max_digits=self.get_decimal_max_digits(field),
+            decimal_places=self.get_decimal_places(field),
+            description=self.get_description(field),
+        )
+
+    def get_extra_field_validators(
+        self,
+        field: object,  # noqa: ARG002
+        validator_field: pydantic.fields.FieldInfo,  # noqa: ARG002
+    ) -> typing.Sequence[typing.Callable[[typing.Any], typing.Any]]:
+        """
+        Get the validators of the field which are not enforced by the constraints of the (already enriched) pydantic
+        field and need to be run by `run_extra_field_validators`.
+        If there are none (and no `get_null_value`), no extra field validator is added to the pydantic model.
+        """
+        return ()
+
+    def get_null_value(self, field: object) -> typing.Any:  # noqa: ANN401, ARG002
+        """
+        Value replacing None in the validated field (e.g., an empty string of a non-nullable text field),
+        None to keep it.
+        """
+        return None
+
+    def run_extra_field_validators(
+        self,
+        field: object,  # noqa: ARG002
+        value: typing.Any,  # noqa: ANN401
+        validators: typing.Sequence[typing.Callable[[typing.Any], typing.Any]] | None = None,  # noqa: ARG002
+    ) -> typing.Any:  # noqa: ANN401
         """
         Run any extra validators on the field and return the processed field value.
+        :param validators: Validators to run (see `get_extra_field_validators`), all validators of the field if None.
         :raise pydantic.ValidationError: If the field value is invalid.
         """
         return value
 
+    def build_extra_field_validator(
+        self,
+        field: object,
+        validators: typing.Sequence[typing.Callable[[typing.Any], typing.Any]],
+    ) -> typing.Callable[[typing.Any], typing.Any]:
+        """
+        Build the function running the extra `validators` (see `get_extra_field_validators`) on the field value.
+        Called once per field when the model is decorated, so subclasses can resolve everything not depending
+        on the value upfront.
+        """
+
+        def run_extra_field_validators(value: typing.Any) -> typing.Any:  # noqa: ANN401
+            return self.run_extra_field_validators(field=field, value=value, validators=validators)
+
+        return run_extra_field_validators
+
     @staticmethod
     def run_extra_model_validators[T: pydantic.BaseModel](
         pyd_model: T,
@@ -43,6 +123,47 @@ class BaseAdapter[ModelT: object](abc.ABC):
         """
         return pyd_model
 
+    def run_python_model_validators[T: pydantic.BaseModel](self, pyd_model: T) -> T:
+        """
+        Run only the extra model validators which don't require the database (the "python" constraint strategy),
+        e.g., constraints which can be evaluated in Python.
+        :raise pydantic.ValidationError: If the model is invalid.
+        """
+        return pyd_model
+
+    async def arun_extra_model_validators[T: pydantic.BaseModel](
+        self,
+        pyd_model: T,
+        context: dict[str, typing.Any] | None = None,  # noqa: ARG002
+        concurrency: int | None = None,  # noqa: ARG002
+    ) -> T:
+        """
+        Async counterpart of `run_extra_model_validators`.
+        Subclasses should override this to run the checks without blocking the event loop (e.g., with an async ORM),
+        running at most `concurrency` independent checks at once.
+        :raise pydantic.ValidationError: If the model is invalid.
+        """
+        return self.run_extra_model_validators(pyd_model, context=None)
+
+    def run_extra_model_validators_many(
+        self,
+        pyd_models: typing.Sequence["pydantic.BaseModel"],
+    ) -> list[pydantic.ValidationError | None]:
+        """
+        Batch counterpart of `run_extra_model_validators`.
+        Returns a list aligned with `pyd_models` containing the validation error of each model (or None if valid).
+        Subclasses should override this to validate the whole batch at once (e.g., with one query per check).
+        """
+        errors: list[pydantic.ValidationError | None] = []
+        for pyd_model in pyd_models:
+            try:
+                self.run_extra_model_validators(pyd_model, context=None)
+            except pydantic.ValidationError as exc:
+                errors.append(exc)
+            else:
+                errors.append(None)
+        return errors
+
     @abc.abstractmethod
     def get_max_length(self, field: object) -> int | PydanticUndefinedType | None:
         """
@@ -153,6 +274,7 @@ class BaseAdapter[ModelT: object](abc.ABC):
         exclude: typing.Collection[str] | None = None,
         field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
         __base__: type[T] | None = None,
+        depth: int | None = 0,
     ) -> type["pydantic.BaseModel"] | type[T]:
         pass
 
@@ -165,6 +287,7 @@ class BaseAdapter[ModelT: object](abc.ABC):
         exclude: typing.Literal[None] = None,
         field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
         __base__: type[T] | None = None,
+        depth: int | None = 0,
     ) -> type["pydantic.BaseModel"] | type[T]:
         pass
 
@@ -177,6 +300,7 @@ class BaseAdapter[ModelT: object](abc.ABC):
         exclude: typing.Collection[str] | None = None,
         field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
         __base__: type[T] | None = None,
+        depth: int | None = 0,
     ) -> type["pydantic.BaseModel"] | type[T]:
         """
         Create a pydantic model from self.model.
@@ -186,6 +310,8 @@ class BaseAdapter[ModelT: object](abc.ABC):
         :param field_annotations: Any extra annotations for the fields in the pydantic model.
             Use as: {<field_name>: pydantic.Field(...), ...}
         :param __base__: Base of the pydantic model.
+        :param depth: Levels of the relations represented by the nested pydantic models of the related models
+            (None for all the levels), the deeper ones are primary keys.
         """
 
     @abc.abstractmethod
@@ -197,3 +323,62 @@ class BaseAdapter[ModelT: object](abc.ABC):
         Get the instance of the model.
         To be overridden by the subclasses.
         """
+
+    async def aget_model_instance(
+        self,
+        data: "pydantic.BaseModel",
+    ) -> ModelT:
+        """
+        Async counterpart of `get_model_instance`.
+        """
+        return self.get_model_instance(data)
+
+    def get_model_instances(
+        self,
+        data: typing.Sequence["pydantic.BaseModel"],
+    ) -> list[ModelT | pydantic.ValidationError]:
+        """
+        Batch counterpart of `get_model_instance`.
+        Returns a list aligned with `data` containing the instance, or a validation error if it can't be retrieved
+        (e.g., it doesn't exist).
+        Subclasses should override this to retrieve the existing instances at once.
+        """
+        return [self.get_model_instance(d) for d in data]
+
+    def transaction(self) -> typing.ContextManager[None]:
+        """
+        Transaction of the storage of the data model (e.g., a database), used by `bulk_save`.
+        """
+        return contextlib.nullcontext()
+
+    def count_queries(self, on_query: typing.Callable[[], None]) -> typing.ContextManager[None] | None:  # noqa: ARG002
+        """
+        Context manager calling `on_query` on each query to the storage issued inside it, used by the tracing
+        (see `pydbull.tracing`).
+        Returns None if the queries can't be counted (the default).
+        """
+        return None
+
+    def worker_initializer(self) -> typing.Callable[[], object] | None:
+        """
+        Picklable function preparing the worker processes of `validate_parallel` to import the validated models
+        (e.g., set up the framework in the processes started by the "spawn" method).
+        Returns None if there's nothing to prepare (the default).
+        """
+        return None
+
+    def bulk_save(
+        self,
+        pyd_models: typing.Sequence["pydantic.BaseModel"],
+        *,
+        batch_size: int | None = None,
+        update_conflicts: bool = False,
+        unique_fields: typing.Sequence[str] | None = None,
+    ) -> list[typing.Any]:
+        """
+        Save the validated models at once (e.g., with `bulk_create`), in chunks of `batch_size`.
+        Returns a list aligned with `pyd_models` containing the primary keys of the saved instances.
+        To be overridden by the subclasses supporting it.
+        :param update_conflicts: Update the existing instances conflicting on `unique_fields` instead of failing.
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't support bulk saving.")
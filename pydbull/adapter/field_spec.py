@@ -0,0 +1,123 @@
+import typing
+
+import pydantic.fields
+from pydantic_core import PydanticUndefined
+
+__all__ = [
+    "FieldSpec",
+]
+
+
+class FieldSpec:
+    """
+    Immutable validation information of a model field, extracted once by the adapter
+    (see `BaseAdapter.get_field_spec`).
+    The attributes have the same meaning as the return values of the corresponding adapter getters
+    (e.g., `max_length` of `BaseAdapter.get_max_length`), `validators` are all the validators of the model field
+    and `metadata` are additional pydantic metadata of the field (e.g., native equivalents of the validators).
+    """
+
+    __slots__ = (
+        "decimal_places",
+        "default",
+        "default_factory",
+        "description",
+        "ge",
+        "gt",
+        "le",
+        "lt",
+        "max_digits",
+        "max_length",
+        "metadata",
+        "min_length",
+        "multiple_of",
+        "pattern",
+        "validators",
+    )
+
+    default: typing.Any
+    default_factory: typing.Any
+    max_length: typing.Any
+    min_length: typing.Any
+    pattern: typing.Any
+    gt: typing.Any
+    ge: typing.Any
+    lt: typing.Any
+    le: typing.Any
+    multiple_of: typing.Any
+    max_digits: typing.Any
+    decimal_places: typing.Any
+    description: typing.Any
+    validators: tuple[typing.Callable[[typing.Any], typing.Any], ...]
+    metadata: tuple[typing.Any, ...]
+
+    def __init__(
+        self,
+        *,
+        default: typing.Any = PydanticUndefined,  # noqa: ANN401
+        default_factory: typing.Any = PydanticUndefined,  # noqa: ANN401
+        max_length: typing.Any = PydanticUndefined,  # noqa: ANN401
+        min_length: typing.Any = PydanticUndefined,  # noqa: ANN401
+        pattern: typing.Any = PydanticUndefined,  # noqa: ANN401
+        gt: typing.Any = PydanticUndefined,  # noqa: ANN401
+        ge: typing.Any = PydanticUndefined,  # noqa: ANN401
+        lt: typing.Any = PydanticUndefined,  # noqa: ANN401
+        le: typing.Any = PydanticUndefined,  # noqa: ANN401
+        multiple_of: typing.Any = PydanticUndefined,  # noqa: ANN401
+        max_digits: typing.Any = PydanticUndefined,  # noqa: ANN401
+        decimal_places: typing.Any = PydanticUndefined,  # noqa: ANN401
+        description: typing.Any = PydanticUndefined,  # noqa: ANN401
+        validators: typing.Iterable[typing.Callable[[typing.Any], typing.Any]] = (),
+        metadata: typing.Iterable[typing.Any] = (),
+    ) -> None:
+        values: dict[str, typing.Any] = {
+            "default": default,
+            "default_factory": default_factory,
+            "max_length": max_length,
+            "min_length": min_length,
+            "pattern": pattern,
+            "gt": gt,
+            "ge": ge,
+            "lt": lt,
+            "le": le,
+            "multiple_of": multiple_of,
+            "max_digits": max_digits,
+            "decimal_places": decimal_places,
+            "description": description,
+            "validators": tuple(validators),
+            "metadata": tuple(metadata),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:  # noqa: ANN401
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({attrs})"
+
+    def to_field_info(self) -> pydantic.fields.FieldInfo:
+        """
+        Pydantic field with the constraints of the model field.
+        """
+        field_info = pydantic.Field(
+            default=self.default,
+            default_factory=self.default_factory,
+            max_length=self.max_length,
+            min_length=self.min_length,
+            pattern=self.pattern,
+            gt=self.gt,
+            ge=self.ge,
+            lt=self.lt,
+            le=self.le,
+            max_digits=self.max_digits,
+            decimal_places=self.decimal_places,
+            multiple_of=self.multiple_of,
+            description=self.description,
+        )
+        field_info.metadata.extend(self.metadata)
+        return field_info
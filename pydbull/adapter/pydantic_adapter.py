@@ -144,6 +144,7 @@ class PydanticAdapter[ModelT: pydantic.BaseModel](BaseAdapter[ModelT]):
         fields: typing.Collection[str] | None = None,
         exclude: typing.Collection[str] | None = None,
         field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
+        depth: int | None = 0,
         __base__: type[pydantic.BaseModel] | None = None,
     ) -> type["pydantic.BaseModel"]:
         return self.model
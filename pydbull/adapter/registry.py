@@ -0,0 +1,75 @@
+import importlib
+import threading
+import typing
+import weakref
+
+from pydbull.adapter.base import BaseAdapter
+
+__all__ = [
+    "AdapterRegistry",
+    "adapter_registry",
+]
+
+
+class AdapterRegistry:
+    """
+    Adapters of the model types (see `model_validator` and `model_to_pydantic`).
+    The adapter of a model is resolved by walking the model's MRO, so it's also used for the subclasses
+    of the registered type, and the result is cached by the model type.
+    """
+
+    def __init__(self) -> None:
+        self._adapters: dict[type, type[BaseAdapter]] = {}
+        # Import path of the model type: import path of the adapter (imported only when first needed).
+        self._lazy_adapters: dict[str, str] = {}
+        self._cache: weakref.WeakKeyDictionary[type, type[BaseAdapter]] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def register(self, model_type: type, adapter_cls: type[BaseAdapter]) -> None:
+        """
+        Use `adapter_cls` for the `model_type` and its subclasses (overrides any adapter registered before).
+        """
+        with self._lock:
+            self._adapters[model_type] = adapter_cls
+            self._cache.clear()
+
+    def register_lazy(self, model_type: str, adapter_cls: str) -> None:
+        """
+        The same as `register`, but both the model type and the adapter are given by their import paths
+        (e.g., `"django.db.models.base.Model"`), so that nothing is imported until a model of the type is used.
+        """
+        with self._lock:
+            self._lazy_adapters[model_type] = adapter_cls
+            self._cache.clear()
+
+    def get(self, model: typing.Any) -> type[BaseAdapter]:  # noqa: ANN401
+        """
+        :raise NotImplementedError: If there is no adapter for the model.
+        """
+        try:
+            return self._cache[model]
+        except (KeyError, TypeError):  # TypeError - not a class
+            pass
+        if not isinstance(model, type):
+            raise NotImplementedError(f"Adapter for {model} not implemented")
+
+        for model_type in model.__mro__:
+            adapter_cls = self._adapters.get(model_type)
+            if adapter_cls is None:
+                adapter_path = self._lazy_adapters.get(f"{model_type.__module__}.{model_type.__qualname__}")
+                if adapter_path is None:
+                    continue
+                adapter_cls = _import_string(adapter_path)
+            with self._lock:
+                self._cache[model] = adapter_cls
+            return adapter_cls
+        raise NotImplementedError(f"Adapter for {model} not implemented")
+
+
+def _import_string(path: str) -> typing.Any:  # noqa: ANN401
+    module_path, name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), name)
+
+
+adapter_registry = AdapterRegistry()
+adapter_registry.register_lazy("django.db.models.base.Model", "pydbull.django.adapter.DjangoAdapter")
@@ -0,0 +1,191 @@
+import collections
+import concurrent.futures
+import threading
+import typing
+
+import pydantic.fields
+
+__all__ = [
+    "CacheInfo",
+    "ModelCache",
+    "field_info_cache_key",
+    "model_cache",
+]
+
+DEFAULT_MAXSIZE: typing.Final[int] = 128
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Key, model and the future of the waiting threads.
+type _Built = tuple[typing.Hashable, typing.Any, concurrent.futures.Future[typing.Any]]
+
+
+class ModelCache:
+    """
+    Thread-safe LRU cache of the built pydantic models (see `model_to_pydantic`).
+    The cached models are shared by all callers, so they must not be modified.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self._maxsize: int = maxsize
+        self._models: collections.OrderedDict[typing.Hashable, type[pydantic.BaseModel]] = collections.OrderedDict()
+        # Models being built (outside the lock) by the key.
+        self._pending: dict[typing.Hashable, concurrent.futures.Future[type[pydantic.BaseModel]]] = {}
+        # Models built by the current thread while building the outermost one, cached once it's built.
+        self._building = threading.local()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of cached models, the least recently used models are evicted first.
+        Set to 0 to disable the cache.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size must be a non-negative number.")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get_or_build[T: type[pydantic.BaseModel]](self, key: typing.Hashable, build: typing.Callable[[], T]) -> T:
+        """
+        Get the model cached under the `key`, or build it with `build` and cache it.
+        The model is built outside the lock (the other models are available meanwhile), only once even if requested
+        from multiple threads at the same time - they wait for the model being built.
+        The threads building another model at that time build their own (uncached) copy instead of waiting, so that
+        the threads never wait for each other.
+        The models built while building another one (e.g., the related models) are cached once the outermost
+        one is built, because they may be completed only then (e.g., a cycle of the relations).
+        """
+        deferred: list[_Built] | None = getattr(self._building, "deferred", None)
+        with self._lock:
+            try:
+                model = self._models[key]
+            except KeyError:
+                pass
+            else:
+                self._models.move_to_end(key)
+                self._hits += 1
+                return model
+
+            future = self._pending.get(key)
+            if future is not None and deferred is None:
+                self._hits += 1
+                wait: bool = True
+            else:
+                self._misses += 1
+                wait = False
+                if future is None:
+                    future = self._pending[key] = concurrent.futures.Future()
+                else:
+                    # Built by another thread, this copy isn't cached.
+                    future = None
+
+        if wait:
+            return future.result()
+        if deferred is not None:
+            return self._build_nested(key, build, future, deferred)
+        return self._build(key, build, future)
+
+    def _build[T: type[pydantic.BaseModel]](
+        self,
+        key: typing.Hashable,
+        build: typing.Callable[[], T],
+        future: concurrent.futures.Future[T],
+    ) -> T:
+        built: list[_Built] = []
+        self._building.deferred = built
+        try:
+            model = build()
+        except BaseException as e:
+            self._publish([*built, (key, None, future)], e)
+            raise
+        finally:
+            self._building.deferred = None
+        self._publish([*built, (key, model, future)])
+        return model
+
+    def _build_nested[T: type[pydantic.BaseModel]](
+        self,
+        key: typing.Hashable,
+        build: typing.Callable[[], T],
+        future: concurrent.futures.Future[T] | None,
+        deferred: list["_Built"],
+    ) -> T:
+        try:
+            model = build()
+        except BaseException as e:
+            if future is not None:
+                self._publish([(key, None, future)], e)
+            raise
+        if future is not None:
+            deferred.append((key, model, future))
+        return model
+
+    def _publish(self, built: list["_Built"], error: BaseException | None = None) -> None:
+        with self._lock:
+            for key, model, _ in built:
+                del self._pending[key]
+                if error is None and self._maxsize > 0:
+                    self._models[key] = model
+            self._evict()
+        for _, model, future in built:
+            if error is None:
+                future.set_result(model)
+            else:
+                future.set_exception(error)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, maxsize=self._maxsize, currsize=len(self._models))
+
+    def clear(self) -> None:
+        """
+        Remove all the cached models and reset the statistics.
+        """
+        with self._lock:
+            self._models.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _evict(self) -> None:
+        while len(self._models) > self._maxsize:
+            self._models.popitem(last=False)
+
+
+def field_info_cache_key(field_info: pydantic.fields.FieldInfo) -> typing.Hashable:
+    """
+    Hashable key of the field info.
+    `FieldInfo` is compared by identity, but equal field infos (e.g., created on every call) should share the key.
+    """
+    return tuple((attr, _freeze(getattr(field_info, attr, None))) for attr in pydantic.fields.FieldInfo.__slots__)
+
+
+def _freeze(value: typing.Any) -> typing.Hashable:  # noqa: ANN401
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), repr(value)
+    return value
+
+
+# Cache of models built by `model_to_pydantic`.
+model_cache = ModelCache()
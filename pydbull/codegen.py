@@ -0,0 +1,247 @@
+"""
+Ahead-of-time generation of the source code of the pydantic models built by `model_to_pydantic`
+(see `python -m pydbull generate --help`).
+The generated modules import the static classes instead of building them from the models on every start.
+"""
+
+import builtins
+import datetime
+import decimal
+import enum
+import pathlib
+import types
+import typing
+import uuid
+
+import pydantic.fields
+from pydantic_core import PydanticUndefined
+
+import pydbull
+from pydbull import _validators
+
+__all__ = [
+    "default_factory",
+    "field_metadata",
+    "field_validator",
+    "is_stale",
+    "model_validator",
+    "render_module",
+    "trace_validator",
+]
+
+_FIELD_CONSTRAINTS: tuple[tuple[str, str], ...] = (
+    # (pydantic.Field argument, PydanticAdapter getter)
+    ("max_length", "get_max_length"),
+    ("min_length", "get_min_length"),
+    ("pattern", "get_pattern"),
+    ("gt", "get_greater_than"),
+    ("ge", "get_greater_than_or_equal"),
+    ("lt", "get_less_than"),
+    ("le", "get_less_than_or_equal"),
+    ("multiple_of", "get_multiple_of"),
+    ("max_digits", "get_decimal_max_digits"),
+    ("decimal_places", "get_decimal_places"),
+)
+
+_PYD_ADAPTER = pydbull.PydanticAdapter(pydantic.BaseModel)
+
+
+# Functions used by the generated modules.
+
+
+def field_validator(
+    adapter: "pydbull.BaseAdapter",
+    field_name: str,
+    validator_indexes: typing.Iterable[int],
+) -> typing.Any:  # noqa: ANN401
+    """
+    Field validator running the model field validators (indexes to `FieldSpec.validators`)
+    not enforced by the pydantic field constraints.
+    """
+    model_field = adapter.field_getter(field_name)
+    validators = adapter.get_field_spec(model_field).validators
+    return _validators.extra_field_validator(
+        adapter,
+        field_name,
+        model_field,
+        tuple(validators[i] for i in validator_indexes),
+    )
+
+
+def model_validator(adapter: "pydbull.BaseAdapter") -> typing.Any:  # noqa: ANN401
+    """
+    Model validator running the extra model validators of the adapter (e.g., uniqueness checks).
+    """
+    return _validators.extra_model_validator(adapter)
+
+
+def trace_validator(adapter: "pydbull.BaseAdapter") -> typing.Any:  # noqa: ANN401
+    """
+    Model validator reporting the timings of the validation phases to `pydbull.settings.tracer`.
+    """
+    return _validators.trace_validator(adapter)
+
+
+def default_factory(adapter: "pydbull.BaseAdapter", field_name: str) -> typing.Callable[[], typing.Any]:
+    """
+    Default factory of the model field.
+    """
+    return adapter.get_field_spec(adapter.field_getter(field_name)).default_factory
+
+
+def field_metadata(adapter: "pydbull.BaseAdapter", field_name: str) -> tuple[typing.Any, ...]:
+    """
+    Additional pydantic metadata of the model field (e.g., native equivalents of the validators).
+    """
+    return adapter.get_field_spec(adapter.field_getter(field_name)).metadata
+
+
+# Rendering
+
+
+def render_module(pyd_models: typing.Iterable[type[pydantic.BaseModel]], header: str = "") -> str:
+    """
+    Render the source code of a module with the pydantic models built by `model_to_pydantic`
+    (or `@model_validator`).
+    :param header: Comment at the top of the module (e.g., how to regenerate it).
+    :raise ValueError: If the model can't be rendered (e.g., it has a field default which can't be written as code).
+    """
+    imports: set[str] = {"pydantic", "pydbull", "pydbull.codegen", "typing"}
+    blocks: list[str] = []
+    names: set[str] = set()
+    for pyd_model in pyd_models:
+        if pyd_model.__name__ in names:
+            raise ValueError(f"Multiple models named `{pyd_model.__name__}`, generate them into separate modules.")
+        names.add(pyd_model.__name__)
+        blocks.append(_render_model(pyd_model, imports))
+    lines: list[str] = [f"# {line}".rstrip() for line in header.splitlines()]
+    lines.extend(f"import {module}" for module in sorted(imports))
+    return "\n".join(lines) + "\n\n\n" + "\n\n\n".join(blocks)
+
+
+def is_stale(path: str | pathlib.Path, source: str) -> bool:
+    """
+    Whether the generated module at `path` differs from the freshly rendered `source` (or doesn't exist).
+    """
+    try:
+        return pathlib.Path(path).read_text() != source
+    except FileNotFoundError:
+        return True
+
+
+def _render_model(pyd_model: type[pydantic.BaseModel], imports: set[str]) -> str:
+    adapter = pydbull.get_adapter(pyd_model)
+    model = pydbull.get_model(pyd_model)
+    model_path = _render_class(model, imports)
+    adapter_name = f"_{pyd_model.__name__.lower()}_adapter"
+    lines: list[str] = [
+        f"{adapter_name} = {_render_class(type(adapter), imports)}({model_path})",
+        "",
+        "",
+        f"class {pyd_model.__name__}(pydbull.PydbullModelMixin, pydantic.BaseModel):",
+        f'    """Generated from `{model_path}`."""',
+        "",
+    ]
+    lines.append(f"    __pydbull_model__ = {model_path}")
+    lines.append(f"    __pydbull_adapter__ = {adapter_name}")
+    lines.append("")
+
+    validator_lines: list[str] = []
+    for field_name, field_info in pyd_model.__pydantic_fields__.items():
+        annotation = _render_type(field_info.annotation, imports)
+        model_field = adapter.field_getter(field_name)
+        field_kwargs = _render_field_kwargs(field_name, field_info, adapter, model_field, adapter_name, imports)
+        if model_field is None:
+            lines.append(f"    {field_name}: typing.Annotated[{annotation}, pydantic.Field({field_kwargs})]")
+            continue
+        metadata = ""
+        if adapter.get_field_spec(model_field).metadata:
+            metadata = f", *pydbull.codegen.field_metadata({adapter_name}, {field_name!r})"
+        lines.append(f"    {field_name}: typing.Annotated[{annotation}, pydantic.Field({field_kwargs}){metadata}]")
+
+        spec_validators = adapter.get_field_spec(model_field).validators
+        extra_validators = adapter.get_extra_field_validators(model_field, field_info)
+        if not extra_validators and adapter.get_null_value(model_field) is None:
+            continue
+        indexes = tuple(
+            next(i for i, spec_validator in enumerate(spec_validators) if spec_validator is validator)
+            for validator in extra_validators
+        )
+        validator_lines.append(
+            f"    pydbull_{field_name}_field_extra_validators = pydbull.codegen.field_validator("
+            f"{adapter_name}, {field_name!r}, {indexes!r})",
+        )
+
+    lines.append("")
+    lines.extend(validator_lines)
+    lines.append(f"    pydbull_model_extra_validators = pydbull.codegen.model_validator({adapter_name})")
+    lines.append("    if pydbull.settings.tracer is not None:")
+    lines.append(f"        pydbull_trace = pydbull.codegen.trace_validator({adapter_name})")
+    return "\n".join(lines) + "\n"
+
+
+def _render_field_kwargs(
+    field_name: str,
+    field_info: pydantic.fields.FieldInfo,
+    adapter: "pydbull.BaseAdapter",
+    model_field: object | None,
+    adapter_name: str,
+    imports: set[str],
+) -> str:
+    kwargs: list[str] = []
+    if field_info.default is not PydanticUndefined:
+        kwargs.append(f"default={_render_value(field_info.default, imports)}")
+    if field_info.default_factory is not None:
+        if model_field is None or field_info.default_factory is not adapter.get_default_factory(model_field):
+            raise ValueError(f"Can't generate the code for the default factory: {field_info.default_factory!r}")
+        kwargs.append(f"default_factory=pydbull.codegen.default_factory({adapter_name}, {field_name!r})")
+    for argument, getter in _FIELD_CONSTRAINTS:
+        value = getattr(_PYD_ADAPTER, getter)(field_info)
+        if value is not None and value is not PydanticUndefined:
+            kwargs.append(f"{argument}={_render_value(value, imports)}")
+    if field_info.description is not None:
+        # e.g., lazily translated help text
+        kwargs.append(f"description={str(field_info.description)!r}")
+    return ", ".join(kwargs)
+
+
+def _render_value(value: typing.Any, imports: set[str]) -> str:  # noqa: ANN401
+    if value is None or type(value) in {bool, int, float, str, bytes}:
+        return repr(value)
+    if isinstance(value, enum.Enum):
+        return f"{_render_class(type(value), imports)}.{value.name}"
+    if type(value) in {datetime.date, datetime.datetime, datetime.time, datetime.timedelta}:
+        imports.add("datetime")
+        return repr(value)
+    if type(value) in {decimal.Decimal, uuid.UUID}:
+        imports.add(type(value).__module__)
+        return f"{type(value).__module__}.{value!r}"
+    if type(value) in {list, tuple}:
+        items = ", ".join(_render_value(item, imports) for item in value)
+        return f"[{items}]" if type(value) is list else f"({items}{',' if len(value) == 1 else ''})"
+    raise ValueError(f"Can't generate the code for the value: {value!r}")
+
+
+def _render_type(annotation: typing.Any, imports: set[str]) -> str:  # noqa: ANN401
+    if annotation is None or annotation is types.NoneType:
+        return "None"
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in {types.UnionType, typing.Union}:
+        return " | ".join(_render_type(arg, imports) for arg in args)
+    if origin is typing.Literal:
+        return f"typing.Literal[{', '.join(_render_value(arg, imports) for arg in args)}]"
+    if origin is not None:
+        return f"{_render_type(origin, imports)}[{', '.join(_render_type(arg, imports) for arg in args)}]"
+    if isinstance(annotation, type):
+        return _render_class(annotation, imports)
+    raise ValueError(f"Can't generate the code for the type: {annotation!r}")
+
+
+def _render_class(cls: type, imports: set[str]) -> str:
+    if cls.__module__ == builtins.__name__:
+        return cls.__qualname__
+    if "<locals>" in cls.__qualname__:
+        raise ValueError(f"Can't generate the code for `{cls.__qualname__}` defined inside a function.")
+    imports.add(cls.__module__)
+    return f"{cls.__module__}.{cls.__qualname__}"
@@ -0,0 +1,78 @@
+import threading
+import typing
+
+import pydantic
+
+import pydbull
+from pydbull import _utils as utils
+from pydbull import strategy as constraint_strategies
+
+__all__ = [
+    "Collector",
+]
+
+
+class Collector:
+    """
+    Collects the validated models whose checks requiring the database (uniqueness checks, constraints, existence
+    of the instances) are deferred, to run them all at once by `flush()`.
+    The fields are validated right away.
+
+    Usage:
+    ```
+    collector = pydbull.Collector()
+    user = UserModel.model_validate(user_data, context=collector.context)
+    address = AddressModel.model_validate(address_data, context=collector.context)
+    for pyd_model, error in collector.flush():
+        ...
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._pyd_models: list[pydantic.BaseModel] = []
+        self._lock = threading.Lock()
+
+    @property
+    def context(self) -> dict[str, typing.Any]:
+        """
+        Validation context deferring the checks to this collector ("deferred" constraint strategy).
+        """
+        return {
+            constraint_strategies.CONSTRAINT_STRATEGY_CONTEXT_KEY: "deferred",
+            constraint_strategies.DEFERRED_CONTEXT_KEY: self,
+        }
+
+    def append(self, pyd_model: pydantic.BaseModel) -> None:
+        """
+        Defer the checks of the validated model (called by the "deferred" constraint strategy).
+        """
+        with self._lock:
+            self._pyd_models.append(pyd_model)
+
+    def __len__(self) -> int:
+        return len(self._pyd_models)
+
+    def flush(self) -> list[tuple[pydantic.BaseModel, pydantic.ValidationError | None]]:
+        """
+        Run the deferred checks of all the collected models and empty the collector.
+        The models validated against the same data model (e.g., Django model) are checked together,
+        with a single query per check (see `BaseAdapter.run_extra_model_validators_many`).
+        :return: The collected models with their validation error (or None if valid), in the order of collection.
+        """
+        with self._lock:
+            pyd_models, self._pyd_models = self._pyd_models, []
+
+        # (adapter class, data model): indexes of `pyd_models`
+        groups: dict[tuple[type[pydbull.BaseAdapter], type], list[int]] = {}
+        for i, pyd_model in enumerate(pyd_models):
+            adapter = pydbull.get_adapter(pyd_model)
+            groups.setdefault((type(adapter), adapter.model), []).append(i)
+
+        errors: list[pydantic.ValidationError | None] = [None] * len(pyd_models)
+        for indexes in groups.values():
+            adapter = pydbull.get_adapter(pyd_models[indexes[0]])
+            group_errors = adapter.run_extra_model_validators_many([pyd_models[i] for i in indexes])
+            for i, error in zip(indexes, group_errors, strict=True):
+                if error is not None:
+                    errors[i] = utils.with_title(error, type(pyd_models[i]).__name__)
+        return list(zip(pyd_models, errors, strict=True))
@@ -4,3 +4,5 @@ except ImportError as e:
     raise ImportError("Can't use `pydbull.django` module without Django installed in your environment.") from e
 
 from .adapter import *
+from .field_types import *
+from .integrity import *
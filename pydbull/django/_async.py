@@ -0,0 +1,104 @@
+import asyncio
+import typing
+
+import django.core.exceptions
+import django.db.models
+
+from pydbull.django import _batch, _constraints
+
+__all__ = [
+    "avalidate_instance",
+]
+
+ErrorDict = _batch.ErrorDict
+
+
+async def avalidate_instance(
+    instance: django.db.models.Model,
+    predicates: typing.Mapping[str, _constraints.Predicate],
+    concurrency: int,
+) -> ErrorDict:
+    """
+    Async version of `validate_unique()` + `validate_constraints()` using the async ORM.
+    The independent queries run concurrently, at most `concurrency` at once.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    unique_checks, covered_constraints = _batch.batched_unique_checks(instance)
+    plain_unique_checks, date_checks = instance._get_unique_checks()  # noqa: SLF001
+    unique_results = {
+        unique_check: asyncio.ensure_future(_aunique_check(instance, *unique_check, semaphore=semaphore))
+        for unique_check in unique_checks
+    }
+    known = {name: unique_results[unique_check] for name, unique_check in covered_constraints.items()}
+    *results, constraint_errors = await asyncio.gather(
+        *unique_results.values(),
+        *(_adate_check(instance, *date_check, semaphore=semaphore) for date_check in date_checks),
+        _constraints.avalidate_constraints(instance, predicates, known=known, semaphore=semaphore),
+    )
+    unique_errors, date_results = results[: len(unique_results)], results[len(unique_results) :]
+    check_errors = {
+        unique_check: error
+        for unique_check, error in zip(unique_results, unique_errors, strict=True)
+        if error is not None
+    }
+    # In the order of `validate_unique()` + `validate_constraints()`.
+    errors = _batch.unique_errors(check_errors, plain_unique_checks)
+    for result in [*date_results, constraint_errors]:
+        for key, key_errors in result.items():
+            errors.setdefault(key, []).extend(key_errors)
+    return errors
+
+
+async def _aunique_check(
+    instance: django.db.models.Model,
+    model_class: type[django.db.models.Model],
+    unique_check: tuple[str, ...],
+    semaphore: asyncio.Semaphore,
+) -> django.core.exceptions.ValidationError | None:
+    """
+    The same as a single check of `Model._perform_unique_checks()`.
+    """
+    model_fields = [model_class._meta.get_field(field_name) for field_name in unique_check]  # noqa: SLF001
+    key = _batch.lookup_key(instance, model_fields)
+    if key is None:
+        return None
+    queryset = _batch.unique_check_queryset(instance, model_class, model_fields, key)
+    async with semaphore:
+        exists = await queryset.aexists()
+    if not exists:
+        return None
+    return instance.unique_error_message(model_class, unique_check)
+
+
+async def _adate_check(
+    instance: django.db.models.Model,
+    model_class: type[django.db.models.Model],
+    lookup_type: str,
+    field: str,
+    unique_for: str,
+    semaphore: asyncio.Semaphore,
+) -> ErrorDict:
+    """
+    The same as a single check of `Model._perform_date_checks()`.
+    """
+    date = getattr(instance, unique_for)
+    if date is None:
+        return {}
+    if lookup_type == "date":
+        lookup_kwargs = {
+            f"{unique_for}__day": date.day,
+            f"{unique_for}__month": date.month,
+            f"{unique_for}__year": date.year,
+        }
+    else:
+        lookup_kwargs = {f"{unique_for}__{lookup_type}": getattr(date, lookup_type)}
+    lookup_kwargs[field] = getattr(instance, field)
+    queryset = model_class._default_manager.filter(**lookup_kwargs)  # noqa: SLF001
+    # Exclude the current object if we are editing an instance (as opposed to creating a new one).
+    if not instance._state.adding and instance.pk is not None:  # noqa: SLF001
+        queryset = queryset.exclude(pk=instance.pk)
+    async with semaphore:
+        exists = await queryset.aexists()
+    if not exists:
+        return {}
+    return {field: [instance.date_error_message(lookup_type, field, unique_for)]}
@@ -0,0 +1,217 @@
+import functools
+import operator
+import typing
+
+import django.core.exceptions
+import django.db
+import django.db.models
+
+__all__ = [
+    "ErrorDict",
+    "batched_unique_checks",
+    "lookup_key",
+    "perform_unique_checks_many",
+    "pks_by_key",
+    "unique_check_queryset",
+    "unique_errors",
+]
+
+ErrorDict = dict[str, list[django.core.exceptions.ValidationError]]
+UniqueCheck = tuple[type[django.db.models.Model], tuple[str, ...]]
+
+
+def batched_unique_checks(
+    instance: django.db.models.Model,
+) -> tuple[list[UniqueCheck], dict[str, UniqueCheck]]:
+    """
+    Get the unique checks of the model which can be validated for many instances at once
+    (`unique=True` fields, `unique_together` and `UniqueConstraint`s over plain fields),
+    together with the `UniqueConstraint`s covered by them (by name, so they aren't validated twice).
+    """
+    unique_checks, _ = instance._get_unique_checks(include_meta_constraints=True)  # noqa: SLF001
+    covered_constraints: dict[str, UniqueCheck] = {}
+    for model_class, model_constraints in instance.get_constraints():
+        for constraint in model_constraints:
+            if constraint not in model_class._meta.total_unique_constraints:  # noqa: SLF001
+                continue
+            if getattr(constraint, "nulls_distinct", None) is False:
+                # NULLs are considered equal by the constraint, which can't be checked with an `IN` query,
+                # leave it to `validate_constraints`.
+                unique_checks.remove((model_class, constraint.fields))
+            else:
+                covered_constraints[constraint.name] = (model_class, constraint.fields)
+    return unique_checks, covered_constraints
+
+
+def perform_unique_checks_many(
+    instances: typing.Sequence[django.db.models.Model],
+    unique_checks: typing.Sequence[UniqueCheck],
+) -> list[dict[UniqueCheck, django.core.exceptions.ValidationError]]:
+    """
+    Batch version of `Model._perform_unique_checks()`.
+    Runs a single query per unique check for all the `instances` (which must be of the same model), except for
+    the checks of the values compared by the database collation (a query per instance).
+    Instances colliding with each other are also reported (all but the first one), as saving them would fail.
+    Returns the errors of the violated checks of each instance, aligned with `instances`.
+    """
+    errors: list[dict[UniqueCheck, django.core.exceptions.ValidationError]] = [{} for _ in instances]
+    for model_class, unique_check in unique_checks:
+        model_fields = [model_class._meta.get_field(field_name) for field_name in unique_check]  # noqa: SLF001
+        index_to_key: dict[int, tuple] = {}
+        for i, instance in enumerate(instances):
+            key = lookup_key(instance, model_fields)
+            if key is not None:
+                index_to_key[i] = key
+        if not index_to_key:
+            continue
+
+        if _compared_by_collation(model_class, model_fields):
+            # e.g., case-insensitive, the values found can't be matched to the instances in Python.
+            conflicts = {
+                i: unique_check_queryset(instances[i], model_class, model_fields, key).exists()
+                for i, key in index_to_key.items()
+            }
+        else:
+            conflicts = _batch_conflicts(instances, model_class, model_fields, index_to_key)
+
+        seen_keys: set[tuple] = set()
+        for i, key in index_to_key.items():
+            if conflicts[i] or key in seen_keys:
+                errors[i][model_class, unique_check] = instances[i].unique_error_message(model_class, unique_check)
+            seen_keys.add(key)
+    return errors
+
+
+def unique_errors(
+    check_errors: typing.Mapping[UniqueCheck, django.core.exceptions.ValidationError],
+    unique_checks: typing.Iterable[UniqueCheck],
+) -> ErrorDict:
+    """
+    The error dict of the violated `unique_checks` (of `Model._get_unique_checks()`), in the same order
+    as by `Model.validate_unique()`.
+    """
+    errors: ErrorDict = {}
+    for unique_check in unique_checks:
+        if (error := check_errors.get(unique_check)) is not None:
+            field_names = unique_check[1]
+            key = field_names[0] if len(field_names) == 1 else django.core.exceptions.NON_FIELD_ERRORS
+            errors.setdefault(key, []).append(error)
+    return errors
+
+
+def unique_check_queryset(
+    instance: django.db.models.Model,
+    model_class: type[django.db.models.Model],
+    model_fields: typing.Sequence[django.db.models.Field],
+    key: tuple,
+) -> django.db.models.QuerySet:
+    """
+    The rows violating the unique check of the instance, the same as in `Model._perform_unique_checks()`.
+    """
+    queryset = model_class._default_manager.filter(  # noqa: SLF001
+        **{field.name: value for field, value in zip(model_fields, key, strict=True)},
+    )
+    # Exclude the current object if we are editing an instance (as opposed to creating a new one).
+    model_class_pk = instance._get_pk_val(model_class._meta)  # noqa: SLF001
+    if not instance._state.adding and model_class_pk is not None:  # noqa: SLF001
+        queryset = queryset.exclude(pk=model_class_pk)
+    return queryset
+
+
+def pks_by_key(
+    model_class: type[django.db.models.Model],
+    model_fields: typing.Sequence[django.db.models.Field],
+    keys: typing.Collection[tuple],
+) -> dict[tuple, set[typing.Any]]:
+    """
+    Primary keys of the rows by their values of the `model_fields` (see `lookup_key`), by a single query.
+    """
+    key_to_pks: dict[tuple, set[typing.Any]] = {}
+    for row in _unique_check_queryset(model_class, model_fields, keys):
+        pk, *values = row
+        key = tuple(field.to_python(value) for field, value in zip(model_fields, values, strict=True))
+        key_to_pks.setdefault(key, set()).add(pk)
+    return key_to_pks
+
+
+def lookup_key(
+    instance: django.db.models.Model,
+    model_fields: typing.Sequence[django.db.models.Field],
+) -> tuple | None:
+    """
+    Get the values of the unique check fields of the instance, or None if the check should be skipped for it.
+    """
+    key: list[typing.Any] = []
+    for field in model_fields:
+        lookup_value = getattr(instance, field.attname)
+        if lookup_value is None or (
+            lookup_value == "" and django.db.connection.features.interprets_empty_strings_as_nulls
+        ):
+            # no value, skip the lookup
+            return None
+        if field.primary_key and not instance._state.adding:  # noqa: SLF001
+            # no need to check for unique primary key when editing
+            return None
+        key.append(field.to_python(lookup_value))
+    return tuple(key)
+
+
+def _batch_conflicts(
+    instances: typing.Sequence[django.db.models.Model],
+    model_class: type[django.db.models.Model],
+    model_fields: typing.Sequence[django.db.models.Field],
+    index_to_key: typing.Mapping[int, tuple],
+) -> dict[int, bool]:
+    """
+    Whether the key of each instance (by index) is taken by another row, by a single query.
+    """
+    key_to_pks = pks_by_key(model_class, model_fields, set(index_to_key.values()))
+    conflicts: dict[int, bool] = {}
+    for i, key in index_to_key.items():
+        instance = instances[i]
+        conflicting_pks = key_to_pks.get(key, set())
+        # Exclude the current object if we are editing an instance (as opposed to creating a new one).
+        model_class_pk = instance._get_pk_val(model_class._meta)  # noqa: SLF001
+        if not instance._state.adding and model_class_pk is not None:  # noqa: SLF001
+            conflicting_pks = conflicting_pks - {model_class._meta.pk.to_python(model_class_pk)}  # noqa: SLF001
+        conflicts[i] = bool(conflicting_pks)
+    return conflicts
+
+
+def _compared_by_collation(
+    model_class: type[django.db.models.Model],
+    model_fields: typing.Sequence[django.db.models.Field],
+) -> bool:
+    """
+    Whether the database compares some of the string values by a collation (e.g., case-insensitive),
+    unlike the equality of Python: a custom collation of the field, or MySQL (case-insensitive by default).
+    """
+    connection = django.db.connections[django.db.router.db_for_read(model_class)]
+    return any(
+        isinstance(field, django.db.models.CharField | django.db.models.TextField)
+        and (connection.vendor == "mysql" or field.db_collation)
+        for field in model_fields
+    )
+
+
+def _unique_check_queryset(
+    model_class: type[django.db.models.Model],
+    model_fields: typing.Sequence[django.db.models.Field],
+    keys: typing.Collection[tuple],
+) -> django.db.models.QuerySet:
+    queryset = model_class._default_manager.all()  # noqa: SLF001
+    if len(model_fields) == 1:
+        queryset = queryset.filter(**{f"{model_fields[0].name}__in": [key[0] for key in keys]})
+    else:
+        queryset = queryset.filter(
+            functools.reduce(
+                operator.or_,
+                (
+                    django.db.models.Q(
+                        **{field.name: value for field, value in zip(model_fields, key, strict=True)},
+                    )
+                    for key in keys
+                ),
+            ),
+        )
+    return queryset.values_list("pk", *(field.attname for field in model_fields))
@@ -0,0 +1,499 @@
+import asyncio
+import operator
+import typing
+
+import asgiref.sync
+import django.core.exceptions
+import django.db
+import django.db.models
+import django.db.models.constants
+
+__all__ = [
+    "ErrorDict",
+    "Predicate",
+    "add_constraint_error",
+    "avalidate_constraints",
+    "compile_check_constraints",
+    "validate_constraints",
+    "validate_constraints_in_python",
+]
+
+ErrorDict = dict[str, list[django.core.exceptions.ValidationError]]
+# Returns True/False, or None if the result is unknown (SQL NULL), which passes the check constraint just like in SQL.
+Predicate = typing.Callable[[typing.Mapping[str, typing.Any]], bool | None]
+
+
+class _NotCompilable(Exception):
+    """
+    The expression can't be evaluated in Python, the database needs to be queried instead.
+    """
+
+
+def compile_check_constraints(model: type[django.db.models.Model]) -> dict[str, Predicate]:
+    """
+    Compile the conditions of the `CheckConstraint`s of the model (and its parents) into Python predicates,
+    so that they can be validated without a database query.
+    Constraints using expressions that can't be evaluated in Python are left out (validated by the database).
+    :return: Mapping of constraint name to its predicate.
+    """
+    predicates: dict[str, Predicate] = {}
+    for model_class in [model, *model._meta.get_parent_list()]:  # noqa: SLF001
+        fields = _against_fields(model_class)
+        for constraint in model_class._meta.constraints:  # noqa: SLF001
+            if not isinstance(constraint, django.db.models.CheckConstraint):
+                continue
+            condition = constraint.condition if hasattr(constraint, "condition") else constraint.check
+            try:
+                predicates[constraint.name] = _compile_q(django.db.models.Q(condition), fields)
+            except (_NotCompilable, TypeError, ValueError):
+                continue
+    return predicates
+
+
+def validate_constraints(
+    instance: django.db.models.Model,
+    predicates: typing.Mapping[str, Predicate] | None = None,
+    known: typing.Mapping[str, django.core.exceptions.ValidationError | None] | None = None,
+) -> ErrorDict:
+    """
+    The same as `Model.validate_constraints()`, but returns the error dict instead of raising.
+    :param predicates: Compiled `CheckConstraint`s (see `compile_check_constraints`) evaluated in Python
+        instead of querying the database.
+    :param known: Results of the constraints (by name) already validated, e.g., for the whole batch,
+        reported in their place instead of being validated again.
+    """
+    known = known or {}
+    using = django.db.router.db_for_write(type(instance), instance=instance)
+    errors, db_constraints = _validate_in_python(instance, predicates or {}, using)
+    for model_class, constraint in db_constraints:
+        if constraint.name in known:
+            exc = known[constraint.name]
+        else:
+            try:
+                constraint.validate(model_class, instance, using=using)
+            except django.core.exceptions.ValidationError as error:
+                exc = error
+            else:
+                exc = None
+        if exc is not None:
+            errors = add_constraint_error(errors, constraint, exc)
+    return errors
+
+
+def validate_constraints_in_python(
+    instance: django.db.models.Model,
+    predicates: typing.Mapping[str, Predicate],
+    known_fields: typing.Collection[str],
+) -> ErrorDict:
+    """
+    Validate only the `CheckConstraint`s which can be evaluated in Python, without any database query.
+    :param known_fields: Names of the fields set on the instance, the constraints referencing other fields
+        (or which can't be evaluated in Python) are left to the database.
+    """
+    using = django.db.router.db_for_write(type(instance), instance=instance)
+    errors, _ = _validate_in_python(instance, predicates, using, known_fields=known_fields)
+    return errors
+
+
+async def avalidate_constraints(
+    instance: django.db.models.Model,
+    predicates: typing.Mapping[str, Predicate] | None = None,
+    known: typing.Mapping[str, typing.Awaitable[django.core.exceptions.ValidationError | None]] | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> ErrorDict:
+    """
+    Async version of `validate_constraints`.
+    The constraints requiring a database query run concurrently (limited by the `semaphore`).
+    :param known: Results of the constraints (by name) validated elsewhere, awaited in their place.
+    """
+    known = known or {}
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(1)
+    using = django.db.router.db_for_write(type(instance), instance=instance)
+    errors, db_constraints = _validate_in_python(instance, predicates or {}, using)
+
+    async def validate_in_db(
+        model_class: type[django.db.models.Model],
+        constraint: django.db.models.BaseConstraint,
+    ) -> django.core.exceptions.ValidationError | None:
+        if constraint.name in known:
+            return await known[constraint.name]
+        async with semaphore:
+            try:
+                await asgiref.sync.sync_to_async(constraint.validate)(model_class, instance, using=using)
+            except django.core.exceptions.ValidationError as exc:
+                return exc
+        return None
+
+    results = await asyncio.gather(*(validate_in_db(*db_constraint) for db_constraint in db_constraints))
+    for (_, constraint), exc in zip(db_constraints, results, strict=True):
+        if exc is not None:
+            errors = add_constraint_error(errors, constraint, exc)
+    return errors
+
+
+def _validate_in_python(
+    instance: django.db.models.Model,
+    predicates: typing.Mapping[str, Predicate],
+    using: str,
+    known_fields: typing.Collection[str] | None = None,
+) -> tuple[ErrorDict, list[tuple[type[django.db.models.Model], django.db.models.BaseConstraint]]]:
+    """
+    Validate the constraints compiled to Python predicates,
+    return their errors and the constraints left to be validated by the database.
+    :param using: Alias of the database the instance is written to (its string comparisons are matched).
+    :param known_fields: Only these fields can be referenced by the predicates (all by default).
+    """
+    errors: ErrorDict = {}
+    db_constraints: list[tuple[type[django.db.models.Model], django.db.models.BaseConstraint]] = []
+    for model_class, model_constraints in instance.get_constraints():
+        against: _Against | None = None
+        for constraint in model_constraints:
+            if constraint.name not in predicates or not isinstance(constraint, django.db.models.CheckConstraint):
+                db_constraints.append((model_class, constraint))
+                continue
+            if against is None:
+                fields = _against_fields(model_class)
+                if known_fields is not None:
+                    fields = {name: field for name, field in fields.items() if _is_known(name, field, known_fields)}
+                against = _Against(instance, fields, _case_insensitive_lookups(using))
+            try:
+                _validate_check_constraint(constraint, predicates[constraint.name], against)
+            except _NotCompilable:
+                db_constraints.append((model_class, constraint))
+            except django.core.exceptions.ValidationError as exc:
+                errors = add_constraint_error(errors, constraint, exc)
+    return errors, db_constraints
+
+
+def add_constraint_error(
+    errors: ErrorDict,
+    constraint: django.db.models.BaseConstraint,
+    exc: django.core.exceptions.ValidationError,
+) -> ErrorDict:
+    """
+    Add the error of the violated constraint the same way as `Model.validate_constraints()` does.
+    """
+    if getattr(exc, "code", None) == "unique" and len(constraint.fields) == 1:
+        errors.setdefault(constraint.fields[0], []).append(exc)
+        return errors
+    return exc.update_error_dict(errors)
+
+
+def _validate_check_constraint(
+    constraint: django.db.models.CheckConstraint,
+    predicate: Predicate,
+    against: typing.Mapping[str, typing.Any],
+) -> None:
+    try:
+        result = predicate(against)
+    except (TypeError, AttributeError, KeyError, django.core.exceptions.ValidationError) as e:
+        # e.g., comparing incompatible types or referencing an unknown field - let the database decide
+        raise _NotCompilable from e
+    if result is False:
+        raise django.core.exceptions.ValidationError(
+            constraint.get_violation_error_message(),
+            code=constraint.violation_error_code,
+        )
+
+
+def _against_fields(model_class: type[django.db.models.Model]) -> dict[str, django.db.models.Field]:
+    """
+    Fields which can be referenced by the check constraint (the same as `Model._get_field_expression_map()`).
+    """
+    fields = {
+        field.name: field
+        for field in model_class._meta.local_concrete_fields  # noqa: SLF001
+        if not getattr(field, "generated", False)
+    }
+    fields["pk"] = model_class._meta.pk  # noqa: SLF001
+    return fields
+
+
+def _is_known(name: str, field: django.db.models.Field, known_fields: typing.Collection[str]) -> bool:
+    if name == "pk":
+        name = field.name
+    return name in known_fields or field.attname in known_fields
+
+
+def _case_insensitive_lookups(using: str) -> frozenset[str]:
+    """
+    The lookups which are case-sensitive in Python, but not in the database (left to the database).
+    """
+    return _CASE_INSENSITIVE_LOOKUPS.get(django.db.connections[using].vendor, frozenset())
+
+
+class _Against(typing.Mapping[str, typing.Any]):
+    """
+    Lazily evaluated field values of the instance (only the fields referenced by the constraints are converted).
+    """
+
+    def __init__(
+        self,
+        instance: django.db.models.Model,
+        fields: dict[str, django.db.models.Field],
+        case_insensitive_lookups: frozenset[str] = frozenset(),
+    ) -> None:
+        self._instance = instance
+        self._fields = fields
+        self._cache: dict[str, typing.Any] = {}
+        self.case_insensitive_lookups = case_insensitive_lookups
+
+    def __getitem__(self, name: str) -> typing.Any:  # noqa: ANN401
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        field = self._fields[name]
+        value = self._instance.pk if name == "pk" else getattr(self._instance, field.attname)
+        if hasattr(value, "resolve_expression"):
+            raise _NotCompilable(f"Field `{name}` is set to an expression.")
+        self._cache[name] = value = field.to_python(value)
+        return value
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+
+def _compile_q(q: django.db.models.Q, fields: dict[str, django.db.models.Field]) -> Predicate:
+    children: list[Predicate] = []
+    for child in q.children:
+        if isinstance(child, django.db.models.Q):
+            children.append(_compile_q(child, fields))
+        elif isinstance(child, tuple):
+            children.append(_compile_lookup(*child, fields=fields))
+        else:
+            raise _NotCompilable(f"Unsupported expression: {child!r}")
+
+    combine = _CONNECTORS.get(q.connector)
+    if combine is None:
+        raise _NotCompilable(f"Unsupported connector: {q.connector}")
+
+    def predicate(against: typing.Mapping[str, typing.Any]) -> bool | None:
+        return combine([child(against) for child in children])
+
+    if q.negated:
+        return lambda against: None if (result := predicate(against)) is None else not result
+    return predicate
+
+
+def _compile_lookup(
+    key: str,
+    value: typing.Any,  # noqa: ANN401
+    fields: dict[str, django.db.models.Field],
+) -> Predicate:
+    name, lookup = key, "exact"
+    if django.db.models.constants.LOOKUP_SEP in key:
+        name, lookup = key.rsplit(django.db.models.constants.LOOKUP_SEP, 1)
+    if name not in fields or lookup not in _LOOKUPS:
+        # Joins, transforms and other lookups are left to the database.
+        raise _NotCompilable(f"Unsupported lookup: {key}")
+    if lookup in {"in", "range"} and hasattr(value, "resolve_expression"):
+        # e.g., subquery
+        raise _NotCompilable(f"Unsupported expression: {value!r}")
+    field = fields[name]
+
+    if lookup in {"exact", "iexact"} and value is None:
+        # The same as in Django, `exact=None` is interpreted as `isnull=True`
+        lookup, value = "isnull", True
+    if lookup == "isnull":
+        if type(value) is not bool:
+            raise _NotCompilable("The isnull lookup requires a boolean value.")
+        return lambda against: (against[name] is None) is value
+    is_string = isinstance(field, django.db.models.CharField | django.db.models.TextField)
+    if lookup in _STRING_LOOKUPS and not is_string:
+        raise _NotCompilable(f"String lookup `{lookup}` on non-string field `{name}`.")
+    if is_string and lookup in _COLLATION_LOOKUPS:
+        raise _NotCompilable(f"Lookup `{lookup}` on string field `{name}` depends on the database collation.")
+    if is_string and lookup in _CASE_SENSITIVE_LOOKUPS:
+        return _case_sensitive(_compile_value_lookup(name, lookup, value, field, fields), lookup)
+    return _compile_value_lookup(name, lookup, value, field, fields)
+
+
+def _compile_value_lookup(
+    name: str,
+    lookup: str,
+    value: typing.Any,  # noqa: ANN401
+    field: django.db.models.Field,
+    fields: dict[str, django.db.models.Field],
+) -> Predicate:
+    if lookup == "in":
+        # NULLs are ignored by Django in `IN` lookups
+        items = [_compile_value(item, field, fields) for item in value if item is not None]
+        if not all(isinstance(item, _Constant) for item in items):
+            return _null_safe(lambda v, against: v in {item(against) for item in items}, name)
+        try:
+            constants = frozenset(item.value for item in items)
+        except TypeError as e:
+            raise _NotCompilable("Unhashable `in` lookup values.") from e
+        return _null_safe(lambda v, _: v in constants, name)
+    if lookup == "range":
+        low, high = (_compile_value(bound, field, fields) for bound in value)  # raises ValueError if not a pair
+
+        def in_range(v: typing.Any, against: typing.Mapping[str, typing.Any]) -> bool | None:  # noqa: ANN401
+            low_value, high_value = low(against), high(against)
+            if low_value is None or high_value is None:
+                return None
+            return low_value <= v <= high_value
+
+        return _null_safe(in_range, name)
+
+    rhs = _compile_value(value, field, fields)
+    compare = _LOOKUPS[lookup]
+
+    def lookup_predicate(v: typing.Any, against: typing.Mapping[str, typing.Any]) -> bool | None:  # noqa: ANN401
+        rhs_value = rhs(against)
+        if rhs_value is None:
+            return None
+        return compare(v, rhs_value)
+
+    return _null_safe(lookup_predicate, name)
+
+
+class _Constant:
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any) -> None:  # noqa: ANN401
+        self.value = value
+
+    def __call__(self, _: typing.Mapping[str, typing.Any]) -> typing.Any:  # noqa: ANN401
+        return self.value
+
+
+def _compile_value(
+    value: typing.Any,  # noqa: ANN401
+    field: django.db.models.Field,
+    fields: dict[str, django.db.models.Field],
+) -> typing.Callable[[typing.Mapping[str, typing.Any]], typing.Any]:
+    """
+    Compile the right-hand side of a lookup - a constant or a reference to another field with `F()`.
+    """
+    if isinstance(value, django.db.models.F):
+        if value.name not in fields:
+            raise _NotCompilable(f"Unsupported reference: {value.name}")
+        return operator.itemgetter(value.name)
+    if isinstance(value, django.db.models.Value):
+        value = value.value
+    if hasattr(value, "resolve_expression"):
+        raise _NotCompilable(f"Unsupported expression: {value!r}")
+    try:
+        return _Constant(field.to_python(value))
+    except django.core.exceptions.ValidationError as e:
+        raise _NotCompilable(f"Invalid value: {value!r}") from e
+
+
+def _case_sensitive(predicate: Predicate, lookup: str) -> Predicate:
+    """
+    The string comparison is case-sensitive in Python, left to the database if it isn't case-sensitive there
+    (e.g., `LIKE` in SQLite or the default collations of MySQL).
+    """
+
+    def case_sensitive_predicate(against: typing.Mapping[str, typing.Any]) -> bool | None:
+        if lookup in getattr(against, "case_insensitive_lookups", ()):
+            raise _NotCompilable(f"Lookup `{lookup}` isn't case-sensitive in the database.")
+        return predicate(against)
+
+    return case_sensitive_predicate
+
+
+def _null_safe(
+    compare: typing.Callable[[typing.Any, typing.Mapping[str, typing.Any]], bool | None],
+    name: str,
+) -> Predicate:
+    """
+    A comparison with NULL is always unknown in SQL.
+    """
+
+    def predicate(against: typing.Mapping[str, typing.Any]) -> bool | None:
+        value = against[name]
+        if value is None:
+            return None
+        return compare(value, against)
+
+    return predicate
+
+
+def _and(results: list[bool | None]) -> bool | None:
+    if False in results:
+        return False
+    return None if None in results else True
+
+
+def _or(results: list[bool | None]) -> bool | None:
+    if True in results:
+        return True
+    return None if None in results else False
+
+
+def _xor(results: list[bool | None]) -> bool | None:
+    if None in results:
+        return None
+    return results.count(True) % 2 == 1
+
+
+_CONNECTORS: dict[str, typing.Callable[[list[bool | None]], bool | None]] = {
+    django.db.models.Q.AND: _and,
+    django.db.models.Q.OR: _or,
+    getattr(django.db.models.Q, "XOR", "XOR"): _xor,
+}
+
+_STRING_LOOKUPS: set[str] = {
+    "iexact",
+    "contains",
+    "icontains",
+    "startswith",
+    "istartswith",
+    "endswith",
+    "iendswith",
+}
+
+
+def _ascii_only(compare: typing.Callable[[str, str], bool]) -> typing.Callable[[str, str], bool]:
+    """
+    Case-insensitive comparison, left to the database for the non-ASCII strings (e.g., `"ß".upper()` is "SS" in Python,
+    SQLite folds only the ASCII letters).
+    """
+
+    def ascii_compare(a: str, b: str) -> bool:
+        if not (a.isascii() and b.isascii()):
+            raise _NotCompilable("Case-insensitive comparison of non-ASCII strings.")
+        return compare(a, b)
+
+    return ascii_compare
+
+
+_LOOKUPS: dict[str, typing.Callable[[typing.Any, typing.Any], bool] | None] = {
+    "exact": operator.eq,
+    "iexact": _ascii_only(lambda a, b: a.upper() == b.upper()),
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "contains": lambda a, b: b in a,
+    "icontains": _ascii_only(lambda a, b: b.upper() in a.upper()),
+    "startswith": lambda a, b: a.startswith(b),
+    "istartswith": _ascii_only(lambda a, b: a.upper().startswith(b.upper())),
+    "endswith": lambda a, b: a.endswith(b),
+    "iendswith": _ascii_only(lambda a, b: a.upper().endswith(b.upper())),
+    # handled separately
+    "in": None,
+    "range": None,
+    "isnull": None,
+}
+
+# The lookups of the string fields, which compare the strings case-sensitively in Python.
+_CASE_SENSITIVE_LOOKUPS: frozenset[str] = frozenset({"exact", "in", "contains", "startswith", "endswith"})
+
+# The lookups ordering the strings, by the code points in Python, by the collation in the database.
+_COLLATION_LOOKUPS: frozenset[str] = frozenset({"lt", "lte", "gt", "gte", "range"})
+
+# Database vendor: the case-sensitive lookups which aren't case-sensitive in the database.
+_CASE_INSENSITIVE_LOOKUPS: dict[str, frozenset[str]] = {
+    # `LIKE` is case-insensitive (for ASCII).
+    "sqlite": frozenset({"contains", "startswith", "endswith"}),
+    # Depends on the collation, case-insensitive by default.
+    "mysql": _CASE_SENSITIVE_LOOKUPS,
+}
@@ -0,0 +1,499 @@
+"""
+Native (pydantic-core) equivalents of the Django validators, accepting and rejecting exactly the same values,
+so that the validators don't need to run in Python (see `DjangoAdapter.get_extra_field_validators`).
+
+Validators without an exact equivalent (e.g., `EmailValidator` and `URLValidator` accepting internationalized
+domain names) are left to Python.
+"""
+
+import array
+import enum
+import functools
+import re
+import sys
+import types
+import typing
+import unicodedata
+
+import django.core.validators
+import django.db.models
+import django.utils.choices
+import pydantic
+import pydantic_core
+from pydantic_core import core_schema
+
+from pydbull.django import _unicode
+
+__all__ = [
+    "NativeCheck",
+    "NativeChoices",
+    "NativeJSON",
+    "NativeValidators",
+    "compute_unicode_data",
+    "native_checks",
+    "native_choices",
+    "rust_pattern",
+]
+
+# Python escapes of the character classes whose Unicode meaning differs from the Rust regex engine.
+_CLASS_ESCAPES: typing.Final[frozenset[str]] = frozenset("wWdDsS")
+# Characters special inside the Rust character classes, but not inside the Python ones (nested classes, set operations).
+_CLASS_SPECIAL: typing.Final[frozenset[str]] = frozenset("[&~")
+# Escapes of literal characters in Python, but word boundaries in Rust.
+_LITERAL_ESCAPES: typing.Final[frozenset[str]] = frozenset("<>")
+# Python-only quantifier with whitespace, e.g., `{1, 3}` (a literal in Python).
+_SPACED_QUANTIFIER: typing.Final[re.Pattern[str]] = re.compile(r"\{[^}]*\s[^}]*\}")
+
+# Code points which can't be in the Rust patterns (nor in the validated strings)
+_SURROGATES: typing.Final[tuple[int, int]] = (0xD800, 0xDFFF)
+# Code points of the characters processed at once by `compute_unicode_data`
+_UNICODE_CHUNK: typing.Final[int] = 0x10000
+
+_IPV4_OCTET: typing.Final[str] = "(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])"
+_IPV4: typing.Final[str] = rf"(?:{_IPV4_OCTET}\.){{3}}{_IPV4_OCTET}"
+_HEXTET: typing.Final[str] = "[0-9A-Fa-f]{1,4}"
+# Django (`django.utils.ipv6.MAX_IPV6_ADDRESS_LENGTH`) rejects longer IPv6 addresses, which the pattern can't check.
+_MAX_IPV6_LENGTH: typing.Final[int] = 39
+
+
+class NativeCheck(typing.NamedTuple):
+    """
+    Pattern accepting the same strings as the Django validator.
+    """
+
+    validator: typing.Callable[[typing.Any], None]
+    # None if the validator accepts any string
+    pattern: str | None
+    error_type: str
+    message: str
+    # The pattern is equivalent only if the length of the string is limited to this (e.g., by `max_length`)
+    max_length: int | None = None
+
+
+class NativeValidators:
+    """
+    Pydantic metadata of a string field running the native checks in pydantic-core,
+    with the same error type and message as the Django validators.
+    """
+
+    __slots__ = ("checks",)
+
+    def __init__(self, checks: typing.Iterable[NativeCheck]) -> None:
+        self.checks: tuple[NativeCheck, ...] = tuple(checks)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.checks!r})"
+
+    def __get_pydantic_core_schema__(
+        self,
+        source_type: typing.Any,  # noqa: ANN401
+        handler: pydantic.GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        schema = handler(source_type)
+        if not is_str_type(source_type):
+            # e.g., a choices enum, the validators run in Python.
+            return schema
+        checks = [
+            core_schema.custom_error_schema(
+                core_schema.str_schema(pattern=check.pattern),
+                custom_error_type=check.error_type,
+                custom_error_message=check.message,
+            )
+            for check in self.checks
+            if check.pattern is not None
+        ]
+        return _chain_checks(schema, checks) if checks else schema
+
+    def enforces(self, validator: typing.Callable[[typing.Any], None], field: pydantic.fields.FieldInfo) -> bool:
+        """
+        Whether the validator is enforced by the checks on the pydantic field.
+        """
+        if not is_str_type(field.annotation):
+            return False
+        max_length = next((m.max_length for m in field.metadata if hasattr(m, "max_length")), None)
+        return any(
+            check.validator is validator
+            and (check.max_length is None or (max_length is not None and max_length <= check.max_length))
+            for check in self.checks
+        )
+
+
+class NativeChoices:
+    """
+    Pydantic metadata of a field with choices, validating that the value is one of them in pydantic-core
+    (a hash lookup, not a scan of the choices) - the same check as `Field.validate` of Django.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: typing.Iterable[str | int]) -> None:
+        self.values: tuple[str | int, ...] = tuple(values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.values!r})"
+
+    def __get_pydantic_core_schema__(
+        self,
+        source_type: typing.Any,  # noqa: ANN401
+        handler: pydantic.GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        schema = handler(source_type)
+        if _is_choices_type(source_type):
+            # e.g., `typing.Literal` built from the choices by `DjangoAdapter.model_field_to_annotation_type`
+            return schema
+        # Checked after the value is converted to the field type (e.g., "1" to 1).
+        return _chain_checks(
+            schema,
+            [core_schema.literal_schema(list(self.values))],
+            metadata={"pydantic_js_updates": {"enum": list(self.values)}},
+        )
+
+    def enforces(
+        self,
+        validator: typing.Callable[[typing.Any], None],
+        field: pydantic.fields.FieldInfo,  # noqa: ARG002
+    ) -> bool:
+        """
+        Whether the validator is enforced by the choices (e.g., `MaxLengthValidator` longer than all of them).
+        """
+        return type(validator) is django.core.validators.MaxLengthValidator and self.fit_length(validator.limit_value)
+
+    def fit_length(self, max_length: typing.Any) -> bool:  # noqa: ANN401
+        """
+        Whether all the choices are strings not longer than the `max_length`.
+        """
+        return isinstance(max_length, int) and all(
+            isinstance(value, str) and len(value) <= max_length for value in self.values
+        )
+
+    def literal(self) -> typing.Any:  # noqa: ANN401
+        """
+        `typing.Literal` of the choices.
+        """
+        return typing.Literal[self.values]
+
+
+class NativeJSON:
+    """
+    Pydantic metadata of a JSON field, accepting the raw JSON bytes (parsed and validated by pydantic-core
+    in a single pass, the same as `pydantic.Json`) as well as the parsed values.
+    The raw JSON strings are parsed only if the type of the documents doesn't accept strings (e.g., a pydantic model
+    set as `__json_type__`), otherwise a string is a JSON document itself (e.g., `"42"` isn't `42`).
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __get_pydantic_core_schema__(
+        self,
+        source_type: typing.Any,  # noqa: ANN401
+        handler: pydantic.GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        return _accept_json(handler(source_type), parse_str=not _accepts_str(source_type))
+
+
+def is_str_type(annotation: typing.Any) -> bool:  # noqa: ANN401
+    """
+    Whether the annotation is `str` or an optional `str`.
+    """
+    if annotation is str:
+        return True
+    if typing.get_origin(annotation) in {types.UnionType, typing.Union}:
+        return {arg for arg in typing.get_args(annotation) if arg is not types.NoneType} == {str}
+    return False
+
+
+def native_checks(validators: typing.Iterable[typing.Callable[[typing.Any], None]]) -> tuple[NativeCheck, ...]:
+    """
+    Native checks of the validators which have an exact equivalent (other than `RegexValidator`s,
+    see `rust_pattern`).
+    """
+    checks: list[NativeCheck] = []
+    for validator in validators:
+        if type(validator) is django.core.validators.ProhibitNullCharactersValidator:
+            checks.append(
+                NativeCheck(validator, r"\A[^\x00]*\z", validator.code, str(validator.message)),
+            )
+        elif type(validator) is django.core.validators.FileExtensionValidator:
+            if (check := _file_extension_check(validator)) is not None:
+                checks.append(check)
+        elif (check := _ip_address_check(validator)) is not None:
+            checks.append(check)
+    return tuple(checks)
+
+
+def native_choices(field: django.db.models.Field) -> NativeChoices | None:
+    """
+    Choices of the field (flattened, if grouped) validated natively, None if the field has no choices,
+    they're evaluated lazily (callable), or their values aren't strings or integers.
+    Blank fields also accept the empty string, like in Django.
+    """
+    if field.choices is None or isinstance(field.choices, django.utils.choices.CallableChoiceIterator):
+        return None
+    values: list[str | int] = [value for value, _ in field.flatchoices if value is not None]
+    if not values or not all(isinstance(value, str | int) for value in values):
+        return None
+    if field.blank and "" not in values and all(isinstance(value, str) for value in values):
+        values.append("")
+    return NativeChoices(dict.fromkeys(values))
+
+
+def rust_pattern(regex: re.Pattern[str]) -> str | None:
+    r"""
+    Translate the Python regular expression to a pattern matching the same strings in pydantic-core
+    (the Rust regex engine), e.g., `\Z` to `\z` and `\w` to the exact characters Python matches by it.
+    `$` keeps the meaning of the end of the string (Python also matches before a trailing newline).
+    :return: The pattern, or None if it can't be translated (e.g., flags, look-around, word boundaries).
+    """
+    if not isinstance(regex.pattern, str) or regex.flags != re.UNICODE:
+        return None
+    return _translate(regex.pattern)
+
+
+@functools.cache
+def _translate(pattern: str) -> str | None:
+    if _SPACED_QUANTIFIER.search(pattern):
+        return None
+    translated: list[str] = []
+    # Index of the first character of the current character class, None outside of a class
+    class_start: int | None = None
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        i += 1
+        if char == "\\":
+            item = _translate_escape(pattern[i : i + 1], in_class=class_start is not None)
+            i += 1
+        elif class_start is not None:
+            item = _translate_class_char(pattern, i - 1, class_start)
+            if item == "]":
+                class_start = None
+        elif char == "[":
+            item = "[^" if pattern.startswith("^", i) else "["
+            i += len(item) - 1
+            class_start = i
+        elif char == "(" and pattern.startswith("?", i) and not pattern.startswith(("?:", "?P<"), i):
+            # Inline flags, look-around, comments, ...
+            return None
+        else:
+            item = char
+        if item is None:
+            return None
+        translated.append(item)
+
+    rust = "".join(translated)
+    try:
+        pydantic_core.SchemaValidator(core_schema.str_schema(pattern=rust))
+    except pydantic_core.SchemaError:
+        # Not supported by the Rust regex engine (e.g., backreferences) or invalid (e.g., unterminated class)
+        return None
+    return rust
+
+
+def _translate_escape(escape: str, *, in_class: bool) -> str | None:
+    if not escape:
+        return None
+    if escape in _CLASS_ESCAPES:
+        items = _class_items(escape)
+        return items if in_class else f"[{items}]"
+    if escape == "Z" and not in_class:
+        return r"\z"
+    if escape in _LITERAL_ESCAPES:
+        return escape
+    if escape.isalnum() and escape not in "AnrtfvxuU0123456789":
+        # Word boundaries, Python-only escapes, ...
+        return None
+    return f"\\{escape}"
+
+
+def _translate_class_char(pattern: str, i: int, class_start: int) -> str:
+    char = pattern[i]
+    if char == "]" and i > class_start:
+        return char
+    if char in _CLASS_SPECIAL or (char == "-" and pattern.startswith("-", i + 1)):
+        return f"\\{char}"
+    if char == "]":
+        # Literal at the start of the class
+        return r"\]"
+    return char
+
+
+@functools.cache
+def _class_items(escape: str) -> str:
+    """
+    Items of a Rust character class matching exactly the characters Python matches by the class escape
+    (the Unicode definitions and versions of the engines differ).
+    """
+    ranges: list[str] = []
+    for first, last in _class_ranges(escape):
+        start, end = first, last
+        if _SURROGATES[0] <= start <= _SURROGATES[1]:
+            start = _SURROGATES[1] + 1
+        if _SURROGATES[0] <= end <= _SURROGATES[1]:
+            end = _SURROGATES[0] - 1
+        if start < end:
+            ranges.append(f"\\x{{{start:X}}}-\\x{{{end:X}}}")
+        elif start == end:
+            ranges.append(f"\\x{{{start:X}}}")
+    return "".join(ranges)
+
+
+def _class_ranges(escape: str) -> list[tuple[int, int]]:
+    """
+    Ranges of the code points (the first and the last one) Python matches by the class escape.
+    """
+    if escape.isupper():
+        # The complement of the lowercase class.
+        ranges: list[tuple[int, int]] = []
+        next_start = 0
+        for start, end in _unicode_data()[0][escape.lower()]:
+            if start > next_start:
+                ranges.append((next_start, start - 1))
+            next_start = end + 1
+        if next_start <= sys.maxunicode:
+            ranges.append((next_start, sys.maxunicode))
+        return ranges
+    return _unicode_data()[0][escape]
+
+
+@functools.cache
+def _unicode_data() -> tuple[dict[str, list[tuple[int, int]]], tuple[str, ...]]:
+    """
+    Ranges of the code points matched by the lowercase class escapes and the non-ASCII characters lowercasing
+    to ASCII, precomputed for the Unicode version of Python (see `pydbull.django._unicode`).
+    """
+    if unicodedata.unidata_version != _unicode.UNIDATA_VERSION:
+        return compute_unicode_data()
+    class_ranges = {
+        escape: [
+            (int(start, 16), int(end or start, 16)) for start, _, end in (item.partition("-") for item in table.split())
+        ]
+        for escape, table in _unicode.CLASS_RANGES.items()
+    }
+    return class_ranges, _unicode.NON_ASCII_LOWERCASING_TO_ASCII
+
+
+def compute_unicode_data() -> tuple[dict[str, list[tuple[int, int]]], tuple[str, ...]]:
+    """
+    Compute `_unicode_data()` from all the characters (in chunks, so that they aren't all in memory at once).
+    """
+    class_ranges: dict[str, list[tuple[int, int]]] = {escape: [] for escape in "wds"}
+    lowercasing: list[str] = []
+    for chunk_start in range(0, sys.maxunicode + 1, _UNICODE_CHUNK):
+        chunk_end = min(chunk_start + _UNICODE_CHUNK, sys.maxunicode + 1)
+        # The index of each character is its code point (offset by the chunk start).
+        chunk = array.array("I", range(chunk_start, chunk_end)).tobytes().decode("utf-32-le", "surrogatepass")
+        for escape, ranges in class_ranges.items():
+            for match in re.finditer(f"\\{escape}+", chunk):
+                start, end = chunk_start + match.start(), chunk_start + match.end() - 1
+                if ranges and ranges[-1][1] == start - 1:
+                    # Continues over the chunks.
+                    start = ranges.pop()[0]
+                ranges.append((start, end))
+        # Only the characters case-insensitively matching the ASCII letters can lowercase to them.
+        lowercasing.extend(
+            c for c in re.findall("[a-z]", chunk, re.IGNORECASE) if not c.isascii() and c.lower().isascii()
+        )
+    return class_ranges, tuple(lowercasing)
+
+
+def _file_extension_check(validator: django.core.validators.FileExtensionValidator) -> NativeCheck | None:
+    """
+    The same as `Path(name).suffix[1:].lower() in allowed_extensions` on the file name.
+    """
+    allowed: list[str] | None = validator.allowed_extensions
+    message = f"File extension is not allowed. Allowed extensions are: {', '.join(allowed or [])}."
+    if allowed is None:
+        return NativeCheck(validator, None, validator.code, message)
+    if not allowed or not all(ext and ext.isascii() and "." not in ext and "/" not in ext for ext in allowed):
+        # e.g., the files without an extension allowed by "" - left to Python.
+        return None
+    extensions = "|".join("".join(_lowercases_to(char) for char in ext) for ext in allowed)
+    # The last path component (without trailing slashes and "." components) with at least one character
+    # before the last dot.
+    pattern = rf"(?:\A|/)[^/]+\.(?:{extensions})(?:/+\.)*/*\z"
+    return NativeCheck(validator, pattern, validator.code, message)
+
+
+def _lowercases_to(char: str) -> str:
+    """
+    Rust pattern matching the characters whose `lower()` is the ASCII character (e.g., "K" and the Kelvin sign
+    for "k").
+    """
+    chars = [c for c in {char, char.upper(), *_non_ascii_lowercasing_to_ascii()} if c.lower() == char]
+    return f"[{''.join(re.escape(c) if c.isascii() else f'\\x{{{ord(c):X}}}' for c in sorted(chars))}]"
+
+
+def _non_ascii_lowercasing_to_ascii() -> tuple[str, ...]:
+    return _unicode_data()[1]
+
+
+def _ip_address_check(validator: typing.Callable[[typing.Any], None]) -> NativeCheck | None:
+    if validator is django.core.validators.validate_ipv4_address:
+        pattern, protocol, max_length = rf"\A{_IPV4}\z", "IPv4", None
+    elif validator is django.core.validators.validate_ipv6_address:
+        pattern, protocol, max_length = rf"\A{_ipv6()}\z", "IPv6", _MAX_IPV6_LENGTH
+    elif validator is django.core.validators.validate_ipv46_address:
+        pattern, protocol, max_length = rf"\A(?:{_IPV4}|{_ipv6()})\z", "IPv4 or IPv6", _MAX_IPV6_LENGTH
+    else:
+        return None
+    return NativeCheck(validator, pattern, "invalid", f"Enter a valid {protocol} address.", max_length)
+
+
+@functools.cache
+def _ipv6() -> str:
+    """
+    IPv6 address as accepted by `ipaddress.IPv6Address` (optionally with an embedded IPv4 address and a scope).
+    """
+
+    def hextets(count: int) -> str:
+        return f"{_HEXTET}(?::{_HEXTET}){{{count - 1}}}" if count else ""
+
+    alternatives: list[str] = [f"(?:{_HEXTET}:){{7}}{_HEXTET}", f"(?:{_HEXTET}:){{6}}{_IPV4}"]
+    # "::" replaces at least one hextet, the embedded IPv4 address takes two.
+    for left in range(8):
+        alternatives.extend(f"{hextets(left)}::{hextets(right)}" for right in range(8 - left))
+        alternatives.extend(f"{hextets(left)}::(?:{_HEXTET}:){{{right}}}{_IPV4}" for right in range(6 - left))
+    return f"(?:{'|'.join(alternatives)})(?:%[^%/]+)?"
+
+
+def _accept_json(schema: core_schema.CoreSchema, *, parse_str: bool) -> core_schema.CoreSchema:
+    if schema["type"] == "nullable":
+        return {**schema, "schema": _accept_json(schema["schema"], parse_str=parse_str)}
+    if parse_str:
+        # The raw JSON first, so that the strings are parsed (the documents can't be strings).
+        return core_schema.union_schema([core_schema.json_schema(schema), schema], mode="left_to_right")
+    # Only the bytes are the raw JSON (those can't be in the JSON input).
+    raw_json = core_schema.chain_schema(
+        [core_schema.is_instance_schema((bytes, bytearray)), core_schema.json_schema(schema)],
+    )
+    return core_schema.json_or_python_schema(
+        json_schema=schema,
+        python_schema=core_schema.union_schema([raw_json, schema], mode="left_to_right"),
+    )
+
+
+def _accepts_str(annotation: typing.Any) -> bool:  # noqa: ANN401
+    if typing.get_origin(annotation) in {types.UnionType, typing.Union}:
+        return any(_accepts_str(arg) for arg in typing.get_args(annotation))
+    return annotation is typing.Any or annotation is str
+
+
+def _is_choices_type(annotation: typing.Any) -> bool:  # noqa: ANN401
+    if typing.get_origin(annotation) in {types.UnionType, typing.Union}:
+        return any(_is_choices_type(arg) for arg in typing.get_args(annotation) if arg is not types.NoneType)
+    return typing.get_origin(annotation) is typing.Literal or (
+        isinstance(annotation, type) and issubclass(annotation, enum.Enum)
+    )
+
+
+def _chain_checks(
+    schema: core_schema.CoreSchema,
+    checks: list[core_schema.CoreSchema],
+    metadata: dict[str, typing.Any] | None = None,
+) -> core_schema.CoreSchema:
+    if schema["type"] == "nullable":
+        return {**schema, "schema": _chain_checks(schema["schema"], checks, metadata)}
+    return core_schema.chain_schema([schema, *checks], metadata=metadata)
@@ -0,0 +1,92 @@
+import contextlib
+import contextvars
+import typing
+
+import pydantic
+
+__all__ = [
+    "NestedBuild",
+    "nested_build",
+]
+
+
+class NestedBuild:
+    """
+    Pydantic models built during a single (outermost) `DjangoAdapter.model_to_pydantic` call, including the models
+    of the nested relations, so that each of them is built only once per call (even with `pydbull.model_cache`
+    disabled).
+    The models referenced while they're still being built (cycles of the relations) are referenced by forward
+    references, resolved when the outermost model is built.
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[typing.Hashable, type[pydantic.BaseModel]] = {}
+        # Name of the forward reference of the models being built
+        self._pending: dict[typing.Hashable, str] = {}
+        # Forward reference names of the built models
+        self._namespace: dict[str, type[pydantic.BaseModel]] = {}
+
+    def get(self, key: typing.Hashable) -> type[pydantic.BaseModel] | None:
+        """
+        The model built under the `key`, None if it isn't built yet.
+        """
+        return self._models.get(key)
+
+    def reference(self, key: typing.Hashable) -> typing.ForwardRef | None:
+        """
+        Forward reference to the model being built under the `key`, None if it isn't being built.
+        """
+        ref_name = self._pending.get(key)
+        return None if ref_name is None else typing.ForwardRef(ref_name)
+
+    def start(self, key: typing.Hashable) -> None:
+        self._pending[key] = f"_pydbull_nested_{len(self._pending)}"
+
+    def finish(self, key: typing.Hashable, pyd_model: type[pydantic.BaseModel]) -> None:
+        self._models[key] = pyd_model
+        self._namespace[self._pending[key]] = pyd_model
+
+    def resolve(self) -> None:
+        """
+        Resolve the forward references of the built models.
+        """
+        incomplete: list[type[pydantic.BaseModel]] = [
+            pyd_model for pyd_model in self._models.values() if not pyd_model.__pydantic_complete__
+        ]
+        # The models referencing other incomplete models are completed once those are.
+        while incomplete:
+            for pyd_model in incomplete:
+                pyd_model.model_rebuild(_types_namespace=self._namespace, raise_errors=False)
+            still_incomplete = [pyd_model for pyd_model in incomplete if not pyd_model.__pydantic_complete__]
+            if len(still_incomplete) == len(incomplete):
+                # Raises the error of the unresolvable reference.
+                still_incomplete[0].model_rebuild(_types_namespace=self._namespace)
+            incomplete = still_incomplete
+
+
+_current_build: contextvars.ContextVar[NestedBuild | None] = contextvars.ContextVar(
+    "pydbull_nested_build",
+    default=None,
+)
+
+
+def current_build() -> NestedBuild | None:
+    return _current_build.get()
+
+
+@contextlib.contextmanager
+def nested_build() -> typing.Iterator[NestedBuild]:
+    """
+    The build of the outermost `model_to_pydantic` call, started (and resolved at the end) if there's none.
+    """
+    build = _current_build.get()
+    if build is not None:
+        yield build
+        return
+    build = NestedBuild()
+    token = _current_build.set(build)
+    try:
+        yield build
+        build.resolve()
+    finally:
+        _current_build.reset(token)
@@ -1,12 +1,14 @@
-import importlib.util
+import contextlib
+import functools
+import hashlib
 import types
 import typing
-from datetime import date, datetime, time, timedelta
-from decimal import Decimal
 
 import annotated_types
+import django
 import django.core.exceptions
 import django.core.validators
+import django.db
 import django.db.models
 import django.db.models.options
 import pydantic.fields
@@ -15,6 +17,8 @@ from pydantic_core import PydanticUndefined, PydanticUndefinedType
 
 import pydbull
 from pydbull import _utils as utils
+from pydbull import cache, generated, tracing
+from pydbull.django import _async, _batch, _constraints, _native, _nested, field_types
 
 __all__ = [
     "DjangoAdapter",
@@ -24,110 +28,139 @@ FieldT = django.db.models.Field
 
 
 class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT]):
+    def __init__(self, model: type[ModelT]) -> None:
+        super().__init__(model)
+        # `CheckConstraint`s evaluated in Python instead of querying the database on every validation.
+        self.check_constraint_predicates: dict[str, _constraints.Predicate] = (
+            _constraints.compile_check_constraints(model) if hasattr(model, "_meta") else {}
+        )
+
     @typing.override
-    def get_default(self, field: FieldT) -> typing.Any:
+    def build_field_spec(self, field: FieldT) -> pydbull.FieldSpec:
+        """
+        Extract all the validation information of the field in a single pass over its validators.
+        """
+        # The first validator of each kind, the others are validated only by Django.
+        kind_to_validator: dict[type, typing.Callable[[typing.Any], None]] = {}
+        validators: tuple[typing.Callable[[typing.Any], None], ...] = tuple(field.validators)
+        for validator in validators:
+            for validator_kind in _SPEC_VALIDATOR_KINDS:
+                if validator_kind not in kind_to_validator and isinstance(validator, validator_kind):
+                    kind_to_validator[validator_kind] = validator
+
+        default, default_factory = self._field_default(field)
+        metadata = _native_metadata(field, validators)
+
+        max_length: int | None = field.max_length
+        if any(isinstance(item, _native.NativeChoices) and item.fit_length(max_length) for item in metadata):
+            # Implied by the choices, would be validated in Python on a `typing.Literal`.
+            max_length = None
+
+        min_length: int | None = None
+        if min_length_validator := kind_to_validator.get(django.core.validators.MinLengthValidator):
+            min_length = min_length_validator.limit_value
+        elif isinstance(field, _array_field_types()) and self._field_is_required(field):
+            min_length = 1
+
+        multiple_of: annotated_types.SupportsDiv | annotated_types.SupportsMod | PydanticUndefinedType = (
+            PydanticUndefined
+        )
+        step_validator = kind_to_validator.get(django.core.validators.StepValueValidator)
+        # pydantic doesn't support offset
+        if step_validator and step_validator.offset in [0, None]:
+            multiple_of = step_validator.limit_value
+
+        is_decimal = isinstance(field, django.db.models.DecimalField)
+        spec: dict[str, typing.Any] = {
+            "default": default,
+            "default_factory": default_factory,
+            "max_length": max_length,
+            "min_length": min_length,
+            "pattern": _native_pattern(kind_to_validator.get(django.core.validators.RegexValidator)),
+            # gt and lt are not supported by django model
+            "ge": _limit_value(kind_to_validator.get(django.core.validators.MinValueValidator)),
+            "le": _limit_value(kind_to_validator.get(django.core.validators.MaxValueValidator)),
+            "multiple_of": multiple_of,
+            "max_digits": field.max_digits if is_decimal and field.max_digits is not None else PydanticUndefined,
+            "decimal_places": (
+                field.decimal_places if is_decimal and field.decimal_places is not None else PydanticUndefined
+            ),
+            "description": field.help_text,
+            "validators": validators,
+            "metadata": metadata,
+        }
+        # Native constraints of the custom fields (see `FieldTypeRegistry.register`).
+        if field_type := field_types.field_type_registry.get(type(field)):
+            spec.update(field_type.get_constraints(field))
+        return pydbull.FieldSpec(**spec)
+
+    def _field_default(
+        self,
+        field: FieldT,
+    ) -> tuple[typing.Any, typing.Callable[[], typing.Any] | PydanticUndefinedType]:
+        """
+        Default value and default factory of the field.
+        """
         if field.default == django.db.models.fields.NOT_PROVIDED and self._field_is_required(field):
-            return PydanticUndefined
+            return PydanticUndefined, PydanticUndefined
         if type(field.default) is types.FunctionType:
-            # if callable, use `get_default_factory`
-            return PydanticUndefined
-        return field.get_default()
+            return PydanticUndefined, field.get_default
+        return field.get_default(), PydanticUndefined
+
+    @typing.override
+    def get_default(self, field: FieldT) -> typing.Any:
+        return self.get_field_spec(field).default
 
     @typing.override
     def get_default_factory(self, field: FieldT) -> typing.Callable[[], typing.Any] | PydanticUndefinedType | None:
-        if field.default == django.db.models.fields.NOT_PROVIDED and self._field_is_required(field):
-            return PydanticUndefined
-        if type(field.default) is not types.FunctionType:
-            # if not callable, use `get_default`
-            return PydanticUndefined
-        return field.get_default
+        return self.get_field_spec(field).default_factory
 
     @typing.override
     def get_max_length(self, field: FieldT) -> int | None:
-        return field.max_length
+        return self.get_field_spec(field).max_length
 
     @typing.override
     def get_min_length(self, field: FieldT) -> int | None:
-        validator = self._get_validator(django.core.validators.MinLengthValidator, field)
-        if validator:
-            return validator.limit_value
-
-        array_fields = django.db.models.ManyToManyField
-        try:
-            from django.contrib.postgres.fields import ArrayField
-
-            array_fields |= ArrayField
-        except ImportError:
-            pass
-
-        if isinstance(field, array_fields) and self._field_is_required(field):
-            return 1
-        return None
+        return self.get_field_spec(field).min_length
 
     @typing.override
     def get_pattern(self, field: FieldT) -> str | PydanticUndefinedType | None:
-        validator = self._get_validator(django.core.validators.RegexValidator, field)
-        skip_validators: set[type] = {
-            # Skip URLValidator because the regex is too complex for pydantic to handle.
-            # The validation is therefore done only in Django (see `run_extra_field_validators`).
-            django.core.validators.URLValidator,
-        }
-        if validator and type(validator) not in skip_validators:
-            return validator.regex.pattern
-        return None
+        return self.get_field_spec(field).pattern
 
     @typing.override
     def get_greater_than(self, field: FieldT) -> PydanticUndefinedType:
-        # not supported by django model
-        return PydanticUndefined
+        return self.get_field_spec(field).gt
 
     @typing.override
     def get_greater_than_or_equal(self, field: FieldT) -> annotated_types.SupportsGt | PydanticUndefinedType:
-        validator = self._get_validator(django.core.validators.MinValueValidator, field)
-        if validator:
-            return validator.limit_value
-        return PydanticUndefined
+        return self.get_field_spec(field).ge
 
     @typing.override
     def get_less_than(self, field: FieldT) -> PydanticUndefinedType:
-        # not supported by django model
-        return PydanticUndefined
+        return self.get_field_spec(field).lt
 
     @typing.override
     def get_less_than_or_equal(self, field: FieldT) -> annotated_types.SupportsLt | PydanticUndefinedType:
-        validator = self._get_validator(django.core.validators.MaxValueValidator, field)
-        if validator:
-            return validator.limit_value
-        return PydanticUndefined
+        return self.get_field_spec(field).le
 
     @typing.override
     def get_multiple_of(
         self,
         field: FieldT,
     ) -> annotated_types.SupportsDiv | annotated_types.SupportsMod | PydanticUndefinedType:
-        validator = self._get_validator(django.core.validators.StepValueValidator, field)
-        if not validator:
-            return PydanticUndefined
-        if validator.offset not in [0, None]:
-            # pydantic doesn't support offset
-            return PydanticUndefined
-        return validator.limit_value
+        return self.get_field_spec(field).multiple_of
 
     @typing.override
     def get_description(self, field: FieldT) -> str | None:
-        return field.help_text
+        return self.get_field_spec(field).description
 
     @typing.override
     def get_decimal_max_digits(self, field: FieldT) -> int | PydanticUndefinedType:
-        if isinstance(field, django.db.models.DecimalField):
-            return field.max_digits if field.max_digits is not None else PydanticUndefined
-        return PydanticUndefined
+        return self.get_field_spec(field).max_digits
 
     @typing.override
     def get_decimal_places(self, field: FieldT) -> int | PydanticUndefinedType:
-        if isinstance(field, django.db.models.DecimalField):
-            return field.decimal_places if field.decimal_places is not None else PydanticUndefined
-        return PydanticUndefined
+        return self.get_field_spec(field).decimal_places
 
     # TODO remove from here, add in vercajk as an extension
     @typing.override
@@ -143,7 +176,37 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
             )
 
     @typing.override
-    def run_extra_field_validators(self, field: FieldT, value: typing.Any) -> typing.Any:
+    def get_extra_field_validators(
+        self,
+        field: FieldT,
+        validator_field: pydantic.fields.FieldInfo,
+    ) -> tuple[typing.Callable[[typing.Any], None], ...]:
+        """
+        Skip the Django validators which are already enforced by pydantic field constraints
+        (e.g., `MaxLengthValidator` by `max_length`, or the `enforced_validators` of the field type registered
+        in `field_type_registry` if the field still has its constraints), so that they don't need to run
+        in Python again.
+        """
+        field_type = field_types.field_type_registry.get(type(field))
+        if field_type is not None and not _has_constraints(validator_field, field_type.get_constraints(field)):
+            # Overridden (e.g., by the field of `@model_validator`), the registered validators aren't enforced.
+            field_type = None
+        return tuple(
+            validator
+            for validator in self.get_field_spec(field).validators
+            if not (
+                _is_enforced_by_pydantic(validator, validator_field)
+                or (field_type is not None and field_type.enforces(validator))
+            )
+        )
+
+    @typing.override
+    def run_extra_field_validators(
+        self,
+        field: FieldT,
+        value: typing.Any,
+        validators: typing.Sequence[typing.Callable[[typing.Any], None]] | None = None,
+    ) -> typing.Any:
         """
         Run a django validator on a value.
         Why not just call the validator?
@@ -152,14 +215,13 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
         This allows pydantic validators to modify the value, but is incompatible with django validators
         which only check the value, raise an exception if it's invalid and return None.
         """
-        if value is None and isinstance(field, django.db.models.CharField) and not field.null:
-            # Automatically convert Null value to empty string if the field is non-nullable CharField.
-            value = ""
+        if value is None:
+            value = self.get_null_value(field)
         if value in django.core.validators.EMPTY_VALUES:
             return value
 
         errors: list[django.core.exceptions.ValidationError] = []
-        for validator in field.validators:
+        for validator in self.get_field_spec(field).validators if validators is None else validators:
             try:
                 validator(value)
             except django.core.exceptions.ValidationError as django_exc:
@@ -172,13 +234,68 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
             raise self.convert_to_pydantic_exception(django.core.exceptions.ValidationError(errors))
         return value
 
+    @typing.override
+    def build_extra_field_validator(
+        self,
+        field: FieldT,
+        validators: typing.Sequence[typing.Callable[[typing.Any], None]],
+    ) -> typing.Callable[[typing.Any], typing.Any]:
+        """
+        The same as `run_extra_field_validators`, but everything not depending on the value (error codes,
+        whether to convert null to an empty string) is resolved only once, when building the validator.
+        """
+        null_value: typing.Literal[""] | None = self.get_null_value(field)
+        if not validators:
+            return functools.partial(_convert_null, null_value)
+
+        validators_with_codes: tuple[tuple[typing.Callable[[typing.Any], None], str | None], ...] = tuple(
+            (validator, self._validator_to_pydantic_error_code(type(validator))) for validator in validators
+        )
+        empty_values: tuple[typing.Any, ...] = tuple(django.core.validators.EMPTY_VALUES)
+        convert_to_pydantic_exception = self.convert_to_pydantic_exception
+
+        def run_extra_field_validators(value: typing.Any) -> typing.Any:  # noqa: ANN401
+            if value is None:
+                return null_value
+            if not value and value in empty_values:
+                return value
+
+            errors: list[django.core.exceptions.ValidationError] | None = None
+            for validator, pyd_error_code in validators_with_codes:
+                try:
+                    validator(value)
+                except django.core.exceptions.ValidationError as django_exc:
+                    if pyd_error_code is not None:
+                        django_exc.code = pyd_error_code
+                    if errors is None:
+                        errors = []
+                    errors.append(django_exc)
+
+            if errors:
+                raise convert_to_pydantic_exception(django.core.exceptions.ValidationError(errors))
+            return value
+
+        return run_extra_field_validators
+
+    @typing.override
+    def get_null_value(self, field: FieldT) -> typing.Literal[""] | None:
+        """
+        Automatically convert Null value to empty string if the field is non-nullable CharField.
+        """
+        return "" if isinstance(field, django.db.models.CharField) and not field.null else None
+
     @staticmethod
     @typing.override
     def run_extra_model_validators[T: "pydantic.BaseModel"](
         pyd_model: T,
         context: pydantic.ValidationInfo,
     ) -> T:
-        instance: ModelT = pydbull.get_adapter(pyd_model).get_model_instance(pyd_model)
+        adapter: DjangoAdapter = pydbull.get_adapter(pyd_model)
+        try:
+            with tracing.phase("get_model_instance"):
+                instance: ModelT = adapter.get_model_instance(pyd_model)
+        except adapter.model.DoesNotExist:
+            raise adapter._does_not_exist_error(getattr(pyd_model, adapter.model._meta.pk.name)) from None  # noqa: SLF001
         if not instance:
             return pyd_model
 
@@ -187,27 +304,128 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
             instance._state.adding = False  # noqa: SLF001
 
         errors: dict[typing.LiteralString, list[django.core.exceptions.ValidationError]] = {}
+        with tracing.phase("validate_unique"):
+            try:
+                instance.validate_unique()
+            except django.core.exceptions.ValidationError as exc:
+                errors = exc.update_error_dict(errors)
+        with tracing.phase("validate_constraints"):
+            constraint_errors = _constraints.validate_constraints(
+                instance,
+                predicates=adapter.check_constraint_predicates,
+            )
+        for key, key_errors in constraint_errors.items():
+            errors.setdefault(key, []).extend(key_errors)
+        if errors:
+            with tracing.phase("error_conversion"):
+                validation_error = adapter.convert_to_pydantic_exception(django.core.exceptions.ValidationError(errors))
+            raise validation_error
+        return pyd_model
+
+    @typing.override
+    def run_python_model_validators[T: "pydantic.BaseModel"](self, pyd_model: T) -> T:
+        """
+        Validate the `CheckConstraint`s compiled to Python predicates (the instance isn't loaded from the database,
+        so only the constraints over the fields of `pyd_model` are validated).
+        """
+        instance = self._build_model_instance(pyd_model)
+        errors = _constraints.validate_constraints_in_python(
+            instance,
+            self.check_constraint_predicates,
+            known_fields=pyd_model.__pydantic_fields__.keys(),
+        )
+        if errors:
+            raise self.convert_to_pydantic_exception(django.core.exceptions.ValidationError(errors))
+        return pyd_model
+
+    @typing.override
+    async def arun_extra_model_validators[T: "pydantic.BaseModel"](
+        self,
+        pyd_model: T,
+        context: dict[str, typing.Any] | None = None,
+        concurrency: int | None = None,
+    ) -> T:
+        """
+        The same as `run_extra_model_validators`, but the queries run through the async ORM (`aget`, `aexists`),
+        the independent ones concurrently.
+        """
         try:
-            instance.validate_unique()
-        except django.core.exceptions.ValidationError as exc:
-            errors = exc.update_error_dict(errors)
-        try:
-            instance.validate_constraints()
-        except django.core.exceptions.ValidationError as exc:
-            errors = exc.update_error_dict(errors)
+            instance: ModelT = await self.aget_model_instance(pyd_model)
+        except self.model.DoesNotExist:
+            raise self._does_not_exist_error(getattr(pyd_model, self.model._meta.pk.name)) from None  # noqa: SLF001
+        if not instance:
+            return pyd_model
+
+        if instance.pk:
+            # ensures that unique=True fields are not checked against the instance itself
+            instance._state.adding = False  # noqa: SLF001
+
+        errors = await _async.avalidate_instance(
+            instance,
+            self.check_constraint_predicates,
+            concurrency=concurrency if concurrency is not None else pydbull.settings.async_concurrency,
+        )
         if errors:
-            raise pydbull.get_adapter(pyd_model).convert_to_pydantic_exception(
-                django.core.exceptions.ValidationError(errors),
-            )
+            raise self.convert_to_pydantic_exception(django.core.exceptions.ValidationError(errors))
         return pyd_model
 
+    @typing.override
+    def run_extra_model_validators_many(
+        self,
+        pyd_models: typing.Sequence["pydantic.BaseModel"],
+    ) -> list[pydantic.ValidationError | None]:
+        """
+        Validate the uniqueness and constraints of many models at once.
+        Each unique check (`unique=True` field, `unique_together`, `UniqueConstraint`) is validated with a single
+        query for the whole batch, the rest of the constraints are validated per instance.
+        """
+        errors: list[pydantic.ValidationError | None] = [None] * len(pyd_models)
+        instances: dict[int, ModelT] = {}
+        for i, instance in enumerate(self.get_model_instances(pyd_models)):
+            if isinstance(instance, pydantic.ValidationError):
+                errors[i] = instance
+                continue
+            if not instance:
+                continue
+            if instance.pk:
+                # ensures that unique=True fields are not checked against the instance itself
+                instance._state.adding = False  # noqa: SLF001
+            instances[i] = instance
+        if not instances:
+            return errors
+
+        first_instance: ModelT = next(iter(instances.values()))
+        unique_checks, covered_constraints = _batch.batched_unique_checks(first_instance)
+        plain_unique_checks, date_checks = first_instance._get_unique_checks()  # noqa: SLF001
+        check_errors = _batch.perform_unique_checks_many(list(instances.values()), unique_checks)
+
+        for (i, instance), instance_check_errors in zip(instances.items(), check_errors, strict=True):
+            # In the order of `validate_unique()` + `validate_constraints()`, the same as for a single record.
+            instance_errors = _batch.unique_errors(instance_check_errors, plain_unique_checks)
+            for key, date_errors in instance._perform_date_checks(date_checks).items():  # noqa: SLF001
+                instance_errors.setdefault(key, []).extend(date_errors)
+            constraint_errors = _constraints.validate_constraints(
+                instance,
+                predicates=self.check_constraint_predicates,
+                known={name: instance_check_errors.get(check) for name, check in covered_constraints.items()},
+            )
+            for key, key_errors in constraint_errors.items():
+                instance_errors.setdefault(key, []).extend(key_errors)
+            if instance_errors:
+                errors[i] = self.convert_to_pydantic_exception(django.core.exceptions.ValidationError(instance_errors))
+        return errors
+
     @typing.override
     def field_getter(self, field: str) -> FieldT | None:
         try:
-            return self.model._meta.get_field(field)  # noqa: SLF001
+            model_field = self.model._meta.get_field(field)  # noqa: SLF001
         except django.core.exceptions.FieldDoesNotExist:
             # Is just a validator model field, nothing to add from the django model.
             return None
+        if _is_reverse_relation(model_field):
+            # Not a field of the model (e.g., nested related models of `model_to_pydantic`), nothing to add either.
+            return None
+        return model_field
 
     @classmethod
     @typing.override
@@ -237,18 +455,23 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
         )
 
     def model_field_to_annotation_type(self, field: FieldT) -> type:
-        try:
-            field_type = _FIELD_TO_PYD_TYPE[type(field)]
-        except KeyError as e:
-            # TODO - add more; search in base classes
+        """
+        Pydantic type of the field registered in `field_type_registry` for the field class or its closest base class.
+        String fields with choices are `typing.Literal`s of the choices (validated by a hash lookup in pydantic-core,
+        the other types are validated against the choices by the `FieldSpec.metadata`).
+        """
+        field_type = field_types.field_type_registry.get(type(field))
+        if field_type is None:
             raise ValueError(
-                f"Unsupported field type: {type(field).__name__} on field {field.model.__name__}.{field.name}",
-            ) from e
-        if type(field_type) is types.FunctionType:
-            return field_type(field)
-        return field_type
+                f"Unsupported field type: {type(field).__name__} on field {field.model.__name__}.{field.name}"
+                " (register it by `pydbull.django.field_type_registry.register()`)",
+            )
+        annotation = field_type.get_annotation(field)
+        if annotation is str and (choices := _native.native_choices(field)) is not None:
+            return choices.literal()
+        return annotation
 
-    def model_to_pydantic[T: pydantic.BaseModel](  # noqa: C901
+    def model_to_pydantic[T: pydantic.BaseModel](
         self,
         *,
         name: str | None = None,
@@ -256,16 +479,104 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
         exclude: typing.Collection[str] | None = None,
         field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
         __base__: type[T] | None = None,
+        depth: int | None = 0,
     ) -> type["pydantic.BaseModel"] | type[T]:
         """
         Create a pydantic model from a django model.
+        The models are cached (see `pydbull.model_cache`), so calling this again with the same arguments
+        returns the same pydantic model.
         :param name: Name of the pydantic model.
         :param fields: Fields from the Django model to include in the pydantic model.
         :param exclude: Fields from the Django model to exclude from the pydantic model.
         :param field_annotations: Any extra annotations for the fields in the pydantic model.
             Use as: {<field_name>: pydantic.Field(...), ...}
+        :param depth: Levels of the relations represented by the nested pydantic models of the related models
+            (built once per call), including the reverse relations. The relations deeper than that are primary
+            keys and the reverse ones are left out (unless listed in `fields`).
+            None for all the levels (the cycles of the relations are resolved by forward references).
+        """
+        cache_key = self._model_cache_key(name, fields, exclude, field_annotations, depth, __base__)
+        if (build := _nested.current_build()) is not None and (pyd_model := build.get(cache_key)) is not None:
+            # Already built by the outer call (e.g., referenced by another relation), even if not cached.
+            return pyd_model
+
+        def build_model() -> type["pydantic.BaseModel"] | type[T]:
+            with _nested.nested_build() as build:
+                build.start(cache_key)
+                pyd_model = self._build_pydantic_model(
+                    name=name,
+                    fields=fields,
+                    exclude=exclude,
+                    field_annotations=field_annotations,
+                    depth=depth,
+                    __base__=__base__,
+                )
+                build.finish(cache_key, pyd_model)
+            return pyd_model
+
+        return cache.model_cache.get_or_build(cache_key, build_model)
+
+    def _model_cache_key(
+        self,
+        name: str | None = None,
+        fields: typing.Collection[str] | None = None,
+        exclude: typing.Collection[str] | None = None,
+        field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
+        depth: int | None = 0,
+        __base__: type[pydantic.BaseModel] | None = None,
+    ) -> typing.Hashable:
+        return (
+            type(self),
+            self.model,
+            name,
+            None if fields is None else frozenset(fields),
+            None if exclude is None else frozenset(exclude),
+            frozenset(
+                (field_name, cache.field_info_cache_key(field_info))
+                for field_name, field_info in (field_annotations or {}).items()
+            ),
+            depth,
+            __base__,
+        )
+
+    def _relation_type(self, field: django.db.models.Field, depth: int | None) -> typing.Any:  # noqa: ANN401
         """
+        Pydantic type of the (reverse) relation field, None if it's represented by the primary key
+        (see `model_field_to_annotation_type`).
+        """
+        if not field.is_relation or field.related_model is None:
+            return None
+        is_many: bool = field.many_to_many or field.one_to_many
+        if depth == 0:
+            if not _is_reverse_relation(field):
+                return None
+            # Listed in `fields`, referenced by the primary keys.
+            return list[int] if is_many else int
 
+        nested_depth = None if depth is None else depth - 1
+        # The field of the related model pointing back to this model is set by the relation.
+        nested_exclude = frozenset({field.field.name}) if _is_reverse_relation(field) else None
+        related_adapter = type(self)(field.related_model)
+        build = _nested.current_build()
+        related_type: typing.Any = None
+        if build is not None:
+            # The related model is being built (a cycle of the relations).
+            related_key = related_adapter._model_cache_key(exclude=nested_exclude, depth=nested_depth)  # noqa: SLF001
+            related_type = build.reference(related_key)
+        if related_type is None:
+            related_type = related_adapter.model_to_pydantic(exclude=nested_exclude, depth=nested_depth)
+        return list[related_type] if is_many else related_type
+
+    def _build_pydantic_model[T: pydantic.BaseModel](  # noqa: C901
+        self,
+        *,
+        name: str | None,
+        fields: typing.Collection[str] | None,
+        exclude: typing.Collection[str] | None,
+        field_annotations: dict[str, pydantic.fields.FieldInfo] | None,
+        depth: int | None,
+        __base__: type[T] | None,
+    ) -> type["pydantic.BaseModel"] | type[T]:
         def check_fields_exist_on_model(fields_: typing.Collection[str]) -> None:
             model_fields: set[str] = {f.name for f in dj_model_fields}
             for f in fields_:
@@ -285,38 +596,390 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
         if fields is not None:
             check_fields_exist_on_model(fields)
             dj_model_fields = [f for f in dj_model_fields if f.name in fields]
-        elif exclude is not None:
-            check_fields_exist_on_model(exclude)
-            dj_model_fields = [f for f in dj_model_fields if f.name not in exclude]
+        else:
+            if exclude is not None:
+                check_fields_exist_on_model(exclude)
+                dj_model_fields = [f for f in dj_model_fields if f.name not in exclude]
+            if depth == 0:
+                dj_model_fields = [f for f in dj_model_fields if not _is_reverse_relation(f)]
 
         name_to_field: dict[str, django.db.models.Field] = {f.name: f for f in dj_model_fields}
         field_to_type: dict[str, type] = {}
         for field_name, field in name_to_field.items():
-            field_type = self.model_field_to_annotation_type(field)
+            field_type = self._relation_type(field, depth)
+            if field_type is None:
+                field_type = self.model_field_to_annotation_type(field)
+            field_info = field_annotations.get(field_name, pydantic.Field())
             if not self._field_is_required(field):
                 field_type = field_type | None
-            field_to_type[field.name] = typing.Annotated[
-                field_type,
-                field_annotations.get(field_name, pydantic.Field()),
-            ]
+            if _is_reverse_relation(field):
+                # Not a field of the model, so there's no default from the model (see `field_getter`).
+                field_info = pydantic.fields.FieldInfo.merge_field_infos(pydantic.Field(default=None), field_info)
+            field_to_type[field.name] = typing.Annotated[field_type, field_info]
 
         pyd_model = pydantic.create_model(
             name,
             __base__=(__base__,) if __base__ else (pydantic.BaseModel,),
             **field_to_type,
         )
-        return pydbull.model_validator(self.model)(pyd_model)
+        # Unique for the arguments, so that the model is registered under a distinct path (see `pydbull.generated`).
+        # Only picklable in this process, unless registered by the arguments below.
+        digest = hashlib.sha1(  # noqa: S324
+            repr(
+                (
+                    model_meta.label,
+                    name,
+                    sorted(name_to_field),
+                    sorted((field_name, repr(field_info)) for field_name, field_info in field_annotations.items()),
+                    __base__ and f"{__base__.__module__}.{__base__.__qualname__}",
+                    depth,
+                ),
+            ).encode(),
+        ).hexdigest()[:12]
+        pyd_model.__module__ = __name__
+        pyd_model.__qualname__ = f"{name}_{digest}"
+        pyd_model = pydbull.model_validator(self.model, lazy=False)(pyd_model)
+        classes: tuple[type, ...] = (type(self), self.model, __base__ or pydantic.BaseModel)
+        if not field_annotations and all("<locals>" not in cls.__qualname__ for cls in classes):
+            # Picklable in any process, the model is built again by the same arguments when unpickled.
+            generated.register_built(
+                pyd_model,
+                _rebuild_pydantic_model,
+                adapter=_import_path(type(self)),
+                model=_import_path(self.model),
+                name=name,
+                fields=None if fields is None else sorted(fields),
+                exclude=None if exclude is None else sorted(exclude),
+                depth=depth,
+                base=__base__ and _import_path(__base__),
+            )
+        return pyd_model
 
     @typing.override
     def get_model_instance(
         self,
         data: pydantic.BaseModel,
     ) -> ModelT:
-        if django_pk := getattr(self, self.model._meta.pk.name, None):  # noqa: SLF001
-            instance: ModelT = self.model.objects.get(pk=django_pk)
+        """
+        An existing instance is loaded with a single query, restricted to the columns not set from the data.
+        The instances of the related (nested) pydantic models aren't loaded (see `_related_instance`).
+        :raise DoesNotExist: If the data contain a primary key of a non-existing instance.
+        """
+        if django_pk := self._data_pk(data):
+            deferred_fields: list[str] = self._data_concrete_field_names([data])
+            instance: ModelT = self.model._default_manager.defer(*deferred_fields).get(pk=django_pk)  # noqa: SLF001
+        else:
+            instance = self.model()
+        return self._set_instance_fields(instance, data)
+
+    @typing.override
+    async def aget_model_instance(
+        self,
+        data: pydantic.BaseModel,
+    ) -> ModelT:
+        """
+        :raise DoesNotExist: If the data contain a primary key of a non-existing instance.
+        """
+        if django_pk := self._data_pk(data):
+            deferred_fields: list[str] = self._data_concrete_field_names([data])
+            instance: ModelT = await self.model._default_manager.defer(*deferred_fields).aget(pk=django_pk)  # noqa: SLF001
         else:
             instance = self.model()
+        # No query, the related instances aren't loaded.
+        return self._set_instance_fields(instance, data)
+
+    @typing.override
+    def get_model_instances(
+        self,
+        data: typing.Sequence[pydantic.BaseModel],
+    ) -> list[ModelT | pydantic.ValidationError]:
+        """
+        Existing instances are loaded with a single query, restricted to the columns not set from the data.
+        Primary keys of non-existing instances are returned as validation errors of the primary key field.
+        """
+        pks: list[typing.Any] = [pk for d in data if (pk := self._data_pk(d))]
+        pk_to_instance: dict[typing.Any, ModelT] = {}
+        if pks:
+            deferred_fields: list[str] = self._data_concrete_field_names(data)
+            pk_to_instance = (
+                self.model._default_manager.defer(*deferred_fields).in_bulk(pks)  # noqa: SLF001
+            )
+
+        related_instances, related_errors = self._get_related_instances(data)
+        instances: list[ModelT | pydantic.ValidationError] = []
+        for i, d in enumerate(data):
+            if i in related_errors:
+                instances.append(related_errors[i])
+                continue
+            if not (django_pk := self._data_pk(d)):
+                instances.append(self._set_instance_fields(self.model(), d, related_instances[i]))
+                continue
+            try:
+                instance = pk_to_instance[self.model._meta.pk.to_python(django_pk)]  # noqa: SLF001
+            except KeyError:
+                instances.append(self._does_not_exist_error(django_pk))
+                continue
+            instances.append(self._set_instance_fields(instance, d, related_instances[i]))
+        return instances
 
+    @typing.override
+    def transaction(self) -> typing.ContextManager[None]:
+        # No savepoint when nested, e.g., in the transaction of `pydbull.bulk_save` for all the models.
+        return django.db.transaction.atomic(using=django.db.router.db_for_write(self.model), savepoint=False)
+
+    @typing.override
+    @contextlib.contextmanager
+    def count_queries(self, on_query: typing.Callable[[], None]) -> typing.Iterator[None]:
+        def execute_wrapper(
+            execute: typing.Callable[..., typing.Any],
+            sql: str,
+            params: typing.Any,  # noqa: ANN401
+            many: bool,
+            context: dict[str, typing.Any],
+        ) -> typing.Any:  # noqa: ANN401
+            on_query()
+            return execute(sql, params, many, context)
+
+        with contextlib.ExitStack() as stack:
+            for connection in django.db.connections.all():
+                stack.enter_context(connection.execute_wrapper(execute_wrapper))
+            yield
+
+    @typing.override
+    def worker_initializer(self) -> typing.Callable[[], object]:
+        """
+        `django.setup()`, the models can't be imported before (e.g., by the processes started by the "spawn" method,
+        configured by the `DJANGO_SETTINGS_MODULE` environment variable).
+        """
+        return django.setup
+
+    @typing.override
+    def bulk_save(
+        self,
+        pyd_models: typing.Sequence[pydantic.BaseModel],
+        *,
+        batch_size: int | None = None,
+        update_conflicts: bool = False,
+        unique_fields: typing.Sequence[str] | None = None,
+    ) -> list[typing.Any]:
+        """
+        The instances are built from the data without loading them from the database. The instances whose data
+        carry a primary key are updated by `bulk_update()` (only the fields of the data), the rest is created
+        by `bulk_create()` (including the primary keys set by a default, e.g., `UUIDField(default=uuid.uuid4)`).
+        Related (nested) pydantic models must be of existing instances. The many-to-many (and reverse) relations
+        aren't saved, the data setting them are refused.
+        On the databases which can't return the primary keys from `bulk_create()` (e.g., MySQL), the instances
+        without a primary key are inserted one by one (by `save()`), the upserted ones are read back by `unique_fields`.
+        :param update_conflicts: Create all the instances by `bulk_create()`, updating the rows conflicting on
+            `unique_fields` (the primary key by default) instead. If there's no other field in the data to update,
+            the conflicting rows are kept as they are.
+        """
+        if not pyd_models:
+            return []
+        self._check_no_many_relations(pyd_models)
+        instances: list[ModelT] = [self._build_model_instance(pyd_model) for pyd_model in pyd_models]
+        fields: list[str] = self._data_concrete_field_names(pyd_models)
+        manager: django.db.models.Manager = self.model._default_manager  # noqa: SLF001
+        connection = django.db.connections[django.db.router.db_for_write(self.model)]
+        with self.transaction():
+            if update_conflicts:
+                unique_fields = list(unique_fields or [self.model._meta.pk.name])  # noqa: SLF001
+                update_fields = [f for f in fields if f not in unique_fields]
+                if update_fields:
+                    manager.bulk_create(
+                        instances,
+                        batch_size=batch_size,
+                        update_conflicts=True,
+                        unique_fields=unique_fields,
+                        update_fields=update_fields,
+                    )
+                else:
+                    # `bulk_create()` refuses to update no field, nothing to change on the conflicting rows
+                    # (their primary keys aren't returned then).
+                    manager.bulk_create(instances, batch_size=batch_size, ignore_conflicts=True)
+                if not update_fields or not connection.features.can_return_rows_from_bulk_insert:
+                    self._load_pks(instances, unique_fields, batch_size)
+            else:
+                to_create = [instance for instance in instances if instance._state.adding]  # noqa: SLF001
+                to_update = [instance for instance in instances if not instance._state.adding]  # noqa: SLF001
+                if not connection.features.can_return_rows_from_bulk_insert:
+                    # The primary keys generated by the database are returned only for a single row.
+                    for instance in to_create:
+                        if instance.pk is None:
+                            instance.save(force_insert=True)
+                    to_create = [instance for instance in to_create if instance._state.adding]  # noqa: SLF001
+                if to_create:
+                    manager.bulk_create(to_create, batch_size=batch_size)
+                if to_update and fields:
+                    manager.bulk_update(to_update, fields, batch_size=batch_size)
+        return [instance.pk for instance in instances]
+
+    def _check_no_many_relations(self, pyd_models: typing.Sequence[pydantic.BaseModel]) -> None:
+        """
+        Raise if the data set a many-to-many (or reverse) relation, which `bulk_save` can't save.
+        """
+        many_relations: dict[type[pydantic.BaseModel], list[str]] = {}
+        for pyd_model in pyd_models:
+            pyd_model_type = type(pyd_model)
+            if pyd_model_type not in many_relations:
+                many_relations[pyd_model_type] = [
+                    field_name
+                    for field_name in pyd_model_type.__pydantic_fields__.keys()
+                    if (model_field := self.field_getter(field_name)) is not None
+                    and (model_field.many_to_many or _is_reverse_relation(model_field))
+                ]
+            for field_name in many_relations[pyd_model_type]:
+                if getattr(pyd_model, field_name):
+                    raise ValueError(
+                        f"`{self.model.__name__}.{field_name}` is a many-to-many (or reverse) relation,"
+                        " which isn't saved by `bulk_save`. Save the related instances separately"
+                        " (e.g., by `bulk_create()` of the `through` model).",
+                    )
+
+    def _load_pks(
+        self,
+        instances: typing.Sequence[ModelT],
+        unique_fields: typing.Sequence[str],
+        batch_size: int | None,
+    ) -> None:
+        """
+        Set the primary keys of the saved instances not having them, by querying their `unique_fields`.
+        """
+        model_fields = [self.model._meta.get_field(field_name) for field_name in unique_fields]  # noqa: SLF001
+        index_to_key: dict[int, tuple] = {}
+        for i, instance in enumerate(instances):
+            if instance.pk is None and (key := _batch.lookup_key(instance, model_fields)) is not None:
+                index_to_key[i] = key
+        if not index_to_key:
+            return
+        indexes = list(index_to_key)
+        batch_size = batch_size or len(indexes)
+        for start in range(0, len(indexes), batch_size):
+            batch = indexes[start : start + batch_size]
+            key_to_pks = _batch.pks_by_key(self.model, model_fields, {index_to_key[i] for i in batch})
+            for i in batch:
+                if pks := key_to_pks.get(index_to_key[i]):
+                    instances[i].pk = next(iter(pks))
+                    instances[i]._state.adding = False  # noqa: SLF001
+
+    def _build_model_instance(self, data: pydantic.BaseModel) -> ModelT:
+        """
+        Build the instance from the data without querying the database
+        (instances of the related pydantic models are referenced only by their primary key).
+        The instance is existing if the data carry its primary key (not if it's set by the default of the field).
+        """
+        related_instances: dict[str, django.db.models.Model] = {}
+        for field_name, field_value in self._related_pyd_models(data):
+            related_model = self.model._meta.get_field(field_name).related_model  # noqa: SLF001
+            related_instances[field_name] = related_model(
+                pk=getattr(field_value, related_model._meta.pk.name, None),  # noqa: SLF001
+            )
+        instance = self._set_instance_fields(self.model(), data, related_instances)
+        if self._data_pk(data) is not None:
+            instance._state.adding = False  # noqa: SLF001
+        return instance
+
+    def _related_instance(self, data: pydantic.BaseModel) -> ModelT:
+        """
+        Instance of the related (nested) pydantic model, without querying the database: an existing instance
+        (validated by the model validator of the data) is referenced by its primary key, the fields not set
+        from the data are loaded when accessed.
+        """
+        if not (django_pk := self._data_pk(data)):
+            return self.get_model_instance(data)
+        concrete_fields = self.model._meta.concrete_fields  # noqa: SLF001
+        instance = self.model.from_db(
+            django.db.router.db_for_read(self.model),
+            [field.attname for field in concrete_fields],
+            [django_pk if field.primary_key else django.db.models.DEFERRED for field in concrete_fields],
+        )
+        return self._set_instance_fields(instance, data)
+
+    def _data_pk(self, data: pydantic.BaseModel) -> typing.Any:  # noqa: ANN401
+        """
+        Primary key carried by the data, None if it isn't set by them (e.g., only by the default of the field,
+        such as `UUIDField(default=uuid.uuid4)`, for a new instance).
+        """
+        pk_name: str = self.model._meta.pk.name  # noqa: SLF001
+        return getattr(data, pk_name) if pk_name in data.model_fields_set else None
+
+    def _data_concrete_field_names(self, data: typing.Sequence[pydantic.BaseModel]) -> list[str]:
+        """
+        Names of the concrete fields of the model (except the primary key) set by all the `data`.
+        """
+        data_fields: set[str] = set.intersection(*(set(type(d).__pydantic_fields__) for d in data))
+        return [
+            f.name
+            for f in self.model._meta.concrete_fields  # noqa: SLF001
+            if f.name in data_fields and not f.primary_key
+        ]
+
+    def _get_related_instances(
+        self,
+        data: typing.Sequence[pydantic.BaseModel],
+    ) -> tuple[list[dict[str, django.db.models.Model]], dict[int, pydantic.ValidationError]]:
+        """
+        Get the instances of the related (nested) pydantic models at once per field and model.
+        :return: Related instances by field name for each item of `data`,
+            and the errors of the items with a non-existing related instance (by index).
+        """
+        related_instances: list[dict[str, django.db.models.Model]] = [{} for _ in data]
+        related_errors: dict[int, pydantic.ValidationError] = {}
+        # (field name, pydantic model): indexes of `data`
+        groups: dict[tuple[str, type[pydantic.BaseModel]], list[int]] = {}
+        for i, d in enumerate(data):
+            for field_name, field_value in self._related_pyd_models(d):
+                groups.setdefault((field_name, type(field_value)), []).append(i)
+        for (field_name, related_pyd_model), indexes in groups.items():
+            related_adapter = pydbull.get_adapter(related_pyd_model)
+            results = related_adapter.get_model_instances([getattr(data[i], field_name) for i in indexes])
+            for i, result in zip(indexes, results, strict=True):
+                if isinstance(result, pydantic.ValidationError):
+                    related_errors.setdefault(i, utils.with_loc_prefix(result, field_name))
+                else:
+                    related_instances[i][field_name] = result
+        return related_instances, related_errors
+
+    def _related_pyd_models(self, data: pydantic.BaseModel) -> typing.Iterator[tuple[str, pydantic.BaseModel]]:
+        """
+        Nested pydantic models of the relation fields by field name (e.g., not the documents of JSON fields).
+        """
+        for field_name in type(data).__pydantic_fields__.keys():
+            if not isinstance(field_value := getattr(data, field_name), pydantic.BaseModel):
+                continue
+            model_field = self.field_getter(field_name)
+            if model_field is not None and model_field.is_relation:
+                yield field_name, field_value
+
+    def _does_not_exist_error(self, pk: typing.Any) -> pydantic.ValidationError:  # noqa: ANN401
+        pk_name: str = self.model._meta.pk.name  # noqa: SLF001
+        return self.convert_to_pydantic_exception(
+            django.core.exceptions.ValidationError(
+                {
+                    pk_name: django.core.exceptions.ValidationError(
+                        "%(model)s with %(field)s %(value)r does not exist.",
+                        code="does_not_exist",
+                        params={
+                            "model": self.model._meta.verbose_name,  # noqa: SLF001
+                            "field": pk_name,
+                            "value": pk,
+                        },
+                    ),
+                },
+            ),
+        )
+
+    def _set_instance_fields(
+        self,
+        instance: ModelT,
+        data: pydantic.BaseModel,
+        related_instances: typing.Mapping[str, django.db.models.Model] | None = None,
+    ) -> ModelT:
+        """
+        :param related_instances: Already retrieved instances of the related (nested) pydantic models by field name.
+        """
+        if related_instances is None:
+            related_instances = {}
         for field_name in data.__pydantic_fields__.keys():
             field_value: typing.Any = getattr(data, field_name)
             try:
@@ -324,12 +987,16 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
             except django.core.exceptions.FieldDoesNotExist:
                 # Not a model field - nothing to do
                 continue
-            if django_field.many_to_many:
+            if django_field.many_to_many or _is_reverse_relation(django_field):
                 # Prevents "TypeError: Direct assignment to the forward side of a many-to-many set is prohibited."
+                # (and to the reverse side of the relations)
                 continue
 
             is_fk_field = isinstance(django_field, django.db.models.ForeignKey)
-            if isinstance(field_value, pydantic.BaseModel):
+            if isinstance(django_field, django.db.models.JSONField):
+                # The parsed documents may contain pydantic models (see `field_types._json_type`).
+                setattr(instance, field_name, pydantic_core.to_jsonable_python(field_value))
+            elif isinstance(field_value, pydantic.BaseModel):
                 field_value: pydantic.BaseModel
                 if not is_fk_field:
                     # Case where a validator is used on a non-relationship field - something is wrong, for now just
@@ -339,7 +1006,11 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
                         f" `{self.model.__name__}.{django_field.name} is not "
                         f"a {django.db.models.ForeignKey.__name__}.",
                     )
-                setattr(instance, field_name, pydbull.get_adapter(field_value).get_model_instance(field_value))
+                if field_name in related_instances:
+                    related_instance = related_instances[field_name]
+                else:
+                    related_instance = pydbull.get_adapter(field_value)._related_instance(field_value)  # noqa: SLF001
+                setattr(instance, field_name, related_instance)
             elif is_fk_field:
                 # If the field is a ForeignKey, we need to set the field to the validator instance.
                 setattr(instance, f"{field_name}_id", field_value)
@@ -352,74 +1023,220 @@ class DjangoAdapter[ModelT: django.db.models.Model](pydbull.BaseAdapter[ModelT])
     def get_exception_class(cls) -> type[Exception]:
         return django.core.exceptions.ValidationError
 
-    def _get_validator[T](
-        self,
-        validator_cls: type[T],
-        field: FieldT,
-    ) -> T | None:
-        for validator in field.validators:
-            if isinstance(validator, validator_cls):
-                return validator
-        return None
-
     @classmethod
     def _validator_to_pydantic_error_code(cls, validator: type) -> typing.LiteralString | None:
         """
         Map the Django error codes to pydantic ones.
         This is so that the error codes are consistent no matter whether the validation fails in Django or Pydantic.
         """
-        mapping: dict[type, pydantic_core.ErrorType] = {
-            django.core.validators.EmailValidator: "value_error",
-            django.core.validators.MinLengthValidator: "too_short",
-            django.core.validators.MaxLengthValidator: "too_long",
-            django.core.validators.StepValueValidator: "multiple_of",
-        }
-        return mapping.get(validator)
+        return _VALIDATOR_TO_PYDANTIC_ERROR_CODE.get(validator)
 
     def _field_is_required(self, field: FieldT) -> bool:
-        return not field.blank
-
-
-EmailStr = pydantic.EmailStr if importlib.util.find_spec("email_validator") is not None else str
-
-
-# TODO add more as needed
-_FIELD_TO_PYD_TYPE: dict[type[django.db.models.Field], type | typing.Callable[[django.db.models.Field], type]] = {
-    django.db.models.CharField: lambda field: _try_enum_type(field, str),
-    django.db.models.TextField: str,
-    django.db.models.IntegerField: lambda field: _try_enum_type(field, int),
-    django.db.models.BigIntegerField: lambda field: _try_enum_type(field, int),
-    django.db.models.SmallIntegerField: lambda field: _try_enum_type(field, int),
-    django.db.models.PositiveSmallIntegerField: lambda field: _try_enum_type(field, int),
-    django.db.models.PositiveBigIntegerField: lambda field: _try_enum_type(field, int),
-    django.db.models.BigAutoField: int,
-    django.db.models.ForeignKey: int,
-    django.db.models.ManyToManyField: list[int],
-    django.db.models.AutoField: int,
-    django.db.models.FloatField: float,
-    django.db.models.DecimalField: Decimal,
-    django.db.models.BooleanField: bool,
-    django.db.models.DateField: date,
-    django.db.models.TimeField: time,
-    django.db.models.DateTimeField: datetime,
-    django.db.models.EmailField: EmailStr,
-    django.db.models.URLField: str,
-    django.db.models.UUIDField: str,
-    django.db.models.GenericIPAddressField: str,
-    django.db.models.FileField: str,
-    django.db.models.ImageField: str,
-    django.db.models.BinaryField: bytes,
-    django.db.models.DurationField: timedelta,
-    django.db.models.SlugField: str,
+        return not _is_reverse_relation(field) and not field.blank
+
+
+_VALIDATOR_TO_PYDANTIC_ERROR_CODE: dict[type, pydantic_core.ErrorType] = {
+    django.core.validators.EmailValidator: "value_error",
+    django.core.validators.MinLengthValidator: "too_short",
+    django.core.validators.MaxLengthValidator: "too_long",
+    django.core.validators.StepValueValidator: "multiple_of",
 }
 
 
-def _try_enum_type[T: type](field: django.db.models.Field, default: T) -> T | type[django.db.models.Choices]:
+# Validator kinds extracted into the field spec (see `DjangoAdapter.build_field_spec`).
+_SPEC_VALIDATOR_KINDS: tuple[type, ...] = (
+    django.core.validators.MinLengthValidator,
+    django.core.validators.RegexValidator,
+    django.core.validators.MinValueValidator,
+    django.core.validators.MaxValueValidator,
+    django.core.validators.StepValueValidator,
+)
+
+
+def _is_reverse_relation(field: django.db.models.Field | django.db.models.ForeignObjectRel) -> bool:
+    """
+    Whether the field is the reverse side of a relation (e.g., `ManyToOneRel` of a `ForeignKey`).
+    """
+    return field.is_relation and field.auto_created and not field.concrete
+
+
+def _import_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _rebuild_pydantic_model(
+    adapter: str,
+    model: str,
+    base: str | None,
+    **kwargs: typing.Any,  # noqa: ANN401
+) -> type[pydantic.BaseModel]:
+    """
+    Build the pydantic model of `DjangoAdapter.model_to_pydantic` again (e.g., when unpickled in another process).
+    """
+    adapter_cls: type[DjangoAdapter] = generated.import_object(adapter)
+    return adapter_cls(generated.import_object(model)).model_to_pydantic(
+        __base__=base and generated.import_object(base),
+        **kwargs,
+    )
+
+
+def _convert_null(null_value: typing.Any, value: typing.Any) -> typing.Any:  # noqa: ANN401
+    return null_value if value is None else value
+
+
+def _native_pattern(validator: django.core.validators.RegexValidator | None) -> str | None:
+    """
+    Pattern of the regex validator matching the same strings in pydantic-core, None if there's no such pattern.
+    """
+    # Skip URLValidator because the regex is too complex for pydantic to handle.
+    # The validation is therefore done only in Django (see `run_extra_field_validators`).
+    if validator is None or validator.inverse_match or type(validator) is django.core.validators.URLValidator:
+        return None
+    return _native.rust_pattern(validator.regex)
+
+
+def _native_metadata(
+    field: django.db.models.Field,
+    validators: tuple[typing.Callable[[typing.Any], None], ...],
+) -> tuple[typing.Any, ...]:
+    """
+    Pydantic metadata validating the choices, the exact equivalents of the other common validators
+    and the raw JSON of the JSON fields in pydantic-core.
+    """
+    metadata: list[typing.Any] = []
+    if isinstance(field, django.db.models.JSONField):
+        metadata.append(_native.NativeJSON())
+    if checks := _native.native_checks(validators):
+        metadata.append(_native.NativeValidators(checks))
+    if choices := _native.native_choices(field):
+        metadata.append(choices)
+    return tuple(metadata)
+
+
+def _limit_value(validator: django.core.validators.BaseValidator | None) -> typing.Any:  # noqa: ANN401
+    return validator.limit_value if validator else PydanticUndefined
+
+
+@functools.cache
+def _array_field_types() -> tuple[type[django.db.models.Field], ...]:
+    """
+    Fields holding a list of values (the minimum length of required ones is 1).
+    """
+    array_fields: tuple[type[django.db.models.Field], ...] = (django.db.models.ManyToManyField,)
+    try:
+        from django.contrib.postgres.fields import ArrayField
+
+        array_fields += (ArrayField,)
+    except ImportError:
+        pass
+    return array_fields
+
+
+def _is_enforced_by_pydantic(validator: typing.Callable[[typing.Any], None], field: pydantic.fields.FieldInfo) -> bool:
+    """
+    Whether the Django validator is enforced by the constraints of the pydantic field
+    (the pydantic constraint is the same or stricter).
+    Only exact validator types are checked, as subclasses may change the validation logic.
+    """
+    if any(
+        isinstance(item, _native.NativeValidators | _native.NativeChoices) and item.enforces(validator, field)
+        for item in field.metadata
+    ):
+        return True
     try:
-        choices_enum = field.__choices_enum__
-    except AttributeError:
-        return default
+        is_enforced = _PYDANTIC_ENFORCED_VALIDATORS[type(validator)]
+    except KeyError:
+        return False
+    if callable(getattr(validator, "limit_value", None)):
+        # Evaluated on every validation, can't be compared upfront.
+        return False
+    try:
+        return is_enforced(validator, field)
+    except TypeError:
+        # Incomparable values
+        return False
+
+
+def _is_set(value: typing.Any) -> bool:  # noqa: ANN401
+    return value is not None and value is not PydanticUndefined
+
+
+_PYD_ADAPTER = pydbull.PydanticAdapter(pydantic.BaseModel)
+
+
+def _max_length_enforced(
+    validator: django.core.validators.MaxLengthValidator,
+    field: pydantic.fields.FieldInfo,
+) -> bool:
+    max_length = _PYD_ADAPTER.get_max_length(field)
+    return _is_set(max_length) and max_length <= validator.limit_value
+
 
-    if not issubclass(choices_enum, django.db.models.Choices):
-        raise TypeError(f"Field `{field.name}` has invalid choices enum: {choices_enum}")
-    return choices_enum
+def _min_length_enforced(
+    validator: django.core.validators.MinLengthValidator,
+    field: pydantic.fields.FieldInfo,
+) -> bool:
+    min_length = _PYD_ADAPTER.get_min_length(field)
+    return _is_set(min_length) and min_length >= validator.limit_value
+
+
+def _max_value_enforced(validator: django.core.validators.MaxValueValidator, field: pydantic.fields.FieldInfo) -> bool:
+    le = _PYD_ADAPTER.get_less_than_or_equal(field)
+    lt = _PYD_ADAPTER.get_less_than(field)
+    return (_is_set(le) and le <= validator.limit_value) or (_is_set(lt) and lt <= validator.limit_value)
+
+
+def _min_value_enforced(validator: django.core.validators.MinValueValidator, field: pydantic.fields.FieldInfo) -> bool:
+    ge = _PYD_ADAPTER.get_greater_than_or_equal(field)
+    gt = _PYD_ADAPTER.get_greater_than(field)
+    return (_is_set(ge) and ge >= validator.limit_value) or (_is_set(gt) and gt >= validator.limit_value)
+
+
+def _step_value_enforced(
+    validator: django.core.validators.StepValueValidator,
+    field: pydantic.fields.FieldInfo,
+) -> bool:
+    return validator.offset in [0, None] and _PYD_ADAPTER.get_multiple_of(field) == validator.limit_value
+
+
+def _regex_enforced(validator: django.core.validators.RegexValidator, field: pydantic.fields.FieldInfo) -> bool:
+    # Flags (e.g., re.IGNORECASE) are not passed to pydantic, those regexes have no native pattern.
+    return not validator.inverse_match and _PYD_ADAPTER.get_pattern(field) == _native.rust_pattern(validator.regex)
+
+
+# Getters of the `pydbull.FieldSpec` constraints of a pydantic field.
+_PYD_CONSTRAINTS: dict[str, typing.Callable[[pydantic.fields.FieldInfo], typing.Any]] = {
+    "max_length": _PYD_ADAPTER.get_max_length,
+    "min_length": _PYD_ADAPTER.get_min_length,
+    "pattern": _PYD_ADAPTER.get_pattern,
+    "gt": _PYD_ADAPTER.get_greater_than,
+    "ge": _PYD_ADAPTER.get_greater_than_or_equal,
+    "lt": _PYD_ADAPTER.get_less_than,
+    "le": _PYD_ADAPTER.get_less_than_or_equal,
+    "multiple_of": _PYD_ADAPTER.get_multiple_of,
+    "max_digits": _PYD_ADAPTER.get_decimal_max_digits,
+    "decimal_places": _PYD_ADAPTER.get_decimal_places,
+}
+
+
+def _has_constraints(field: pydantic.fields.FieldInfo, constraints: typing.Mapping[str, typing.Any]) -> bool:
+    """
+    Whether the pydantic field has the same constraints (the other items, e.g., `description`, are ignored).
+    """
+    return all(
+        _PYD_CONSTRAINTS[name](field) == value
+        for name, value in constraints.items()
+        if name in _PYD_CONSTRAINTS and _is_set(value)
+    )
+
+
+_PYDANTIC_ENFORCED_VALIDATORS: dict[type, typing.Callable[[typing.Any, pydantic.fields.FieldInfo], bool]] = {
+    django.core.validators.MaxLengthValidator: _max_length_enforced,
+    django.core.validators.MinLengthValidator: _min_length_enforced,
+    django.core.validators.MaxValueValidator: _max_value_enforced,
+    django.core.validators.MinValueValidator: _min_value_enforced,
+    django.core.validators.StepValueValidator: _step_value_enforced,
+    django.core.validators.RegexValidator: _regex_enforced,
+    # `DecimalValidator` isn't enforced by `max_digits` and `decimal_places` - pydantic normalizes the trailing zeros
+    # and the exponent first (e.g., "1.000" passes `decimal_places=2`), Django doesn't.
+}
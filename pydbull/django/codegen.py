@@ -0,0 +1,49 @@
+import typing
+
+import django.apps
+import django.db.models
+import django.utils.module_loading
+
+import pydbull
+from pydbull import codegen
+
+__all__ = [
+    "generate_module",
+    "resolve_models",
+]
+
+
+def resolve_models(target: str) -> list[type[django.db.models.Model]]:
+    """
+    Resolve the Django models to generate the pydantic models for.
+    :param target: App label (all models of the app), `<app_label>.<ModelName>` or import path of the model
+        (e.g., `myapp.models.User`).
+    :raise ValueError: If no model is found.
+    """
+    try:
+        return list(django.apps.apps.get_app_config(target).get_models())
+    except LookupError:
+        pass
+    if target.count(".") == 1:
+        try:
+            return [django.apps.apps.get_model(target)]
+        except (LookupError, ValueError):
+            pass
+    try:
+        model = django.utils.module_loading.import_string(target)
+    except ImportError as e:
+        raise ValueError(f"`{target}` is neither an installed app label nor a model.") from e
+    if not isinstance(model, type) or not issubclass(model, django.db.models.Model):
+        raise ValueError(f"`{target}` is not a Django model.")  # noqa: TRY004
+    return [model]
+
+
+def generate_module(targets: typing.Iterable[str], header: str = "") -> str:
+    """
+    Render the source code of a module with the pydantic models built by `model_to_pydantic`
+    for all the models of the `targets` (see `resolve_models`).
+    """
+    models: dict[type[django.db.models.Model], None] = {}
+    for target in targets:
+        models.update(dict.fromkeys(resolve_models(target)))
+    return codegen.render_module((pydbull.model_to_pydantic(model) for model in models), header=header)
@@ -0,0 +1,168 @@
+import importlib.util
+import threading
+import types
+import typing
+import weakref
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import django.db.models
+import pydantic
+
+__all__ = [
+    "FieldType",
+    "FieldTypeRegistry",
+    "field_type_registry",
+]
+
+type Annotation = type | typing.Callable[[django.db.models.Field], type]
+type Constraints = (
+    typing.Mapping[str, typing.Any] | typing.Callable[[django.db.models.Field], typing.Mapping[str, typing.Any]]
+)
+
+
+class FieldType(typing.NamedTuple):
+    """
+    Pydantic type and constraints of a Django field class (see `FieldTypeRegistry.register`).
+    """
+
+    # Pydantic type of the field values, or a function returning it for the field instance
+    annotation: Annotation
+    # `pydbull.FieldSpec` constraints (e.g., `pattern`, `max_length`, `ge`) overriding the ones extracted
+    # from the field validators, or a function returning them for the field instance
+    constraints: Constraints
+    # Validators (or their types) of the field enforced by the `constraints`, not run in Python
+    enforced_validators: tuple[typing.Any, ...]
+
+    def get_annotation(self, field: django.db.models.Field) -> type:
+        if type(self.annotation) is types.FunctionType:
+            return self.annotation(field)
+        return self.annotation
+
+    def get_constraints(self, field: django.db.models.Field) -> typing.Mapping[str, typing.Any]:
+        if callable(self.constraints):
+            return self.constraints(field)
+        return self.constraints
+
+    def enforces(self, validator: typing.Callable[[typing.Any], None]) -> bool:
+        """
+        Whether the validator is enforced by the constraints.
+        """
+        return any(
+            validator is enforced or (isinstance(enforced, type) and isinstance(validator, enforced))
+            for enforced in self.enforced_validators
+        )
+
+
+class FieldTypeRegistry:
+    """
+    Pydantic types of the Django field classes (see `DjangoAdapter.model_field_to_annotation_type`).
+    The type of a field is resolved by walking the field class MRO, so it's also used for the subclasses
+    of the registered field class (e.g., custom `CharField`s), and the result is cached by the field class.
+    """
+
+    def __init__(self) -> None:
+        self._field_types: dict[type[django.db.models.Field], FieldType] = {}
+        self._cache: weakref.WeakKeyDictionary[type[django.db.models.Field], FieldType | None] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        field_cls: type[django.db.models.Field],
+        annotation: Annotation,
+        *,
+        constraints: Constraints | None = None,
+        enforced_validators: typing.Iterable[typing.Any] = (),
+    ) -> None:
+        """
+        Use the pydantic type for the `field_cls` and its subclasses (overrides any type registered before).
+        For example:
+        ```
+        field_type_registry.register(
+            PhoneNumberField,
+            str,
+            constraints={"pattern": r"^[+][0-9]{8,15}$", "max_length": 16},
+            enforced_validators=[validate_phone_number],
+        )
+        ```
+        :param annotation: Pydantic type of the field values, or a function returning it for the field instance.
+        :param constraints: `pydbull.FieldSpec` constraints of the field validated natively by pydantic-core
+            (`max_length`, `min_length`, `pattern`, `gt`, `ge`, `lt`, `le`, `multiple_of`, `max_digits`,
+            `decimal_places`), or a function returning them for the field instance.
+        :param enforced_validators: Validators of the field (or their types) enforced by the `constraints`,
+            so that they're not run in Python on every validation.
+        """
+        with self._lock:
+            self._field_types[field_cls] = FieldType(annotation, constraints or {}, tuple(enforced_validators))
+            self._cache.clear()
+
+    def get(self, field_cls: type[django.db.models.Field]) -> FieldType | None:
+        """
+        The type registered for the field class or its closest base class, None if there's no such class.
+        """
+        try:
+            return self._cache[field_cls]
+        except KeyError:
+            pass
+        field_type = next(
+            (self._field_types[base] for base in field_cls.__mro__ if base in self._field_types),
+            None,
+        )
+        with self._lock:
+            self._cache[field_cls] = field_type
+        return field_type
+
+
+def _json_type(field: django.db.models.JSONField) -> typing.Any:  # noqa: ANN401
+    """
+    Pydantic type of the documents of the JSON field, set as the `__json_type__` attribute of the field
+    (e.g., a pydantic model validating the structure of the documents), any JSON value by default.
+    """
+    return getattr(field, "__json_type__", typing.Any)
+
+
+def _try_enum_type[T: type](field: django.db.models.Field, default: T) -> T | type[django.db.models.Choices]:
+    try:
+        choices_enum = field.__choices_enum__
+    except AttributeError:
+        return default
+
+    if not issubclass(choices_enum, django.db.models.Choices):
+        raise TypeError(f"Field `{field.name}` has invalid choices enum: {choices_enum}")
+    return choices_enum
+
+
+EmailStr = pydantic.EmailStr if importlib.util.find_spec("email_validator") is not None else str
+
+# The subclasses (e.g., `PositiveIntegerField` of `IntegerField`) are resolved by the MRO.
+_DEFAULT_FIELD_TYPES: dict[type[django.db.models.Field], Annotation] = {
+    django.db.models.CharField: lambda field: _try_enum_type(field, str),
+    django.db.models.TextField: str,
+    django.db.models.IntegerField: lambda field: _try_enum_type(field, int),
+    django.db.models.BigAutoField: int,
+    django.db.models.ForeignKey: int,
+    django.db.models.ManyToManyField: list[int],
+    django.db.models.AutoField: int,
+    django.db.models.FloatField: float,
+    django.db.models.DecimalField: Decimal,
+    django.db.models.BooleanField: bool,
+    django.db.models.DateField: date,
+    django.db.models.TimeField: time,
+    django.db.models.DateTimeField: datetime,
+    django.db.models.EmailField: EmailStr,
+    django.db.models.URLField: str,
+    django.db.models.UUIDField: str,
+    django.db.models.GenericIPAddressField: str,
+    django.db.models.FileField: str,
+    django.db.models.BinaryField: bytes,
+    django.db.models.DurationField: timedelta,
+    django.db.models.SlugField: str,
+    # The raw JSON strings are parsed natively by `DjangoAdapter.build_field_spec` metadata.
+    django.db.models.JSONField: _json_type,
+}
+
+field_type_registry = FieldTypeRegistry()
+for field_cls, annotation in _DEFAULT_FIELD_TYPES.items():
+    field_type_registry.register(field_cls, annotation)
@@ -0,0 +1,181 @@
+import contextlib
+import re
+import typing
+
+import django.core.exceptions
+import django.db
+import django.db.backends.base.base
+import django.db.models
+import pydantic
+
+from pydbull.django import _batch, _constraints
+from pydbull.django.adapter import DjangoAdapter
+
+__all__ = [
+    "integrity_error_to_validation_error",
+    "save",
+    "translate_integrity_errors",
+]
+
+# Name of the violated constraint in the error message of the database backends.
+_CONSTRAINT_NAME_PATTERNS: typing.Final[tuple[re.Pattern[str], ...]] = (
+    re.compile(r'constraint "(?P<name>[^"]+)"'),  # PostgreSQL
+    re.compile(r"for key '(?:[^'.]+\.)?(?P<name>[^']+)'"),  # MySQL unique
+    re.compile(r"[Cc]heck constraint '(?P<name>[^']+)'"),  # MySQL check
+    re.compile(r"CHECK constraint failed: (?P<name>\w+)"),  # SQLite
+)
+# Columns of the violated unique constraint in the error message of the database backends.
+_UNIQUE_COLUMNS_PATTERNS: typing.Final[tuple[re.Pattern[str], ...]] = (
+    re.compile(r"UNIQUE constraint failed: (?P<columns>[\w.]+(?:, [\w.]+)*)"),  # SQLite
+    re.compile(r"Key \((?P<columns>[^)]+)\)="),  # PostgreSQL
+)
+
+
+class _Violation(typing.NamedTuple):
+    # Names the constraint may have in the database
+    names: frozenset[str]
+    # Columns of the unique constraint (None for the constraints which can't be matched by the columns)
+    columns: frozenset[str] | None
+    errors: _batch.ErrorDict
+
+
+def save[ModelT: django.db.models.Model](instance: ModelT, **save_kwargs: typing.Any) -> ModelT:  # noqa: ANN401
+    """
+    Save the instance, relying on the database to enforce the uniqueness checks and constraints
+    instead of querying it before the save (e.g., together with the "skip" constraint strategy).
+    :param save_kwargs: Passed to `instance.save()`.
+    :raise pydantic.ValidationError: If a unique field, `unique_together` or a constraint is violated.
+    """
+    using = save_kwargs.get("using") or django.db.router.db_for_write(type(instance), instance=instance)
+    with translate_integrity_errors(type(instance), using=using):
+        instance.save(**save_kwargs)
+    return instance
+
+
+@contextlib.contextmanager
+def translate_integrity_errors(
+    model: type[django.db.models.Model],
+    *,
+    using: str | None = None,
+    savepoint: bool = True,
+) -> typing.Iterator[None]:
+    """
+    Context manager translating the `IntegrityError` raised by writes of the `model` (`save()`, `bulk_create()`,
+    `update()`, ...) to `pydantic.ValidationError` in the same shape as if the data was validated by pydbull.
+    The errors which can't be matched to a unique field, `unique_together` or a constraint of the model are re-raised.
+    :param using: Database alias of the writes (routed by `db_for_write` of the `model` by default).
+    :param savepoint: Run the writes in `transaction.atomic()`, so that an outer transaction stays usable
+        after the error.
+    :raise pydantic.ValidationError: If a unique field, `unique_together` or a constraint is violated.
+    """
+    if using is None:
+        using = django.db.router.db_for_write(model)
+    try:
+        if savepoint:
+            with django.db.transaction.atomic(using=using):
+                yield
+        else:
+            yield
+    except django.db.IntegrityError as exc:
+        validation_error = integrity_error_to_validation_error(model, exc, using=using)
+        if validation_error is None:
+            raise
+        raise validation_error from exc
+
+
+def integrity_error_to_validation_error(
+    model: type[django.db.models.Model],
+    exc: django.db.IntegrityError,
+    using: str | None = None,
+) -> pydantic.ValidationError | None:
+    """
+    Match the `IntegrityError` to the violated unique field, `unique_together` or constraint of the model
+    (by the constraint name or the columns reported by the database).
+    :param using: Database alias the error was raised by (routed by `db_for_write` of the `model` by default).
+    :return: The validation error, or None if the error doesn't match any of them.
+    """
+    message = str(exc)
+    names: set[str] = set()
+    if constraint_name := getattr(getattr(exc.__cause__, "diag", None), "constraint_name", None):
+        names.add(constraint_name)
+    names.update(match["name"] for pattern in _CONSTRAINT_NAME_PATTERNS if (match := pattern.search(message)))
+    columns: frozenset[str] | None = None
+    for pattern in _UNIQUE_COLUMNS_PATTERNS:
+        if match := pattern.search(message):
+            # SQLite reports the columns as `table.column`
+            columns = frozenset(column.strip().rsplit(".", 1)[-1] for column in match["columns"].split(","))
+            break
+
+    violations = _violations(model, django.db.connections[using or django.db.router.db_for_write(model)])
+    for violation in violations:
+        if names & violation.names:
+            return DjangoAdapter.convert_to_pydantic_exception(django.core.exceptions.ValidationError(violation.errors))
+    for violation in violations:
+        if columns is not None and columns == violation.columns:
+            return DjangoAdapter.convert_to_pydantic_exception(django.core.exceptions.ValidationError(violation.errors))
+    return None
+
+
+def _violations(
+    model: type[django.db.models.Model],
+    connection: django.db.backends.base.base.BaseDatabaseWrapper,
+) -> list[_Violation]:
+    instance = model()
+    schema_editor = connection.schema_editor()
+    violations: list[_Violation] = []
+    for model_class in [model, *model._meta.get_parent_list()]:  # noqa: SLF001
+        table: str = model_class._meta.db_table  # noqa: SLF001
+        for field in model_class._meta.local_concrete_fields:  # noqa: SLF001
+            if not field.unique:
+                continue
+            names = {f"{table}_pkey", "PRIMARY"} if field.primary_key else {f"{table}_{field.column}_key", field.column}
+            violations.append(
+                _Violation(
+                    names=frozenset(names),
+                    columns=frozenset({field.column}),
+                    errors={field.name: [instance.unique_error_message(model_class, (field.name,))]},
+                ),
+            )
+        for unique_together in model_class._meta.unique_together:  # noqa: SLF001
+            columns = [model_class._meta.get_field(field_name).column for field_name in unique_together]  # noqa: SLF001
+            violations.append(
+                _Violation(
+                    names=frozenset({schema_editor._create_index_name(table, columns, suffix="_uniq")}),  # noqa: SLF001
+                    columns=frozenset(columns),
+                    errors={
+                        django.core.exceptions.NON_FIELD_ERRORS: [
+                            instance.unique_error_message(model_class, tuple(unique_together)),
+                        ],
+                    },
+                ),
+            )
+        violations.extend(
+            _constraint_violation(instance, model_class, constraint)
+            for constraint in model_class._meta.constraints  # noqa: SLF001
+        )
+    return violations
+
+
+def _constraint_violation(
+    instance: django.db.models.Model,
+    model_class: type[django.db.models.Model],
+    constraint: django.db.models.BaseConstraint,
+) -> _Violation:
+    """
+    The same error as raised by `constraint.validate()`.
+    """
+    fields: tuple[str, ...] = getattr(constraint, "fields", ())
+    columns: frozenset[str] | None = None
+    if isinstance(constraint, django.db.models.UniqueConstraint) and fields and constraint.condition is None:
+        columns = frozenset(model_class._meta.get_field(field_name).column for field_name in fields)  # noqa: SLF001
+        error = instance.unique_error_message(model_class, fields)
+    else:
+        error = django.core.exceptions.ValidationError(
+            constraint.get_violation_error_message(),
+            code=constraint.violation_error_code,
+        )
+    return _Violation(
+        names=frozenset({constraint.name}),
+        columns=columns,
+        errors=_constraints.add_constraint_error({}, constraint, error),
+    )
@@ -0,0 +1,108 @@
+"""
+Stable module path of the pydantic models created by pydbull (`@model_validator`, `model_to_pydantic`),
+so that the models and their instances can be pickled by reference (e.g., sent to worker processes or task queues)
+and unpickled without being validated again.
+
+The models are registered here under a name derived from the path of the decorated class, or from the call building
+the model (see `register_built`). If the model isn't registered in the unpickling process yet, the module
+of the decorated class is imported (building the model), or the model is built again by the call.
+The models are referenced weakly, so that registering them doesn't keep them alive (e.g., evicted
+from `pydbull.model_cache`).
+"""
+
+import importlib
+import json
+import re
+import typing
+import weakref
+
+import pydantic
+
+from pydbull.lazy import LazyModel
+
+__all__ = [
+    "import_object",
+    "register",
+    "register_built",
+]
+
+_ESCAPES: typing.Final[dict[str, str]] = {"_": "_u", ".": "_d", ":": "_c"}
+_ESCAPED: typing.Final[re.Pattern[str]] = re.compile(r"_(u|d|c|x[0-9a-f]{4})")
+
+_models: weakref.WeakValueDictionary[str, type[pydantic.BaseModel]] = weakref.WeakValueDictionary()
+
+
+def register(pyd_model: type[pydantic.BaseModel], import_path: str) -> None:
+    """
+    Register the model in this module, making it picklable by reference (replaces the previous registration).
+    :param import_path: `<module>:<qualified name>` of the decorated class the model replaces.
+    """
+    if pyd_model.__module__ == __name__ and _models.get(pyd_model.__qualname__) is pyd_model:
+        del _models[pyd_model.__qualname__]
+    name = _encode(import_path)
+    pyd_model.__module__ = __name__
+    pyd_model.__qualname__ = name
+    _models[name] = pyd_model
+
+
+def register_built(
+    pyd_model: type[pydantic.BaseModel],
+    build: typing.Callable[..., type[pydantic.BaseModel]],
+    **kwargs: typing.Any,  # noqa: ANN401
+) -> None:
+    """
+    Register the model built by the `build` function, making it picklable by reference.
+    When unpickled in another process, the model is built again by calling `build(**kwargs)`.
+    :param build: Function defined at the module level, registering the built model the same way.
+    :param kwargs: JSON serializable arguments of `build`.
+    """
+    register(
+        pyd_model,
+        f"{build.__module__}:{build.__qualname__}({json.dumps(kwargs, sort_keys=True, separators=(',', ':'))})",
+    )
+
+
+def import_object(import_path: str) -> typing.Any:  # noqa: ANN401
+    """
+    Import the object by its `<module>:<qualified name>`.
+    :raise ImportError, AttributeError: If there's no such object.
+    """
+    module_name, _, qualname = import_path.partition(":")
+    obj: typing.Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def __getattr__(name: str) -> type[pydantic.BaseModel]:
+    try:
+        return _models[name]
+    except KeyError:
+        pass
+    # The model isn't registered in this process yet, build it by importing the decorated class
+    # or by calling the function building it.
+    import_path, _, arguments = _decode(name).partition("(")
+    try:
+        obj: typing.Any = import_object(import_path)
+        if arguments:
+            obj = obj(**json.loads(arguments.removesuffix(")")))
+    except (ImportError, AttributeError, ValueError, TypeError) as e:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({e})") from e
+    if isinstance(obj, LazyModel):
+        obj.build()
+    try:
+        return _models[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def _encode(import_path: str) -> str:
+    return "".join(c if c.isascii() and c.isalnum() else _ESCAPES.get(c, f"_x{ord(c):04x}") for c in import_path)
+
+
+def _decode(name: str) -> str:
+    unescapes = {escape.removeprefix("_"): c for c, escape in _ESCAPES.items()}
+    return _ESCAPED.sub(
+        lambda match: unescapes.get(match[1]) or chr(int(match[1].removeprefix("x"), 16)),
+        name,
+    )
@@ -0,0 +1,89 @@
+import logging
+import threading
+import time
+import typing
+
+import pydantic
+import pydantic_core
+
+__all__ = [
+    "LazyModel",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModel:
+    """
+    Stand-in for a pydantic model built by `@pydbull.model_validator(..., lazy=True)`.
+    The model is built the first time it's needed - when it's instantiated, validates data, is subclassed
+    or any of its attributes (e.g., `model_json_schema`) is accessed - and is then used for everything.
+    It's not a class though, the uses requiring one aren't supported (e.g., `issubclass(lazy_model, pydantic.BaseModel)`
+    raises `TypeError` on older pydantic versions), those take the built model (`build()`).
+    """
+
+    def __init__(self, build: typing.Callable[[], type[pydantic.BaseModel]], name: str, source: type) -> None:
+        object.__setattr__(self, "_build", build)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_model", None)
+        # Seconds it took to build the model (None if not built yet).
+        object.__setattr__(self, "build_time", None)
+        object.__setattr__(self, "__name__", name)
+        object.__setattr__(self, "__qualname__", source.__qualname__.removesuffix(source.__name__) + name)
+        object.__setattr__(self, "__module__", source.__module__)
+        object.__setattr__(self, "__doc__", source.__doc__)
+
+    @property
+    def is_built(self) -> bool:
+        return self._model is not None
+
+    def build(self) -> type[pydantic.BaseModel]:
+        """
+        Build the model (only once, even if called from multiple threads at the same time).
+        """
+        if (model := self._model) is not None:
+            return model
+        with self._lock:
+            if (model := self._model) is not None:
+                return model
+            start = time.perf_counter()
+            model = self._build()
+            build_time = time.perf_counter() - start
+            object.__setattr__(self, "build_time", build_time)
+            object.__setattr__(self, "_model", model)
+            object.__setattr__(self, "_build", None)
+        logger.debug("Built lazy pydbull model %s in %.2f ms.", self.__qualname__, build_time * 1000)
+        return model
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> pydantic.BaseModel:  # noqa: ANN401
+        return self.build()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> typing.Any:  # noqa: ANN401
+        return getattr(self.build(), name)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:  # noqa: ANN401
+        setattr(self.build(), name, value)
+
+    def __mro_entries__(self, bases: tuple[typing.Any, ...]) -> tuple[type[pydantic.BaseModel]]:
+        # Subclassing the lazy model subclasses the built model.
+        return (self.build(),)
+
+    def __get_pydantic_core_schema__(
+        self,
+        source: typing.Any,  # noqa: ANN401
+        handler: pydantic.GetCoreSchemaHandler,
+    ) -> pydantic_core.CoreSchema:
+        # Used as an annotation of another pydantic model field.
+        return handler.generate_schema(self.build())
+
+    def __instancecheck__(self, instance: typing.Any) -> bool:  # noqa: ANN401
+        # There can't be any instances before the model is built.
+        return self._model is not None and isinstance(instance, self._model)
+
+    def __subclasscheck__(self, subclass: type) -> bool:
+        return subclass is self or (self._model is not None and issubclass(subclass, self._model))
+
+    def __repr__(self) -> str:
+        if self._model is not None:
+            return repr(self._model)
+        return f"<lazy model '{self.__module__}.{self.__qualname__}'>"
@@ -0,0 +1,294 @@
+import itertools
+import multiprocessing.context
+import typing
+
+import pydantic
+
+import pydbull
+from pydbull import _utils as utils
+from pydbull import parallel
+from pydbull import strategy as constraint_strategies
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "PydbullModelMixin",
+]
+
+DEFAULT_CHUNK_SIZE: typing.Final[int] = 1000
+
+
+class PydbullModelMixin:
+    """
+    Methods added to every pydantic model created by the `@pydbull.model_validator` decorator.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    async def amodel_validate(
+        cls,
+        obj: typing.Any,  # noqa: ANN401
+        *,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: dict[str, typing.Any] | None = None,
+        concurrency: int | None = None,
+    ) -> typing.Self:
+        """
+        Async version of `model_validate`.
+        The fields are validated right away, the extra model validators requiring database queries (e.g., uniqueness
+        checks) run without blocking the event loop (e.g., through Django's async ORM).
+        :param concurrency: Maximum number of the queries running at once (`pydbull.settings.async_concurrency`
+            by default).
+        """
+        skipped: list[pydantic.BaseModel] = []
+        pyd_model = cls.model_validate(
+            obj,
+            strict=strict,
+            from_attributes=from_attributes,
+            context={**(context or {}), utils.SKIP_MODEL_VALIDATORS_CONTEXT_KEY: skipped},
+        )
+        # The nested models first (the skipped models are collected from the innermost).
+        errors: list[tuple[pydantic.BaseModel, pydantic.ValidationError]] = []
+        for nested_model in skipped:
+            if nested_model is pyd_model:
+                continue
+            try:
+                await type(nested_model)._arun_model_checks(nested_model, context, concurrency)  # noqa: SLF001
+            except pydantic.ValidationError as exc:
+                errors.append((nested_model, exc))
+        if errors and (error := _nested_error(cls.__name__, pyd_model, errors)) is not None:
+            raise error
+        try:
+            return await cls._arun_model_checks(pyd_model, context, concurrency)
+        except pydantic.ValidationError as exc:
+            raise utils.with_title(exc, cls.__name__) from None
+
+    @classmethod
+    async def _arun_model_checks(
+        cls,
+        pyd_model: typing.Self,
+        context: dict[str, typing.Any] | None,
+        concurrency: int | None,
+    ) -> typing.Self:
+        adapter = pydbull.get_adapter(cls)
+        strategy = cls._pydbull_constraint_strategy(context)
+        if strategy == "db":
+            return await adapter.arun_extra_model_validators(pyd_model, context=context, concurrency=concurrency)
+        return constraint_strategies.run_model_checks(adapter, pyd_model, strategy, context)
+
+    @classmethod
+    def validate_many(
+        cls,
+        records: typing.Iterable[typing.Any],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: dict[str, typing.Any] | None = None,
+    ) -> list[typing.Self | pydantic.ValidationError]:
+        """
+        Validate many records at once.
+        The fields of each record are validated one by one, but the extra model validators (e.g., uniqueness checks
+        requiring a database query) run for the whole chunk of `chunk_size` records at once (those of the nested
+        models at once per model).
+        :return: List aligned with `records` containing either the validated model or its validation error
+            (in the same shape as if the record was validated by `model_validate`).
+        """
+        return [
+            result
+            for _, result in cls.iter_validate(
+                records,
+                chunk_size=chunk_size,
+                strict=strict,
+                from_attributes=from_attributes,
+                context=context,
+            )
+        ]
+
+    @classmethod
+    def iter_validate(
+        cls,
+        records: typing.Iterable[typing.Any],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: dict[str, typing.Any] | None = None,
+    ) -> typing.Iterator[tuple[int, typing.Self | pydantic.ValidationError]]:
+        """
+        Lazy version of `validate_many` holding only a chunk of `chunk_size` records in memory,
+        e.g., to validate a large file line by line.
+        The records are either anything accepted by `model_validate` (e.g., dicts or `csv.DictReader` rows),
+        or JSON strings / bytes (e.g., lines of a JSONL file) validated by `model_validate_json`.
+        Every record has its result, a blank line is invalid JSON (filter those out beforehand to skip them).
+        :return: Iterator of the index of the record and either the validated model or its validation error.
+        """
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be positive.")
+        batch_context = {**(context or {}), utils.SKIP_MODEL_VALIDATORS_CONTEXT_KEY: []}
+        index = 0
+        for chunk in itertools.batched(records, chunk_size):
+            results: list[typing.Self | pydantic.ValidationError] = []
+            nested: list[list[pydantic.BaseModel]] = []
+            for record in chunk:
+                result, record_nested = cls._validate_record(
+                    record,
+                    strict=strict,
+                    from_attributes=from_attributes,
+                    context=batch_context,
+                )
+                results.append(result)
+                nested.append(record_nested)
+            cls._run_model_checks_many(results, context, nested)
+            yield from enumerate(results, start=index)
+            index += len(results)
+
+    @classmethod
+    def validate_parallel(
+        cls,
+        records: typing.Iterable[typing.Any],
+        *,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        strict: bool | None = None,
+        from_attributes: bool | None = None,
+        context: dict[str, typing.Any] | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+        initializer: typing.Callable[[], object] | None = None,
+    ) -> list[typing.Self | pydantic.ValidationError]:
+        """
+        The same as `validate_many`, but the fields of the chunks of `chunk_size` records are validated in parallel
+        by a pool of `workers` processes (e.g., for models with many validators run in Python).
+        The extra model validators (e.g., uniqueness checks) run in the calling process, at once for each chunk.
+        The model has to be importable by the worker processes (defined at the module level)
+        and the records and `context` picklable.
+        :param mp_context: Multiprocessing context starting the worker processes (e.g., `get_context("spawn")`),
+            the default start method by default.
+        :param initializer: Called by each worker process before validating, the initializer of the adapter
+            by default (e.g., `django.setup()`, see `BaseAdapter.worker_initializer`).
+        """
+        return parallel.validate_parallel(
+            cls,
+            records,
+            workers=workers,
+            chunk_size=chunk_size,
+            strict=strict,
+            from_attributes=from_attributes,
+            context=context,
+            mp_context=mp_context,
+            initializer=initializer,
+        )
+
+    @classmethod
+    def _validate_record(
+        cls,
+        record: typing.Any,  # noqa: ANN401
+        *,
+        strict: bool | None,
+        from_attributes: bool | None,
+        context: dict[str, typing.Any],
+    ) -> tuple[typing.Self | pydantic.ValidationError, list[pydantic.BaseModel]]:
+        """
+        Validate the fields of the record (JSON strings / bytes by `model_validate_json`), the extra model validators
+        are skipped (`context` has to collect the skipped models, see `SKIP_MODEL_VALIDATORS_CONTEXT_KEY`).
+        :return: The result and the nested models whose extra model validators were skipped.
+        """
+        skipped: list[pydantic.BaseModel] = context[utils.SKIP_MODEL_VALIDATORS_CONTEXT_KEY]
+        skipped.clear()
+        try:
+            if isinstance(record, str | bytes | bytearray):
+                result = cls.model_validate_json(record, strict=strict, context=context)
+            else:
+                result = cls.model_validate(record, strict=strict, from_attributes=from_attributes, context=context)
+        except pydantic.ValidationError as exc:
+            return exc, []
+        return result, [pyd_model for pyd_model in skipped if pyd_model is not result]
+
+    @classmethod
+    def _pydbull_constraint_strategy(cls, context: dict[str, typing.Any] | None) -> "pydbull.ConstraintStrategy":
+        return constraint_strategies.resolve_constraint_strategy(
+            getattr(cls, "__pydbull_constraint_strategy__", None),
+            context,
+        )
+
+    @classmethod
+    def _run_model_checks_many(
+        cls,
+        results: list[typing.Self | pydantic.ValidationError],
+        context: dict[str, typing.Any] | None,
+        nested: typing.Sequence[typing.Sequence[pydantic.BaseModel]] | None = None,
+    ) -> None:
+        """
+        Run the extra model validators of the valid models of `results` at once,
+        replacing the invalid ones with their validation errors (in place).
+        :param nested: The nested models of each of `results` whose extra model validators were skipped
+            (see `_validate_record`), validated first.
+        """
+        if nested is not None:
+            cls._run_nested_model_checks_many(results, context, nested)
+        adapter = pydbull.get_adapter(cls)
+        strategy = cls._pydbull_constraint_strategy(context)
+        valid_indexes: list[int] = [i for i, result in enumerate(results) if isinstance(result, pydantic.BaseModel)]
+        if strategy != "db":
+            for i in valid_indexes:
+                try:
+                    constraint_strategies.run_model_checks(adapter, results[i], strategy, context)
+                except pydantic.ValidationError as exc:
+                    results[i] = utils.with_title(exc, cls.__name__)
+            return
+        if not valid_indexes:
+            return
+        errors = adapter.run_extra_model_validators_many([results[i] for i in valid_indexes])
+        for i, error in zip(valid_indexes, errors, strict=True):
+            if error is not None:
+                results[i] = utils.with_title(error, cls.__name__)
+
+    @classmethod
+    def _run_nested_model_checks_many(
+        cls,
+        results: list[typing.Self | pydantic.ValidationError],
+        context: dict[str, typing.Any] | None,
+        nested: typing.Sequence[typing.Sequence[pydantic.BaseModel]],
+    ) -> None:
+        """
+        Run the extra model validators of the nested models of `results` at once per model,
+        replacing the results with an invalid nested model with their validation errors (in place).
+        """
+        # nested pydantic model: [(index of `results`, nested model)]
+        groups: dict[type[PydbullModelMixin], list[tuple[int, pydantic.BaseModel]]] = {}
+        for i, result_nested in enumerate(nested):
+            for nested_model in result_nested:
+                groups.setdefault(type(nested_model), []).append((i, nested_model))
+        # index of `results`: [(nested model, its validation error)]
+        errors: dict[int, list[tuple[pydantic.BaseModel, pydantic.ValidationError]]] = {}
+        for nested_cls, items in groups.items():
+            nested_results: list[pydantic.BaseModel | pydantic.ValidationError] = [item for _, item in items]
+            nested_cls._run_model_checks_many(nested_results, context)  # noqa: SLF001
+            for (i, nested_model), nested_result in zip(items, nested_results, strict=True):
+                if isinstance(nested_result, pydantic.ValidationError):
+                    errors.setdefault(i, []).append((nested_model, nested_result))
+        for i, result_errors in errors.items():
+            if (error := _nested_error(cls.__name__, results[i], result_errors)) is not None:
+                results[i] = error
+
+
+def _nested_error(
+    title: str,
+    pyd_model: pydantic.BaseModel,
+    errors: typing.Iterable[tuple[pydantic.BaseModel, pydantic.ValidationError]],
+) -> pydantic.ValidationError | None:
+    """
+    Validation error of the model from the errors of its nested models, located by the fields containing them.
+    The same as in `model_validate`, the error of a nested model replaces the errors of the models containing it
+    (those wouldn't be validated).
+    """
+    loc_errors: list[tuple[tuple[str | int, ...], pydantic.ValidationError]] = [
+        (loc, error) for nested_model, error in errors if (loc := utils.find_loc(pyd_model, nested_model)) is not None
+    ]
+    loc_errors = [
+        (loc, error)
+        for loc, error in loc_errors
+        if not any(len(other) > len(loc) and other[: len(loc)] == loc for other, _ in loc_errors)
+    ]
+    return utils.with_loc_prefixes(title, loc_errors) if loc_errors else None
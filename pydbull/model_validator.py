@@ -4,6 +4,11 @@ import pydantic
 import pydantic.fields
 
 import pydbull
+from pydbull import _validators, generated
+from pydbull import strategy as constraint_strategies
+from pydbull._settings import settings
+from pydbull.lazy import LazyModel
+from pydbull.mixin import PydbullModelMixin
 
 __all__ = [
     "get_adapter",
@@ -16,78 +21,103 @@ __all__ = [
 def model_validator(  # noqa: ANN201
     model: type,
     adapter_cls: type["pydbull.BaseAdapter"] | None = None,
+    *,
+    lazy: bool | None = None,
+    constraint_strategy: "pydbull.ConstraintStrategy | None" = None,
 ):
     """
     Decorator to create a pydantic and
 
     :param model:
     :param adapter_cls:
+    :param lazy: Build the pydantic model only when it's first used (see `pydbull.LazyModel`).
+        Defaults to `pydbull.settings.lazy`.
+    :param constraint_strategy: How the checks requiring the database are run (see `pydbull.strategy`).
+        Defaults to `pydbull.settings.constraint_strategy`, can be overridden by the validation context.
     :return:
     """
+    if constraint_strategy is not None and constraint_strategy not in constraint_strategies.CONSTRAINT_STRATEGIES:
+        raise ValueError(f"Unknown constraint strategy `{constraint_strategy}`.")
     if adapter_cls is None:
         adapter_cls = _select_adapter(model)
+    if lazy is None:
+        lazy = settings.lazy
 
     def wrapper[T: pydantic.BaseModel](input_validator: type[T]) -> type[T]:
-        adapter = adapter_cls(model)
-        pydantic_fields: dict[str, tuple[type, pydantic.Field]] = {}
-        pydantic_method_validators: dict[str, typing.Callable] = {}  # method_name: method
-        for field_name, pyd_field_info in input_validator.__pydantic_fields__.items():
-            adapter.field_pre_check(field_name, pyd_field_info)
-            model_field = adapter.field_getter(field_name)
-            if model_field is None:
-                # The Field is not present in the model, just in the pydantic validator - nothing to add from the model.
-                continue
-
-            # Field enriched with additional information from the model.
-            enriched_field: pydantic.fields.FieldInfo = pydantic.Field(
-                default=adapter.get_default(model_field),
-                default_factory=adapter.get_default_factory(model_field),
-                max_length=adapter.get_max_length(model_field),
-                min_length=adapter.get_min_length(model_field),
-                pattern=adapter.get_pattern(model_field),
-                gt=adapter.get_greater_than(model_field),
-                ge=adapter.get_greater_than_or_equal(model_field),
-                lt=adapter.get_less_than(model_field),
-                le=adapter.get_less_than_or_equal(model_field),
-                max_digits=adapter.get_decimal_max_digits(model_field),
-                decimal_places=adapter.get_decimal_places(model_field),
-                multiple_of=adapter.get_multiple_of(model_field),
-                description=adapter.get_description(model_field),
-            )
-            pydantic_fields[field_name] = (
-                pyd_field_info.annotation,
-                pydantic.fields.FieldInfo.merge_field_infos(enriched_field, pyd_field_info),
-            )
-            # The same as putting @pydantic.field_validator(field_name) decorator on a method
-            # which contains the validator logic.
-            pydantic_method_validators[f"pydbull_{field_name}_field_extra_validators"] = pydantic.field_validator(
-                field_name,
-            )(
-                lambda value, field=model_field: adapter.run_extra_field_validators(field=field, value=value),
+        if lazy:
+            return typing.cast(
+                "type[T]",
+                LazyModel(
+                    lambda: _build_model_validator(model, adapter_cls, input_validator, constraint_strategy),
+                    name=input_validator.__name__.removesuffix("Validator"),
+                    source=input_validator,
+                ),
             )
+        return _build_model_validator(model, adapter_cls, input_validator, constraint_strategy)
+
+    return wrapper
 
-        # The same as putting @pydantic.model_validator decorator on a method which contains the validator logic.
-        pydantic_method_validators["pydbull_model_extra_validators"] = typing.cast(
-            "callable",
-            pydantic.model_validator(mode="after")(
-                adapter.run_extra_model_validators,
-            ),
-        )
 
-        # Need to re-create the pydantic model, because there is no other way (AFAIK) how to add validators to an
-        # existing model.
-        # Because we're setting the original validator as base, we inherit its methods.
-        pyd_model: type[pydantic.BaseModel] = pydantic.create_model(
-            input_validator.__name__.removesuffix("Validator"),
-            __base__=(input_validator,),
-            __validators__=pydantic_method_validators,
-            **pydantic_fields,
+def _build_model_validator[T: pydantic.BaseModel](
+    model: type,
+    adapter_cls: type["pydbull.BaseAdapter"],
+    input_validator: type[T],
+    constraint_strategy: "pydbull.ConstraintStrategy | None" = None,
+) -> type[T]:
+    adapter = adapter_cls(model)
+    pydantic_fields: dict[str, tuple[type, pydantic.Field]] = {}
+    pydantic_method_validators: dict[str, typing.Callable] = {}  # method_name: method
+    for field_name, pyd_field_info in input_validator.__pydantic_fields__.items():
+        adapter.field_pre_check(field_name, pyd_field_info)
+        model_field = adapter.field_getter(field_name)
+        if model_field is None:
+            # The Field is not present in the model, just in the pydantic validator - nothing to add from the model.
+            continue
+
+        # Field enriched with additional information from the model.
+        enriched_field: pydantic.fields.FieldInfo = adapter.get_field_spec(model_field).to_field_info()
+        merged_field: pydantic.fields.FieldInfo = pydantic.fields.FieldInfo.merge_field_infos(
+            enriched_field,
+            pyd_field_info,
+        )
+        pydantic_fields[field_name] = (pyd_field_info.annotation, merged_field)
+
+        # Only the validators not already enforced by the pydantic field constraints (those are validated
+        # by pydantic-core, without calling back to Python).
+        extra_validators = adapter.get_extra_field_validators(model_field, merged_field)
+        if not extra_validators and adapter.get_null_value(model_field) is None:
+            continue
+        pydantic_method_validators[f"pydbull_{field_name}_field_extra_validators"] = _validators.extra_field_validator(
+            adapter,
+            field_name,
+            model_field,
+            extra_validators,
         )
-        pyd_model.__pydbull_model__ = model
-        pyd_model.__pydbull_adapter__ = adapter
-        return pyd_model
 
-    return wrapper
+    pydantic_method_validators["pydbull_model_extra_validators"] = _validators.extra_model_validator(adapter)
+    if settings.tracer is not None:
+        # Defined last, so that it wraps the whole validation (the later model validators wrap the earlier ones).
+        pydantic_method_validators["pydbull_trace"] = _validators.trace_validator(adapter)
+
+    # Need to re-create the pydantic model, because there is no other way (AFAIK) how to add validators to an
+    # existing model.
+    # Because we're setting the original validator as base, we inherit its methods.
+    bases: tuple[type, ...] = (input_validator,)
+    if not issubclass(input_validator, PydbullModelMixin):
+        bases += (PydbullModelMixin,)
+    pyd_model: type[pydantic.BaseModel] = pydantic.create_model(
+        input_validator.__name__.removesuffix("Validator"),
+        __base__=bases,
+        __validators__=pydantic_method_validators,
+        **pydantic_fields,
+    )
+    pyd_model.__pydbull_model__ = model
+    pyd_model.__pydbull_adapter__ = adapter
+    pyd_model.__pydbull_constraint_strategy__ = constraint_strategy
+    if "<locals>" not in input_validator.__qualname__:
+        # Picklable by reference (the classes defined in functions can't be imported, so they aren't registered).
+        generated.register(pyd_model, f"{input_validator.__module__}:{input_validator.__qualname__}")
+    return pyd_model
 
 
 def model_to_pydantic[T: pydantic.BaseModel](
@@ -97,6 +127,8 @@ def model_to_pydantic[T: pydantic.BaseModel](
     exclude: typing.Collection[str] | None = None,
     field_annotations: dict[str, pydantic.fields.FieldInfo] | None = None,
     __base__: type[T] | None = None,
+    *,
+    depth: int | None = 0,
 ) -> type[pydantic.BaseModel] | type[T]:
     """
     Convenience function to create a pydantic model from a model (e.g., Django model).
@@ -107,6 +139,8 @@ def model_to_pydantic[T: pydantic.BaseModel](
     :param field_annotations: Any extra annotations for the fields in the pydantic model.
         Use as: {<field_name>: pydantic.Field(...), ...}
     :param __base__: Base of the pydantic model.
+    :param depth: Levels of the relations represented by the nested pydantic models of the related models
+        (None for all the levels, the cycles are resolved by forward references), the deeper ones are primary keys.
     """
     adapter_cls = _select_adapter(model)
     adapter = adapter_cls(model)
@@ -116,6 +150,7 @@ def model_to_pydantic[T: pydantic.BaseModel](
         exclude=exclude,
         field_annotations=field_annotations,
         __base__=__base__,
+        depth=depth,
     )
 
 
@@ -144,13 +179,4 @@ def get_adapter(model: type[pydantic.BaseModel] | pydantic.BaseModel, /) -> "pyd
 
 
 def _select_adapter(model: typing.Any) -> type["pydbull.BaseAdapter"]:  # noqa: ANN401
-    # TODO make it easy to override default adapter from settings
-    try:
-        import django.db.models
-
-        if issubclass(model, django.db.models.Model):
-            return pydbull.DjangoAdapter
-    except ImportError:
-        # Django not installed
-        pass
-    raise NotImplementedError(f"Adapter for {model} not implemented")
+    return pydbull.adapter_registry.get(model)
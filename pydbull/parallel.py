@@ -0,0 +1,102 @@
+import concurrent.futures
+import functools
+import itertools
+import multiprocessing.context
+import pickle
+import typing
+
+import pydantic
+
+import pydbull
+from pydbull import _utils as utils
+
+if typing.TYPE_CHECKING:
+    from pydbull.mixin import PydbullModelMixin
+
+__all__ = [
+    "validate_parallel",
+]
+
+# Result of a record validated by a worker process - the model with its nested models whose extra model validators
+# were skipped (pickled together, so that they stay the same objects), or the dumped validation error.
+type _WorkerResult = (
+    tuple[typing.Literal[True], pydantic.BaseModel, list[pydantic.BaseModel]] | tuple[typing.Literal[False], typing.Any]
+)
+
+
+def validate_parallel[T: "PydbullModelMixin"](
+    pyd_model: type[T],
+    records: typing.Iterable[typing.Any],
+    *,
+    workers: int | None = None,
+    chunk_size: int,
+    strict: bool | None = None,
+    from_attributes: bool | None = None,
+    context: dict[str, typing.Any] | None = None,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+    initializer: typing.Callable[[], object] | None = None,
+) -> list[T | pydantic.ValidationError]:
+    """
+    See `PydbullModelMixin.validate_parallel`.
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be positive.")
+    try:
+        pickle.dumps(pyd_model)
+    except (pickle.PicklingError, AttributeError) as e:
+        raise TypeError(f"`{pyd_model.__name__}` must be defined at the module level to be picklable ({e}).") from e
+    validate_chunk = functools.partial(
+        _validate_chunk,
+        pyd_model,
+        strict=strict,
+        from_attributes=from_attributes,
+        context={**(context or {}), utils.SKIP_MODEL_VALIDATORS_CONTEXT_KEY: []},
+    )
+    if initializer is None:
+        initializer = pydbull.get_adapter(pyd_model).worker_initializer()
+    results: list[T | pydantic.ValidationError] = []
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=initializer,
+    ) as executor:
+        # The chunks are validated in parallel, but returned in order.
+        for worker_results in executor.map(validate_chunk, itertools.batched(records, chunk_size)):
+            chunk_results = [_load_result(worker_result) for worker_result in worker_results]
+            nested = [worker_result[2] if worker_result[0] else [] for worker_result in worker_results]
+            pyd_model._run_model_checks_many(chunk_results, context, nested)  # noqa: SLF001
+            results.extend(chunk_results)
+    return results
+
+
+def _validate_chunk(
+    pyd_model: type["PydbullModelMixin"],
+    records: typing.Sequence[typing.Any],
+    *,
+    strict: bool | None,
+    from_attributes: bool | None,
+    context: dict[str, typing.Any],
+) -> list[_WorkerResult]:
+    """
+    Validate the fields of the records in a worker process.
+    The errors are sent back dumped, the errors of custom types can't be pickled.
+    """
+    worker_results: list[_WorkerResult] = []
+    for record in records:
+        result, nested = pyd_model._validate_record(  # noqa: SLF001
+            record,
+            strict=strict,
+            from_attributes=from_attributes,
+            context=context,
+        )
+        if isinstance(result, pydantic.ValidationError):
+            worker_results.append((False, utils.dump_validation_error(result)))
+        else:
+            worker_results.append((True, result, nested))
+    return worker_results
+
+
+def _load_result[T: pydantic.BaseModel](worker_result: _WorkerResult) -> T | pydantic.ValidationError:
+    if not worker_result[0]:
+        return utils.load_validation_error(worker_result[1])
+    return worker_result[1]
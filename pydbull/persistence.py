@@ -0,0 +1,55 @@
+import contextlib
+import typing
+
+import pydantic
+
+import pydbull
+from pydbull.mixin import DEFAULT_CHUNK_SIZE
+
+__all__ = [
+    "bulk_save",
+]
+
+
+def bulk_save(
+    pyd_models: typing.Sequence[pydantic.BaseModel],
+    *,
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+    update_conflicts: bool = False,
+    unique_fields: typing.Sequence[str] | typing.Mapping[type, typing.Sequence[str]] | None = None,
+) -> list[typing.Any]:
+    """
+    Save the validated models (e.g., to the database by `bulk_create` / `bulk_update`) at once, in chunks of
+    `batch_size`, inside a transaction.
+    The models validated against the same data model are saved together, in the order of their first occurrence.
+    :param update_conflicts: Update the existing instances conflicting on `unique_fields` instead of failing
+        (see `BaseAdapter.bulk_save`).
+    :param unique_fields: The fields of the data model, or the fields by data model if `pyd_models` are validated
+        against more of them.
+    :return: List aligned with `pyd_models` containing the primary keys of the saved instances.
+    """
+    # (adapter class, data model): indexes of `pyd_models`
+    groups: dict[tuple[type[pydbull.BaseAdapter], type], list[int]] = {}
+    for i, pyd_model in enumerate(pyd_models):
+        adapter = pydbull.get_adapter(pyd_model)
+        groups.setdefault((type(adapter), adapter.model), []).append(i)
+    if unique_fields is not None and not isinstance(unique_fields, typing.Mapping) and len(groups) > 1:
+        raise ValueError("`unique_fields` must be a mapping of the data models to their fields for more data models.")
+
+    pks: list[typing.Any] = [None] * len(pyd_models)
+    adapters = [pydbull.get_adapter(pyd_models[indexes[0]]) for indexes in groups.values()]
+    with contextlib.ExitStack() as stack:
+        for adapter in adapters:
+            stack.enter_context(adapter.transaction())
+        for adapter, indexes in zip(adapters, groups.values(), strict=True):
+            group_pks = adapter.bulk_save(
+                [pyd_models[i] for i in indexes],
+                batch_size=batch_size,
+                update_conflicts=update_conflicts,
+                unique_fields=(
+                    unique_fields.get(adapter.model) if isinstance(unique_fields, typing.Mapping) else unique_fields
+                ),
+            )
+            for i, pk in zip(indexes, group_pks, strict=True):
+                pks[i] = pk
+    return pks
@@ -0,0 +1,81 @@
+import typing
+
+import pydantic
+
+from pydbull._settings import settings
+
+if typing.TYPE_CHECKING:
+    import pydbull
+
+__all__ = [
+    "CONSTRAINT_STRATEGIES",
+    "CONSTRAINT_STRATEGY_CONTEXT_KEY",
+    "DEFERRED_CONTEXT_KEY",
+    "ConstraintStrategy",
+    "deferred_models",
+    "resolve_constraint_strategy",
+    "run_model_checks",
+]
+
+# How the extra model validators requiring the database (uniqueness checks, constraints, ...) are run:
+# - "db": validated right away, querying the database when needed.
+# - "python": only the checks which can be evaluated in Python (e.g., compiled `CheckConstraint`s), no queries.
+# - "skip": not validated at all, the database enforces them when the model is saved.
+# - "deferred": the validated models are collected (see `DEFERRED_CONTEXT_KEY`) to be checked later.
+ConstraintStrategy = typing.Literal["db", "python", "skip", "deferred"]
+CONSTRAINT_STRATEGIES: typing.Final[frozenset[str]] = frozenset(typing.get_args(ConstraintStrategy))
+
+# Validation context key overriding the strategy of the model,
+# e.g., `Model.model_validate(data, context={"pydbull_constraint_strategy": "skip"})`.
+CONSTRAINT_STRATEGY_CONTEXT_KEY: typing.Final[str] = "pydbull_constraint_strategy"
+# Validation context key of the collection (anything with `append()`, e.g., a list) receiving the validated models
+# when the strategy is "deferred".
+DEFERRED_CONTEXT_KEY: typing.Final[str] = "pydbull_deferred"
+
+
+def resolve_constraint_strategy(
+    model_strategy: ConstraintStrategy | None,
+    context: typing.Mapping[str, typing.Any] | None,
+) -> ConstraintStrategy:
+    """
+    Get the strategy to use - from the validation context, the model (`@model_validator(constraint_strategy=...)`)
+    or `pydbull.settings.constraint_strategy`, in this order.
+    :raise ValueError: If the strategy is unknown.
+    """
+    strategy = (context or {}).get(CONSTRAINT_STRATEGY_CONTEXT_KEY) or model_strategy or settings.constraint_strategy
+    if strategy not in CONSTRAINT_STRATEGIES:
+        raise ValueError(f"Unknown constraint strategy `{strategy}`, use one of {sorted(CONSTRAINT_STRATEGIES)}.")
+    return strategy
+
+
+def run_model_checks[T: pydantic.BaseModel](
+    adapter: "pydbull.BaseAdapter",
+    pyd_model: T,
+    strategy: ConstraintStrategy,
+    context: typing.Mapping[str, typing.Any] | None,
+) -> T:
+    """
+    Run the extra model validators of the (otherwise valid) model according to the `strategy`.
+    :raise pydantic.ValidationError: If the model is invalid.
+    :raise RuntimeError: If the strategy is "deferred", but there is nowhere to collect the model to.
+    """
+    if strategy == "db":
+        return adapter.run_extra_model_validators(pyd_model, context=None)
+    if strategy == "python":
+        return adapter.run_python_model_validators(pyd_model)
+    if strategy == "deferred":
+        deferred_models(context).append(pyd_model)
+    return pyd_model
+
+
+def deferred_models(context: typing.Mapping[str, typing.Any] | None) -> typing.MutableSequence[pydantic.BaseModel]:
+    """
+    :raise RuntimeError: If the validation context has nowhere to collect the deferred models to.
+    """
+    try:
+        return (context or {})[DEFERRED_CONTEXT_KEY]
+    except KeyError:
+        raise RuntimeError(
+            f'The "deferred" constraint strategy requires a `{DEFERRED_CONTEXT_KEY}` collection (e.g., a list)'
+            " in the validation context.",
+        ) from None
@@ -0,0 +1,155 @@
+import contextlib
+import contextvars
+import functools
+import random
+import time
+import typing
+
+__all__ = [
+    "PhaseTiming",
+    "Tracer",
+    "phase",
+    "trace_validation",
+    "traced",
+]
+
+
+class PhaseTiming(typing.NamedTuple):
+    """
+    Timing of a phase of the validation of a model.
+    """
+
+    # Name of the validated pydantic model
+    model: str
+    # "parse" (pydantic-core, including the nested models), "field_validators", "get_model_instance",
+    # "validate_unique", "validate_constraints" or "error_conversion"
+    phase: str
+    # Seconds
+    duration: float
+    # Number of the database queries issued by the phase, None if the adapter can't count them
+    queries: int | None
+    # Field of the "field_validators" phase
+    field: str | None = None
+
+
+class Tracer:
+    """
+    Receives the timings of the validation phases of the models created by pydbull.
+    Enabled by `pydbull.settings.tracer = pydbull.tracing.Tracer(callback)`, set before the traced models are built
+    (the models built without a tracer aren't traced, so that they don't pay for the tracing wrappers).
+    """
+
+    def __init__(self, callback: typing.Callable[[PhaseTiming], None], sample_rate: float = 1.0) -> None:
+        """
+        :param callback: Called with the timing of each phase when a traced validation ends.
+        :param sample_rate: Ratio of the validations to trace (e.g., `0.01` traces 1 % of them),
+            the rest runs without any measurement.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("`sample_rate` must be between 0 and 1.")
+        self.callback = callback
+        self.sample_rate = sample_rate
+
+    def sample(self) -> bool:
+        """
+        Whether to trace the validation.
+        """
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+
+class _Trace:
+    """
+    Timings of a single validation being traced.
+    """
+
+    __slots__ = ("queries", "timings")
+
+    def __init__(self) -> None:
+        # Number of the queries issued so far, None if they aren't counted
+        self.queries: int | None = None
+        # (phase, duration, queries, field)
+        self.timings: list[tuple[str, float, int | None, str | None]] = []
+
+    def count_query(self) -> None:
+        self.queries = (self.queries or 0) + 1
+
+
+_current_trace: contextvars.ContextVar[_Trace | None] = contextvars.ContextVar("pydbull_trace", default=None)
+
+
+def trace_validation[T](
+    tracer: Tracer,
+    model_name: str,
+    validate: typing.Callable[[], T],
+    count_queries: typing.Callable[[typing.Callable[[], None]], typing.ContextManager[None] | None],
+) -> T:
+    """
+    Run the validation, reporting the timings of its phases to the tracer.
+    :param count_queries: Returns a context manager calling the given function on each query issued inside it,
+        or None if the queries can't be counted (see `BaseAdapter.count_queries`).
+    """
+    trace = _Trace()
+    token = _current_trace.set(trace)
+    start = time.perf_counter()
+    try:
+        counter = count_queries(trace.count_query)
+        if counter is not None:
+            trace.queries = 0
+        with counter or contextlib.nullcontext():
+            return validate()
+    finally:
+        duration = time.perf_counter() - start
+        _current_trace.reset(token)
+        phases_duration = sum(timing[1] for timing in trace.timings)
+        phases_queries = sum(timing[2] or 0 for timing in trace.timings)
+        timings = [
+            *(PhaseTiming(model_name, *timing) for timing in trace.timings),
+            PhaseTiming(
+                model_name,
+                "parse",
+                duration - phases_duration,
+                None if trace.queries is None else trace.queries - phases_queries,
+            ),
+        ]
+        for timing in timings:
+            tracer.callback(timing)
+
+
+@contextlib.contextmanager
+def phase(name: str, field: str | None = None) -> typing.Iterator[None]:
+    """
+    Measure a phase of the traced validation (does nothing if the validation isn't traced).
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    queries = trace.queries
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.timings.append(
+            (
+                name,
+                time.perf_counter() - start,
+                None if queries is None else trace.queries - queries,
+                field,
+            ),
+        )
+
+
+def traced[**P, T](name: str, func: typing.Callable[P, T], field: str | None = None) -> typing.Callable[P, T]:
+    """
+    Wrap the function measuring its calls as the phase of the traced validation.
+    Cheaper than `phase()` when the validation isn't traced (e.g., for the validators called for every field).
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        if _current_trace.get() is None:
+            return func(*args, **kwargs)
+        with phase(name, field):
+            return func(*args, **kwargs)
+
+    return wrapper
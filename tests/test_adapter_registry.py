@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pydantic
+import pytest
+
+import pydbull
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+def test_get_adapter_walks_mro() -> None:
+    registry = pydbull.AdapterRegistry()
+    registry.register(Base, pydbull.PydanticAdapter)
+    assert registry.get(Base) is pydbull.PydanticAdapter
+    assert registry.get(Child) is pydbull.PydanticAdapter
+
+    with pytest.raises(NotImplementedError):
+        registry.get(int)
+    with pytest.raises(NotImplementedError):
+        registry.get(Base())
+
+
+def test_register_overrides_cached_adapter() -> None:
+    class ChildAdapter(pydbull.PydanticAdapter):
+        pass
+
+    registry = pydbull.AdapterRegistry()
+    registry.register(Base, pydbull.PydanticAdapter)
+    assert registry.get(Child) is pydbull.PydanticAdapter
+    registry.register(Child, ChildAdapter)
+    assert registry.get(Child) is ChildAdapter
+    assert registry.get(Base) is pydbull.PydanticAdapter
+
+
+def test_register_lazy() -> None:
+    registry = pydbull.AdapterRegistry()
+    registry.register_lazy(f"{__name__}.Base", "pydbull.adapter.pydantic_adapter.PydanticAdapter")
+    assert registry.get(Child) is pydbull.PydanticAdapter
+    with pytest.raises(NotImplementedError):
+        registry.get(pydantic.BaseModel)
+
+
+def test_import_does_not_import_django() -> None:
+    code = "import sys, pydbull; assert 'django' not in sys.modules; pydbull.DjangoAdapter; assert 'django' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
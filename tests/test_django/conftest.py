@@ -0,0 +1,26 @@
+import typing
+
+import django.db
+import django.db.models
+import pytest
+
+
+@pytest.fixture
+def create_tables(transactional_db: None) -> typing.Iterator[typing.Callable[..., None]]:
+    """
+    Create DB tables for models defined inside the tests (they're not created by the test DB setup).
+    The tables are dropped at the end of the test.
+    """
+    created: list[type[django.db.models.Model]] = []
+
+    def create(*models: type[django.db.models.Model]) -> None:
+        with django.db.connection.schema_editor() as schema_editor:
+            for model in models:
+                schema_editor.create_model(model)
+                created.append(model)
+
+    yield create
+
+    with django.db.connection.schema_editor() as schema_editor:
+        for model in reversed(created):
+            schema_editor.delete_model(model)
@@ -0,0 +1,98 @@
+import pydantic
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import models
+
+import pydbull
+
+
+class AsyncUniqueModel(models.Model):
+    code = models.CharField(max_length=10, unique=True)
+    a = models.IntegerField()
+    b = models.IntegerField()
+
+    class Meta:
+        unique_together = [("a", "b")]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(a__gte=0), name="async_a_gte_0"),
+            models.CheckConstraint(condition=models.Q(b__lt=models.F("a") * 10), name="async_b_lt_a_times_10"),
+            models.UniqueConstraint(fields=["b"], name="async_unique_b"),
+        ]
+
+
+@pydbull.model_validator(AsyncUniqueModel)
+class AsyncUniqueValidator(pydantic.BaseModel):
+    id: int | None = None
+    code: str
+    a: int
+    b: int
+
+
+@pytest.fixture
+def existing(create_tables) -> AsyncUniqueModel:
+    create_tables(AsyncUniqueModel)
+    return AsyncUniqueModel.objects.create(code="taken", a=1, b=1)
+
+
+def test_amodel_validate_valid(existing: AsyncUniqueModel) -> None:
+    pyd_model = async_to_sync(AsyncUniqueValidator.amodel_validate)({"code": "free", "a": 2, "b": 2})
+    assert isinstance(pyd_model, AsyncUniqueValidator)
+    assert pyd_model.code == "free"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"code": "taken", "a": 2, "b": 2},
+        {"code": "free", "a": 1, "b": 1},
+        {"code": "free", "a": -1, "b": -100},
+        {"code": "taken", "a": 1, "b": 100},
+        {"code": "taken", "a": 2, "b": 1},
+    ],
+)
+def test_amodel_validate_errors_same_as_sync(existing: AsyncUniqueModel, data: dict) -> None:
+    with pytest.raises(pydantic.ValidationError) as sync_exc:
+        AsyncUniqueValidator.model_validate(data)
+    with pytest.raises(pydantic.ValidationError) as async_exc:
+        async_to_sync(AsyncUniqueValidator.amodel_validate)(data, concurrency=1)
+    assert async_exc.value.errors() == sync_exc.value.errors()
+    assert async_exc.value.title == sync_exc.value.title
+
+
+def test_amodel_validate_excludes_updated_instance(existing: AsyncUniqueModel) -> None:
+    data = {"id": existing.pk, "code": "taken", "a": 1, "b": 1}
+    assert async_to_sync(AsyncUniqueValidator.amodel_validate)(data).id == existing.pk
+
+
+def test_amodel_validate_non_existing_instance(existing: AsyncUniqueModel) -> None:
+    with pytest.raises(pydantic.ValidationError) as sync_exc:
+        AsyncUniqueValidator.model_validate({"id": existing.pk + 1, "code": "x", "a": 1, "b": 1})
+    with pytest.raises(pydantic.ValidationError) as async_exc:
+        async_to_sync(AsyncUniqueValidator.amodel_validate)({"id": existing.pk + 1, "code": "x", "a": 1, "b": 1})
+    assert async_exc.value.errors() == sync_exc.value.errors()
+
+
+class AsyncChildModel(models.Model):
+    name = models.CharField(max_length=10)
+    parent = models.ForeignKey(AsyncUniqueModel, on_delete=models.CASCADE)
+
+
+@pydbull.model_validator(AsyncChildModel)
+class AsyncChildValidator(pydantic.BaseModel):
+    name: str
+    parent: AsyncUniqueValidator
+
+
+def test_amodel_validate_nested_models_checked(create_tables, existing: AsyncUniqueModel) -> None:
+    create_tables(AsyncChildModel)
+    data = {"name": "child", "parent": {"code": "taken", "a": 2, "b": 2}}
+    with pytest.raises(pydantic.ValidationError) as sync_exc:
+        AsyncChildValidator.model_validate(data)
+    with pytest.raises(pydantic.ValidationError) as async_exc:
+        async_to_sync(AsyncChildValidator.amodel_validate)(data)
+    assert async_exc.value.errors() == sync_exc.value.errors()
+    assert [error["loc"] for error in async_exc.value.errors()] == [("parent", "code")]
+    assert async_exc.value.title == sync_exc.value.title
+
+    data = {"name": "child", "parent": {"code": "free", "a": 2, "b": 2}}
+    assert async_to_sync(AsyncChildValidator.amodel_validate)(data).parent.code == "free"
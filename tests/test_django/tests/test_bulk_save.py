@@ -0,0 +1,162 @@
+import uuid
+
+import django.db
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+
+
+class BulkAuthor(models.Model):
+    name = models.CharField(max_length=20, unique=True)
+    note = models.CharField(max_length=20, default="")
+
+
+class BulkBook(models.Model):
+    title = models.CharField(max_length=20)
+    author = models.ForeignKey(BulkAuthor, on_delete=models.CASCADE)
+
+
+@pydbull.model_validator(BulkAuthor)
+class BulkAuthorValidator(pydantic.BaseModel):
+    id: int | None = None
+    name: str
+
+
+@pydbull.model_validator(BulkBook)
+class BulkBookValidator(pydantic.BaseModel):
+    title: str
+    author: int
+
+
+def skip_checks(pyd_model: type[pydantic.BaseModel], **data: object) -> pydantic.BaseModel:
+    return pyd_model.model_validate(data, context={"pydbull_constraint_strategy": "skip"})
+
+
+@pytest.fixture
+def tables(create_tables) -> None:
+    create_tables(BulkAuthor, BulkBook)
+
+
+def test_bulk_save_creates_and_updates(tables: None, django_assert_num_queries) -> None:
+    existing = BulkAuthor.objects.create(name="old", note="kept")
+    pyd_models = [
+        BulkAuthorValidator(name="a"),
+        BulkAuthorValidator(id=existing.pk, name="renamed"),
+        BulkAuthorValidator(name="b"),
+    ]
+    # Insert of the new and update of the existing authors in a transaction (no query per instance)
+    with django_assert_num_queries(4):
+        pks = pydbull.bulk_save(pyd_models)
+    assert pks[1] == existing.pk
+    assert dict(BulkAuthor.objects.values_list("pk", "name")) == {pks[0]: "a", pks[1]: "renamed", pks[2]: "b"}
+    # Fields not in the data are kept
+    assert BulkAuthor.objects.get(pk=existing.pk).note == "kept"
+
+
+def test_bulk_save_many_models_in_batches(tables: None) -> None:
+    author = BulkAuthor.objects.create(name="author")
+    pyd_models: list[pydantic.BaseModel] = [BulkBookValidator(title=f"book {i}", author=author.pk) for i in range(5)]
+    pyd_models.insert(2, BulkAuthorValidator(name="other"))
+    pks = pydbull.bulk_save(pyd_models, batch_size=2)
+    assert pks[2] == BulkAuthor.objects.get(name="other").pk
+    assert [BulkBook.objects.get(pk=pk).title for pk in pks[:2] + pks[3:]] == [f"book {i}" for i in range(5)]
+
+
+def test_bulk_save_update_conflicts(tables: None) -> None:
+    existing = BulkAuthor.objects.create(name="taken", note="kept")
+    pks = pydbull.bulk_save(
+        [skip_checks(BulkAuthorValidator, name="taken"), BulkAuthorValidator(name="new")],
+        update_conflicts=True,
+        unique_fields=["name"],
+    )
+    assert pks[0] == existing.pk
+    assert BulkAuthor.objects.count() == 2
+    # Only the unique fields in the data, nothing to update
+    assert BulkAuthor.objects.get(pk=existing.pk).note == "kept"
+
+
+@pydbull.model_validator(BulkAuthor)
+class BulkAuthorNoteValidator(pydantic.BaseModel):
+    id: int | None = None
+    name: str
+    note: str
+
+
+def test_bulk_save_pks_not_returned_by_database(tables: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    # e.g., MySQL
+    monkeypatch.setattr(type(django.db.connection.features), "can_return_rows_from_bulk_insert", False)
+    existing = BulkAuthor.objects.create(name="taken", note="old")
+    pks = pydbull.bulk_save([BulkAuthorValidator(name="a"), BulkAuthorValidator(name="b")])
+    assert pks == [BulkAuthor.objects.get(name="a").pk, BulkAuthor.objects.get(name="b").pk]
+
+    pks = pydbull.bulk_save(
+        [skip_checks(BulkAuthorNoteValidator, name="taken", note="new"), BulkAuthorNoteValidator(name="c", note="")],
+        update_conflicts=True,
+        unique_fields=["name"],
+    )
+    assert pks == [existing.pk, BulkAuthor.objects.get(name="c").pk]
+    assert BulkAuthor.objects.get(pk=existing.pk).note == "new"
+
+
+def test_bulk_save_is_atomic(tables: None) -> None:
+    BulkAuthor.objects.create(name="taken")
+    with pytest.raises(django.db.IntegrityError):
+        pydbull.bulk_save([BulkBookValidator(title="book", author=1), skip_checks(BulkAuthorValidator, name="taken")])
+    assert not BulkBook.objects.exists()
+
+
+class BulkToken(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    name = models.CharField(max_length=20)
+
+
+@pydbull.model_validator(BulkToken)
+class BulkTokenValidator(pydantic.BaseModel):
+    id: str
+    name: str
+
+
+def test_bulk_save_default_pk_created(create_tables) -> None:
+    create_tables(BulkToken)
+    existing = BulkToken.objects.create(name="old")
+    new = BulkTokenValidator(name="new")
+    # The primary key is set by the default, but not carried by the data.
+    assert new.id is not None
+    pks = pydbull.bulk_save([new, BulkTokenValidator(id=existing.pk.hex, name="renamed")])
+    assert pks == [new.id, existing.pk.hex]
+    assert dict(BulkToken.objects.values_list("pk", "name")) == {new.id: "new", existing.pk: "renamed"}
+
+
+def test_bulk_save_unique_fields_per_model(tables: None) -> None:
+    author = BulkAuthor.objects.create(name="taken", note="kept")
+    pyd_models = [skip_checks(BulkAuthorValidator, name="taken"), BulkBookValidator(title="book", author=author.pk)]
+    with pytest.raises(ValueError, match="unique_fields"):
+        pydbull.bulk_save(pyd_models, update_conflicts=True, unique_fields=["name"])
+    pks = pydbull.bulk_save(pyd_models, update_conflicts=True, unique_fields={BulkAuthor: ["name"]})
+    assert pks[0] == author.pk
+    assert BulkBook.objects.get(pk=pks[1]).title == "book"
+
+
+class BulkShelf(models.Model):
+    name = models.CharField(max_length=20)
+    books = models.ManyToManyField(BulkBook)
+
+
+@pydbull.model_validator(BulkShelf)
+class BulkShelfValidator(pydantic.BaseModel):
+    name: str
+    books: list[int] = []
+
+
+def test_bulk_save_many_to_many_refused(create_tables, tables: None) -> None:
+    create_tables(BulkShelf)
+    author = BulkAuthor.objects.create(name="author")
+    book = BulkBook.objects.create(title="book", author=author)
+    with pytest.raises(ValueError, match="many-to-many"):
+        pydbull.bulk_save([BulkShelfValidator(name="empty"), BulkShelfValidator(name="shelf", books=[book.pk])])
+    assert not BulkShelf.objects.exists()
+    # Nothing lost
+    (pk,) = pydbull.bulk_save([BulkShelfValidator(name="empty")])
+    assert BulkShelf.objects.get(pk=pk).name == "empty"
@@ -0,0 +1,170 @@
+import pydantic
+import pytest
+from django.db import connection, models
+from django.db.models import F, Q
+from django.test.utils import CaptureQueriesContext
+
+import pydbull
+
+
+class CheckConstraintModel(models.Model):
+    name = models.CharField(max_length=100, null=True)
+    low = models.IntegerField(null=True)
+    high = models.IntegerField(null=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(check=Q(low__lte=F("high")), name="low_lte_high"),
+            models.CheckConstraint(check=Q(name__regex=r"^\w*$"), name="not_compilable"),
+        ]
+
+
+CONDITIONS: list[Q] = [
+    Q(name="abc"),
+    Q(name__iexact="ABC"),
+    Q(low__lt=5),
+    Q(low__lte=5),
+    Q(low__gt=5),
+    Q(low__gte=5),
+    Q(low__in=[1, 5, None]),
+    Q(low__isnull=True),
+    Q(low__isnull=False),
+    Q(name=None),
+    Q(low__range=(1, 5)),
+    Q(name__startswith="ab"),
+    Q(name__contains="bc"),
+    Q(low__lt=F("high")),
+    Q(low__gt=1) & Q(high__lt=10),
+    Q(low__gt=1) | Q(high__lt=10),
+    ~Q(low__gt=1),
+    ~(Q(name="abc") | Q(low=5)),
+    Q(low__gt=1) ^ Q(high__gt=1),
+]
+
+VALUES: list[dict] = [
+    {"name": "abc", "low": 5, "high": 10},
+    {"name": "xyz", "low": 1, "high": 0},
+    {"name": None, "low": None, "high": 3},
+    {"name": "abcd", "low": 7, "high": None},
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("condition", CONDITIONS, ids=str)
+@pytest.mark.parametrize("values", VALUES, ids=str)
+def test_compiled_check_constraint_matches_database(condition: Q, values: dict) -> None:
+    class ConditionModel(models.Model):
+        name = models.CharField(max_length=100, null=True)
+        low = models.IntegerField(null=True)
+        high = models.IntegerField(null=True)
+
+        class Meta:
+            constraints = [models.CheckConstraint(check=condition, name="condition")]
+
+    predicates = pydbull.DjangoAdapter(ConditionModel).check_constraint_predicates
+    assert "condition" in predicates
+
+    instance = ConditionModel(**values)
+    db_result = condition.check(instance._get_field_expression_map(meta=ConditionModel._meta))
+    assert (predicates["condition"](values) is not False) is db_result
+
+
+def test_check_constraints_not_compilable_are_left_to_database() -> None:
+    adapter = pydbull.DjangoAdapter(CheckConstraintModel)
+    assert set(adapter.check_constraint_predicates) == {"low_lte_high"}
+
+
+@pytest.mark.django_db
+def test_check_constraint_validated_without_query(django_assert_num_queries) -> None:
+    class NoQueryCheckModel(models.Model):
+        low = models.IntegerField()
+        high = models.IntegerField()
+
+        class Meta:
+            constraints = [models.CheckConstraint(check=Q(low__lte=F("high")), name="low_lte_high")]
+
+    @pydbull.model_validator(NoQueryCheckModel)
+    class NoQueryCheckValidator(pydantic.BaseModel):
+        low: int
+        high: int
+
+    with django_assert_num_queries(0):
+        NoQueryCheckValidator(low=1, high=2)
+        with pytest.raises(pydantic.ValidationError) as err:
+            NoQueryCheckValidator(low=3, high=2)
+    assert err.value.errors()[0]["msg"] == "Constraint “low_lte_high” is violated."
+
+
+class CaseCheckModel(models.Model):
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(check=Q(name__contains="AB"), name="name_contains_ab"),
+            models.CheckConstraint(check=~Q(name="ABC"), name="name_not_abc"),
+        ]
+
+
+@pydbull.model_validator(CaseCheckModel)
+class CaseCheckValidator(pydantic.BaseModel):
+    name: str
+
+
+@pytest.mark.django_db
+def test_check_constraint_case_insensitive_lookup_left_to_database() -> None:
+    # `LIKE` of SQLite is case-insensitive, unlike `in` of Python - the database decides.
+    assert connection.vendor == "sqlite"
+    with CaptureQueriesContext(connection) as queries:
+        CaseCheckValidator(name="abc")
+    assert [query["sql"] for query in queries if "_check" in query["sql"]] == [
+        """SELECT 1 AS "_check" WHERE COALESCE(('abc' LIKE '%AB%' ESCAPE '\\'), 1)""",
+    ]
+    # `=` is case-sensitive in SQLite as well, validated in Python (the query is of `name_contains_ab`).
+    with CaptureQueriesContext(connection) as queries, pytest.raises(pydantic.ValidationError) as err:
+        CaseCheckValidator(name="ABC")
+    assert err.value.errors()[0]["msg"] == "Constraint “name_not_abc” is violated."
+    assert all("LIKE" in query["sql"] for query in queries if "_check" in query["sql"])
+
+
+class CaseInsensitiveCheckModel(models.Model):
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(check=Q(name__iexact="école") | Q(name__icontains="straße"), name="name_i"),
+            models.CheckConstraint(check=Q(name__gt="0"), name="name_gt_0"),
+        ]
+
+
+@pydbull.model_validator(CaseInsensitiveCheckModel)
+class CaseInsensitiveCheckValidator(pydantic.BaseModel):
+    name: str
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", ["école", "ÉCOLE", "STRASSE", "straße", "Straße"])
+def test_check_constraint_non_ascii_case_insensitive_lookup_matches_database(name: str) -> None:
+    # `.upper()` of Python differs from the database for the non-ASCII strings (e.g., "ß" is "SS").
+    instance = CaseInsensitiveCheckModel(name=name)
+    condition = CaseInsensitiveCheckModel._meta.constraints[0].check
+    db_result = condition.check(instance._get_field_expression_map(meta=CaseInsensitiveCheckModel._meta))
+    try:
+        CaseInsensitiveCheckValidator(name=name)
+    except pydantic.ValidationError as err:
+        assert [error["msg"] for error in err.errors()] == ["Constraint “name_i” is violated."]
+        assert not db_result
+    else:
+        assert db_result
+
+
+def test_check_constraint_string_ordering_left_to_database() -> None:
+    # Ordered by the collation in the database, by the code points in Python.
+    assert set(pydbull.DjangoAdapter(CaseInsensitiveCheckModel).check_constraint_predicates) == {"name_i"}
+
+
+@pytest.mark.django_db
+def test_check_constraint_case_sensitive_database(monkeypatch: pytest.MonkeyPatch, django_assert_num_queries) -> None:
+    monkeypatch.setattr(connection, "vendor", "postgresql")
+    with django_assert_num_queries(0), pytest.raises(pydantic.ValidationError) as err:
+        CaseCheckValidator(name="abc")
+    assert err.value.errors()[0]["msg"] == "Constraint “name_contains_ab” is violated."
@@ -0,0 +1,75 @@
+import typing
+
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+
+
+def _dynamic_choices() -> list[tuple[str, str]]:
+    return [("a", "A")]
+
+
+class ChoicesModel(models.Model):
+    size = models.CharField(max_length=2, choices=[("S", "Small"), ("M", "Medium"), ("L", "Large")])
+    color = models.CharField(
+        max_length=10,
+        choices=[("Warm", [("red", "Red"), ("orange", "Orange")]), ("Cold", [("blue", "Blue")])],
+        blank=True,
+    )
+    priority = models.IntegerField(choices=[(1, "Low"), (2, "High")], null=True, blank=True)
+    dynamic = models.CharField(max_length=1, choices=_dynamic_choices)
+
+
+def test_str_choices_literal() -> None:
+    pyd_model = pydbull.model_to_pydantic(ChoicesModel, fields=["size", "color"])
+
+    assert pyd_model.__pydantic_fields__["size"].annotation == typing.Literal["S", "M", "L"]
+    # Grouped choices are flattened, blank fields accept the empty string.
+    assert pyd_model.__pydantic_fields__["color"].annotation == typing.Literal["red", "orange", "blue", ""] | None
+    assert pyd_model(size="M", color="").size == "M"
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pyd_model(size="XL", color="Warm")
+    assert [error["type"] for error in exc_info.value.errors()] == ["literal_error", "literal_error"]
+    assert pyd_model.model_json_schema()["properties"]["size"]["enum"] == ["S", "M", "L"]
+
+
+def test_max_length_implied_by_choices() -> None:
+    adapter = pydbull.DjangoAdapter(ChoicesModel)
+    size_field = ChoicesModel._meta.get_field("size")
+    pyd_model = adapter.model_to_pydantic(fields=["size"])
+
+    assert adapter.get_max_length(size_field) is None
+    assert adapter.get_extra_field_validators(size_field, pyd_model.__pydantic_fields__["size"]) == ()
+
+
+def test_int_choices_validated_after_conversion() -> None:
+    pyd_model = pydbull.model_to_pydantic(ChoicesModel, fields=["priority"])
+
+    assert pyd_model.__pydantic_fields__["priority"].annotation == int | None
+    assert pyd_model(priority="2").priority == 2
+    assert pyd_model(priority=None).priority is None
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pyd_model(priority=3)
+    assert exc_info.value.errors()[0]["type"] == "literal_error"
+    assert pyd_model.model_json_schema()["properties"]["priority"]["anyOf"][0]["enum"] == [1, 2]
+
+
+def test_choices_on_model_validator() -> None:
+    @pydbull.model_validator(ChoicesModel)
+    class ChoicesModelValidator(pydantic.BaseModel):
+        size: str
+        priority: int | None = None
+
+    assert ChoicesModelValidator(size="S", priority=1).size == "S"
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        ChoicesModelValidator(size="XL", priority=3)
+    assert [error["loc"] for error in exc_info.value.errors()] == [("size",), ("priority",)]
+
+
+def test_callable_choices_not_validated() -> None:
+    pyd_model = pydbull.model_to_pydantic(ChoicesModel, fields=["dynamic"])
+
+    assert pyd_model.__pydantic_fields__["dynamic"].annotation is str
+    assert pyd_model(dynamic="b").dynamic == "b"
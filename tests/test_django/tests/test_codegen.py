@@ -0,0 +1,132 @@
+import importlib.util
+import pathlib
+import types
+
+import pydantic
+import pytest
+from django.core.validators import MinValueValidator, RegexValidator
+from django.db import models
+
+import pydbull
+from pydbull.__main__ import main
+from pydbull.codegen import render_module
+from pydbull.django.codegen import generate_module, resolve_models
+from pydbull.tracing import Tracer
+
+
+class CodegenColor(models.TextChoices):
+    RED = "red"
+    BLUE = "blue"
+
+
+def _default_tags() -> str:
+    return "tag"
+
+
+class CodegenUser(models.Model):
+    name = models.CharField(
+        max_length=5,
+        validators=[RegexValidator(r"^[A-Z]"), RegexValidator(r"x", inverse_match=True)],
+        help_text="Name",
+    )
+    email = models.EmailField()
+    age = models.IntegerField(validators=[MinValueValidator(18)], null=True, blank=True)
+    color = models.CharField(max_length=4, choices=CodegenColor.choices, default=CodegenColor.RED)
+    price = models.DecimalField(max_digits=5, decimal_places=2, default="1.50")
+    tags = models.CharField(max_length=10, default=_default_tags)
+
+
+MODEL_PATH = f"{__name__}.CodegenUser"
+
+
+def _import(path: pathlib.Path) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location("generated_models", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def generated(tmp_path: pathlib.Path) -> types.ModuleType:
+    path = tmp_path / "generated_models.py"
+    assert main(["generate", MODEL_PATH, "-o", str(path)]) == 0
+    return _import(path)
+
+
+def test_resolve_models() -> None:
+    assert resolve_models(MODEL_PATH) == [CodegenUser]
+    assert resolve_models("tests.CodegenUser") == [CodegenUser]
+    with pytest.raises(ValueError):
+        resolve_models("tests.DoesNotExist")
+    with pytest.raises(ValueError):
+        resolve_models(f"{__name__}.CodegenColor")
+
+
+def test_generated_module_source() -> None:
+    source = generate_module([MODEL_PATH])
+    assert "class CodegenUser(pydbull.PydbullModelMixin, pydantic.BaseModel):" in source
+    assert (
+        "    name: typing.Annotated[str, pydantic.Field(max_length=5, pattern='^[A-Z]', description='Name')]"
+    ) in source
+    assert (
+        f"    color: typing.Annotated[typing.Literal['red', 'blue'], pydantic.Field(default={__name__}.CodegenColor.RED"
+    ) in source
+    # The regex validator with `inverse_match` can't be enforced by pydantic.
+    assert (
+        "pydbull_name_field_extra_validators = pydbull.codegen.field_validator(_codegenuser_adapter, 'name', (1,))"
+    ) in source
+    assert "pydbull_age_field_extra_validators" not in source
+
+
+def test_generated_model_matches_runtime_model(generated: types.ModuleType) -> None:
+    runtime_model = pydbull.model_to_pydantic(CodegenUser)
+    generated_model = generated.CodegenUser
+    assert pydbull.get_model(generated_model) is CodegenUser
+    assert isinstance(pydbull.get_adapter(generated_model), pydbull.DjangoAdapter)
+    assert generated_model.model_json_schema()["properties"] == runtime_model.model_json_schema()["properties"]
+
+    data = {"name": "John", "email": "john@example.com"}
+    assert generated_model(**data).model_dump() == runtime_model(**data).model_dump()
+    assert generated_model(**data).tags == "tag"
+    for invalid in [{"name": "john"}, {"name": "Johnx"}, {"age": 17}, {"email": "john"}]:
+        with pytest.raises(pydantic.ValidationError) as generated_error:
+            generated_model(**{**data, **invalid})
+        with pytest.raises(pydantic.ValidationError) as runtime_error:
+            runtime_model(**{**data, **invalid})
+        assert generated_error.value.errors() == runtime_error.value.errors()
+
+
+def test_check_generated_module(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture) -> None:
+    path = tmp_path / "generated_models.py"
+    assert main(["generate", MODEL_PATH, "--check", "-o", str(path)]) == 1
+    assert main(["generate", MODEL_PATH, "-o", str(path)]) == 0
+    assert main(["generate", MODEL_PATH, "--check", "-o", str(path)]) == 0
+
+    path.write_text(path.read_text().replace("max_length=5", "max_length=6"))
+    assert main(["generate", MODEL_PATH, "--check", "-o", str(path)]) == 1
+    assert "is out of date" in capsys.readouterr().err
+
+
+def test_generated_model_traced_with_tracer(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "generated_models.py"
+    assert main(["generate", MODEL_PATH, "-o", str(path)]) == 0
+    assert "pydbull_trace" not in _import(path).CodegenUser.__pydantic_decorators__.model_validators
+
+    monkeypatch.setattr(pydbull.settings, "tracer", Tracer(print))
+    assert "pydbull_trace" in _import(path).CodegenUser.__pydantic_decorators__.model_validators
+
+
+class CodegenNote(models.Model):
+    text = models.CharField(max_length=10, blank=True)
+
+
+@pydbull.model_validator(CodegenNote)
+class CodegenNoteValidator(pydantic.BaseModel):
+    text: str | None = None
+
+
+def test_generated_model_converts_null(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "generated_models.py"
+    path.write_text(render_module([CodegenNoteValidator]))
+    # The null of the non-nullable `CharField` is converted to an empty string, as by the runtime model.
+    assert _import(path).CodegenNote(text=None).text == CodegenNoteValidator(text=None).text == ""
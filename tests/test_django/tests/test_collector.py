@@ -0,0 +1,82 @@
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+
+
+class CollectorAuthor(models.Model):
+    name = models.CharField(max_length=20, unique=True)
+
+
+class CollectorBook(models.Model):
+    title = models.CharField(max_length=20, unique=True)
+    author = models.ForeignKey(CollectorAuthor, on_delete=models.CASCADE)
+
+
+@pydbull.model_validator(CollectorAuthor)
+class CollectorAuthorValidator(pydantic.BaseModel):
+    id: int | None = None
+    name: str
+
+
+@pydbull.model_validator(CollectorBook)
+class CollectorBookValidator(pydantic.BaseModel):
+    id: int | None = None
+    title: str
+    author: CollectorAuthorValidator
+
+
+@pytest.fixture
+def existing(create_tables) -> CollectorBook:
+    create_tables(CollectorAuthor, CollectorBook)
+    author = CollectorAuthor.objects.create(name="taken")
+    return CollectorBook.objects.create(title="taken", author=author)
+
+
+def test_flush_checks_all_models_at_once(existing: CollectorBook, django_assert_num_queries) -> None:
+    collector = pydbull.Collector()
+    author_id = existing.author_id
+    with django_assert_num_queries(0):
+        new_author = CollectorAuthorValidator.model_validate({"name": "new"}, context=collector.context)
+        taken_author = CollectorAuthorValidator.model_validate({"name": "taken"}, context=collector.context)
+        book = CollectorBookValidator.model_validate(
+            {"title": "new", "author": {"id": author_id, "name": "taken"}},
+            context=collector.context,
+        )
+        missing_author_book = CollectorBookValidator.model_validate(
+            {"title": "other", "author": {"id": author_id + 1, "name": "missing"}},
+            context=collector.context,
+        )
+        missing_book = CollectorBookValidator.model_validate(
+            {"id": existing.pk + 1, "title": "taken", "author": {"id": author_id, "name": "taken"}},
+            context=collector.context,
+        )
+    # Including the nested authors
+    assert len(collector) == 8
+
+    # Authors: the existing instances and the unique name,
+    # books: the existing instances, their authors and the unique title
+    with django_assert_num_queries(5):
+        results = collector.flush()
+    assert len(collector) == 0
+
+    pyd_model_to_error = {id(pyd_model): error for pyd_model, error in results}
+    assert pyd_model_to_error[id(new_author)] is None
+    assert pyd_model_to_error[id(book)] is None
+
+    taken_error = pyd_model_to_error[id(taken_author)]
+    with pytest.raises(pydantic.ValidationError) as exc:
+        CollectorAuthorValidator(name="taken")
+    assert taken_error.errors() == exc.value.errors()
+    assert taken_error.title == "CollectorAuthor"
+
+    assert [error["loc"] for error in pyd_model_to_error[id(missing_author_book)].errors()] == [("author", "id")]
+    assert [error["type"] for error in pyd_model_to_error[id(missing_book)].errors()] == ["does_not_exist"]
+
+
+def test_flush_field_errors_are_raised_right_away() -> None:
+    collector = pydbull.Collector()
+    with pytest.raises(pydantic.ValidationError):
+        CollectorAuthorValidator.model_validate({"name": "x" * 21}, context=collector.context)
+    assert collector.flush() == []
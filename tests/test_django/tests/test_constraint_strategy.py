@@ -0,0 +1,104 @@
+import pydantic
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import models
+
+import pydbull
+
+
+class StrategyModel(models.Model):
+    code = models.CharField(max_length=10, unique=True)
+    a = models.IntegerField()
+    b = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(condition=models.Q(a__gte=0), name="strategy_a_gte_0"),
+            models.CheckConstraint(condition=models.Q(b__lte=models.F("a")), name="strategy_b_lte_a"),
+        ]
+
+
+class StrategyValidator(pydantic.BaseModel):
+    code: str
+    a: int
+
+
+DbStrategy = pydbull.model_validator(StrategyModel)(StrategyValidator)
+PythonStrategy = pydbull.model_validator(StrategyModel, constraint_strategy="python")(StrategyValidator)
+SkipStrategy = pydbull.model_validator(StrategyModel, constraint_strategy="skip")(StrategyValidator)
+DeferredStrategy = pydbull.model_validator(StrategyModel, constraint_strategy="deferred")(StrategyValidator)
+
+
+@pytest.fixture
+def existing(create_tables) -> StrategyModel:
+    create_tables(StrategyModel)
+    return StrategyModel.objects.create(code="taken", a=1)
+
+
+def test_db_strategy(existing: StrategyModel) -> None:
+    with pytest.raises(pydantic.ValidationError) as exc:
+        DbStrategy(code="taken", a=1)
+    assert [error["loc"] for error in exc.value.errors()] == [("code",)]
+
+
+def test_python_strategy(existing: StrategyModel, django_assert_num_queries) -> None:
+    with django_assert_num_queries(0):
+        # uniqueness requires a query
+        assert PythonStrategy(code="taken", a=1).code == "taken"
+        with pytest.raises(pydantic.ValidationError) as exc:
+            PythonStrategy(code="free", a=-1)
+    assert [error["msg"] for error in exc.value.errors()] == ["Constraint “strategy_a_gte_0” is violated."]
+
+
+def test_python_strategy_skips_constraints_over_unknown_fields() -> None:
+    # `b` isn't a field of the pydantic model, its value is known only to the database
+    assert PythonStrategy(code="free", a=0).a == 0
+
+
+def test_skip_strategy(existing: StrategyModel, django_assert_num_queries) -> None:
+    with django_assert_num_queries(0):
+        assert SkipStrategy(code="taken", a=-1).a == -1
+
+
+def test_deferred_strategy(existing: StrategyModel, django_assert_num_queries) -> None:
+    deferred: list[pydantic.BaseModel] = []
+    with django_assert_num_queries(0):
+        pyd_model = DeferredStrategy.model_validate(
+            {"code": "taken", "a": 1},
+            context={pydbull.strategy.DEFERRED_CONTEXT_KEY: deferred},
+        )
+    assert deferred == [pyd_model]
+
+    with pytest.raises(RuntimeError, match="pydbull_deferred"):
+        DeferredStrategy(code="taken", a=1)
+
+
+def test_context_overrides_model_strategy(existing: StrategyModel) -> None:
+    context = {pydbull.strategy.CONSTRAINT_STRATEGY_CONTEXT_KEY: "skip"}
+    assert DbStrategy.model_validate({"code": "taken", "a": 1}, context=context).code == "taken"
+    with pytest.raises(pydantic.ValidationError):
+        SkipStrategy.model_validate({"code": "taken", "a": 1}, context={"pydbull_constraint_strategy": "db"})
+
+
+def test_global_strategy(existing: StrategyModel, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pydbull.settings, "constraint_strategy", "skip")
+    assert DbStrategy(code="taken", a=1).code == "taken"
+    # The strategy of the model has precedence
+    with pytest.raises(pydantic.ValidationError):
+        PythonStrategy(code="free", a=-1)
+
+
+def test_validate_many_and_amodel_validate_strategy(existing: StrategyModel) -> None:
+    results = PythonStrategy.validate_many([{"code": "taken", "a": 1}, {"code": "free", "a": -1}])
+    assert isinstance(results[0], PythonStrategy)
+    assert isinstance(results[1], pydantic.ValidationError)
+    assert results[1].title == PythonStrategy.__name__
+
+    assert async_to_sync(SkipStrategy.amodel_validate)({"code": "taken", "a": 1}).code == "taken"
+    with pytest.raises(pydantic.ValidationError):
+        async_to_sync(PythonStrategy.amodel_validate)({"code": "free", "a": -1})
+
+
+def test_unknown_strategy() -> None:
+    with pytest.raises(ValueError, match="Unknown constraint strategy"):
+        pydbull.model_validator(StrategyModel, constraint_strategy="sometimes")
@@ -5,7 +5,7 @@ import pydbull
 
 from django.core.validators import (
     MaxValueValidator, MinLengthValidator, RegexValidator, MinValueValidator,
-    StepValueValidator, URLValidator,
+    StepValueValidator, URLValidator, MaxLengthValidator,
 )
 from django.core.exceptions import ValidationError as DjValidationError
 from django.db.models import (
@@ -195,6 +195,61 @@ def test_run_extra_field_validators_with_multiple_validators() -> None:
     ]
 
 
+def test_build_extra_field_validator() -> None:
+    adapter = pydbull.DjangoAdapter(DjangoModel)  # any model
+    field = CharField(max_length=5, validators=[MinLengthValidator(2)])
+    validator = adapter.build_extra_field_validator(field, field.validators)
+
+    assert validator("ABC") == "ABC"
+    # Null is converted to an empty string for non-nullable CharField, empty values are not validated
+    assert validator(None) == ""
+    assert adapter.build_extra_field_validator(CharField(null=True), [])(None) is None
+
+    with pytest.raises(pydantic.ValidationError) as err:
+        validator("ABCDEF")
+    with pytest.raises(pydantic.ValidationError) as run_err:
+        adapter.run_extra_field_validators(field, value="ABCDEF")
+    assert err.value.errors() == run_err.value.errors()
+    assert [error["type"] for error in err.value.errors()] == ["too_long"]
+
+
+def test_get_extra_field_validators() -> None:
+    adapter = pydbull.DjangoAdapter(DjangoModel)  # any model
+
+    def custom_validator(value: str) -> None:
+        pass
+
+    field = CharField(max_length=5, validators=[MinLengthValidator(2), RegexValidator(r"^[A-Z].*$"), custom_validator])
+    # Constraints copied to the pydantic field by `model_validator` are enforced by pydantic
+    pyd_field = pydantic.Field(max_length=5, min_length=2, pattern=r"^[A-Z].*$")
+    assert custom_validator in adapter.get_extra_field_validators(field, pyd_field)
+    assert not any(
+        isinstance(validator, (MaxLengthValidator, MinLengthValidator, RegexValidator))
+        for validator in adapter.get_extra_field_validators(field, pyd_field)
+    )
+
+    # Looser pydantic constraints don't enforce the Django validators
+    extra_validators = adapter.get_extra_field_validators(field, pydantic.Field(max_length=10))
+    assert [type(validator) for validator in extra_validators if validator is not custom_validator] == [
+        MinLengthValidator, RegexValidator, MaxLengthValidator,
+    ]
+
+
+def test_get_extra_field_validators_integer_and_decimal() -> None:
+    adapter = pydbull.DjangoAdapter(DjangoModel)  # any model
+    assert adapter.get_extra_field_validators(IntegerField(), pydantic.Field(ge=INT_MIN, le=INT_MAX)) == ()
+    assert adapter.get_extra_field_validators(
+        IntegerField(validators=[MinValueValidator(5), StepValueValidator(2)]),
+        pydantic.Field(ge=5, le=INT_MAX, multiple_of=2),
+    ) == ()
+    # pydantic normalizes the decimals before checking the digits, Django doesn't.
+    assert len(adapter.get_extra_field_validators(
+        DecimalField(max_digits=5, decimal_places=2),
+        pydantic.Field(max_digits=5, decimal_places=2),
+    )) == 1
+    assert len(adapter.get_extra_field_validators(DecimalField(max_digits=5, decimal_places=2), pydantic.Field())) == 1
+
+
 def test_run_extra_model_validators(mocker: pytest_mock.MockFixture) -> None:
     class Model(DjangoModel):
         name = CharField(max_length=5)
@@ -202,7 +257,7 @@ def test_run_extra_model_validators(mocker: pytest_mock.MockFixture) -> None:
         class Meta:
             constraints = [
                 UniqueConstraint(fields=["name"], name="unique_name"),
-                CheckConstraint(check=~Q(name="INVALID"), name="check_name"),
+                CheckConstraint(check=~Q(name="NOPE"), name="check_name"),
             ]
 
     adapter = pydbull.DjangoAdapter(Model)
@@ -210,9 +265,15 @@ def test_run_extra_model_validators(mocker: pytest_mock.MockFixture) -> None:
 
     uc_mock = mocker.patch.object(UniqueConstraint, "validate")
     cc_mock = mocker.patch.object(CheckConstraint, "validate")
+    q_check_mock = mocker.patch.object(Q, "check")
     adapter.run_extra_model_validators(pyd_model(name="TEST"), context=None)
-    cc_mock.assert_called()
     uc_mock.assert_called()
+    # The check constraint is evaluated in Python, without querying the DB
+    cc_mock.assert_not_called()
+    q_check_mock.assert_not_called()
+    with pytest.raises(pydantic.ValidationError) as err:
+        pyd_model(name="NOPE")
+    assert [error["msg"] for error in err.value.errors()] == ["Constraint “check_name” is violated."]
 
 
 def test_run_extra_model_validators_with_errors(mocker: pytest_mock.MockFixture) -> None:
@@ -222,7 +283,8 @@ def test_run_extra_model_validators_with_errors(mocker: pytest_mock.MockFixture)
         class Meta:
             constraints = [
                 UniqueConstraint(fields=["name"], name="unique_name"),
-                CheckConstraint(check=~Q(name="INVALID"), name="check_name"),
+                # `regex` lookup can't be evaluated in Python, so the constraint is validated by the DB
+                CheckConstraint(check=~Q(name__regex="^INVALID$"), name="check_name"),
             ]
 
     adapter = pydbull.DjangoAdapter(Model)
@@ -459,3 +521,27 @@ def test_model_to_pydantic_m2m() -> None:
     assert pyd_model.__pydantic_fields__["m2m_field_blank"].annotation == list[int] | None
     assert pyd_adapter.get_min_length(pyd_model.__pydantic_fields__["m2m_field"]) == 1
     assert pyd_adapter.get_min_length(pyd_model.__pydantic_fields__["m2m_field_blank"]) == PydanticUndefined
+
+
+def test_build_field_spec() -> None:
+    class Model(DjangoModel):
+        field = IntegerField(
+            validators=[MinValueValidator(1), MaxValueValidator(10), MinValueValidator(5), StepValueValidator(2)],
+            help_text="Description",
+        )
+
+    adapter = pydbull.DjangoAdapter(Model)
+    field = Model._meta.get_field("field")
+    spec = adapter.get_field_spec(field)
+    assert spec.ge == 1  # the first validator of the kind
+    assert spec.le == 10
+    assert spec.gt == PydanticUndefined
+    assert spec.multiple_of == 2
+    assert spec.description == "Description"
+    assert spec.validators == tuple(field.validators)
+    assert adapter.get_field_spec(field) is spec
+    assert adapter.get_greater_than_or_equal(field) == 1
+    with pytest.raises(AttributeError):
+        spec.ge = 2
+    with pytest.raises(AttributeError):
+        spec.other = 2
@@ -79,3 +79,98 @@ def test_get_django_instance_skips_m2m() -> None:
     pyd_model = TestModel(nested_list=[NestedModel(name="test")])
     dj_instance = pydbull.get_adapter(pyd_model).get_model_instance(pyd_model)  # If the M2M field was set, this would raise an error.
     assert type(dj_instance) is DjangoModel
+
+
+def test_get_django_instances_loads_existing_instances_at_once(create_tables, django_assert_num_queries) -> None:
+    class BulkInstanceModel(django.db.models.Model):
+        name = django.db.models.CharField(max_length=100)
+        note = django.db.models.CharField(max_length=100, default="")
+
+    create_tables(BulkInstanceModel)
+    existing = [BulkInstanceModel.objects.create(name=f"name {i}", note=f"note {i}") for i in range(3)]
+
+    @pydbull.model_validator(BulkInstanceModel)
+    class BulkInstanceValidator(pydantic.BaseModel):
+        id: int | None = None
+        name: str
+
+    data = [
+        BulkInstanceValidator.model_construct(id=existing[0].pk, name="new 0"),
+        BulkInstanceValidator.model_construct(id=None, name="created"),
+        BulkInstanceValidator.model_construct(id=existing[2].pk, name="new 2"),
+        BulkInstanceValidator.model_construct(id=999, name="missing"),
+    ]
+    with django_assert_num_queries(1):
+        instances = pydbull.get_adapter(BulkInstanceValidator).get_model_instances(data)
+        # Columns not set from the data are loaded
+        assert [instance.note for instance in instances[:3]] == ["note 0", "", "note 2"]
+
+    assert [instance.name for instance in instances[:3]] == ["new 0", "created", "new 2"]
+    assert instances[0].pk == existing[0].pk
+    assert instances[1].pk is None
+    assert isinstance(instances[3], pydantic.ValidationError)
+    assert instances[3].errors() == [
+        {
+            "ctx": {},
+            "input": 999,
+            "loc": ("id",),
+            "msg": "bulk instance model with id 999 does not exist.",
+            "type": "does_not_exist",
+        },
+    ]
+
+
+def test_validate_non_existing_instance(create_tables) -> None:
+    class MissingInstanceModel(django.db.models.Model):
+        name = django.db.models.CharField(max_length=100)
+
+    create_tables(MissingInstanceModel)
+
+    @pydbull.model_validator(MissingInstanceModel)
+    class MissingInstanceValidator(pydantic.BaseModel):
+        id: int | None = None
+        name: str
+
+    with pytest.raises(pydantic.ValidationError) as err:
+        MissingInstanceValidator(id=1, name="test")
+    assert [(error["loc"], error["type"]) for error in err.value.errors()] == [(("id",), "does_not_exist")]
+
+    results = MissingInstanceValidator.validate_many([{"id": 1, "name": "test"}])
+    assert results[0].errors() == err.value.errors()
+
+
+def test_validate_existing_instance_queries(create_tables, django_assert_num_queries) -> None:
+    class QueriedPublisher(django.db.models.Model):
+        name = django.db.models.CharField(max_length=100, unique=True)
+
+    class QueriedBook(django.db.models.Model):
+        title = django.db.models.CharField(max_length=100, unique=True)
+        note = django.db.models.CharField(max_length=100, default="")
+        publisher = django.db.models.ForeignKey(QueriedPublisher, on_delete=django.db.models.CASCADE)
+
+    create_tables(QueriedPublisher, QueriedBook)
+    publisher = QueriedPublisher.objects.create(name="publisher")
+    book = QueriedBook.objects.create(title="title", note="kept", publisher=publisher)
+
+    @pydbull.model_validator(QueriedPublisher)
+    class QueriedPublisherValidator(pydantic.BaseModel):
+        id: int | None = None
+        name: str
+
+    @pydbull.model_validator(QueriedBook)
+    class QueriedBookValidator(pydantic.BaseModel):
+        id: int | None = None
+        title: str
+        publisher: QueriedPublisherValidator
+
+    data = {"id": book.pk, "title": "new", "publisher": {"id": publisher.pk, "name": "publisher"}}
+    # Each existing instance is loaded once (the nested one isn't loaded again for the book), plus a unique check each
+    with django_assert_num_queries(4):
+        pyd_model = QueriedBookValidator(**data)
+
+    with django_assert_num_queries(1):
+        instance = pydbull.get_adapter(pyd_model).get_model_instance(pyd_model)
+        assert instance.publisher.pk == publisher.pk
+    # Only the columns not set from the data are loaded
+    assert instance.get_deferred_fields() == set()
+    assert (instance.title, instance.note) == ("new", "kept")
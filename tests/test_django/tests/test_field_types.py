@@ -0,0 +1,93 @@
+import django.core.exceptions
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+from pydbull.django import field_type_registry
+
+
+class UpperCharField(models.CharField):
+    pass
+
+
+def validate_phone_number(value: str) -> None:
+    if not value.startswith("+") or not value[1:].isdigit():
+        raise django.core.exceptions.ValidationError("Invalid phone number.", code="phone_number")
+
+
+class PhoneNumberField(models.CharField):
+    default_validators = [validate_phone_number]
+
+    def __init__(self, **kwargs) -> None:
+        kwargs.setdefault("max_length", 16)
+        super().__init__(**kwargs)
+
+
+class UnsupportedField(models.Field):
+    pass
+
+
+field_type_registry.register(
+    PhoneNumberField,
+    str,
+    constraints={"pattern": r"^[+][0-9]+$"},
+    enforced_validators=[validate_phone_number],
+)
+
+
+class FieldTypesModel(models.Model):
+    upper = UpperCharField(max_length=5)
+    count = models.PositiveIntegerField()
+    phone = PhoneNumberField()
+
+
+def test_field_type_resolved_by_mro() -> None:
+    assert field_type_registry.get(UpperCharField) is field_type_registry.get(models.CharField)
+    assert field_type_registry.get(UnsupportedField) is None
+
+    pyd_model = pydbull.model_to_pydantic(FieldTypesModel, fields=["upper", "count"])
+
+    assert pyd_model.__pydantic_fields__["upper"].annotation is str
+    assert pyd_model.__pydantic_fields__["count"].annotation is int
+    with pytest.raises(pydantic.ValidationError, match="at most 5 characters"):
+        pyd_model(upper="ABCDEF", count=1)
+
+
+def test_field_type_native_constraints() -> None:
+    adapter = pydbull.DjangoAdapter(FieldTypesModel)
+    phone_field = FieldTypesModel._meta.get_field("phone")
+    pyd_model = adapter.model_to_pydantic(fields=["phone"])
+
+    assert adapter.get_pattern(phone_field) == r"^[+][0-9]+$"
+    # Enforced by the pattern in pydantic-core, not run in Python.
+    assert adapter.get_extra_field_validators(phone_field, pyd_model.__pydantic_fields__["phone"]) == ()
+    assert pyd_model(phone="+420123456789").phone == "+420123456789"
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pyd_model(phone="420123456789")
+    assert exc_info.value.errors()[0]["type"] == "string_pattern_mismatch"
+
+
+def test_field_type_constraints_overridden() -> None:
+    @pydbull.model_validator(FieldTypesModel)
+    class PhoneValidator(pydantic.BaseModel):
+        phone: str = pydantic.Field(pattern=r"^[a-z+0-9]+$")
+
+    phone_field = FieldTypesModel._meta.get_field("phone")
+    adapter = pydbull.get_adapter(PhoneValidator)
+    # The pattern doesn't enforce the registered validator anymore, so it's run in Python.
+    assert adapter.get_extra_field_validators(phone_field, PhoneValidator.__pydantic_fields__["phone"]) == (
+        validate_phone_number,
+    )
+    assert PhoneValidator(phone="+420123456789").phone == "+420123456789"
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        PhoneValidator(phone="abc")
+    assert exc_info.value.errors()[0]["type"] == "phone_number"
+
+
+def test_field_type_not_registered() -> None:
+    class UnsupportedModel(models.Model):
+        unsupported = UnsupportedField()
+
+    with pytest.raises(ValueError, match="Unsupported field type: UnsupportedField"):
+        pydbull.model_to_pydantic(UnsupportedModel)
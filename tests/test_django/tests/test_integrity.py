@@ -0,0 +1,109 @@
+import django.db
+import pydantic
+import pytest
+import pytest_mock
+from django.db import models, transaction
+
+import pydbull
+from pydbull.django import integrity_error_to_validation_error, save, translate_integrity_errors
+
+
+class IntegrityModel(models.Model):
+    code = models.CharField(max_length=10, unique=True)
+    a = models.IntegerField()
+    b = models.IntegerField()
+    c = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = [("a", "b")]
+        constraints = [
+            models.UniqueConstraint(fields=["b", "c"], name="integrity_unique_b_c"),
+            models.CheckConstraint(condition=models.Q(a__gte=0), name="integrity_a_gte_0"),
+        ]
+
+
+@pydbull.model_validator(IntegrityModel)
+class IntegrityValidator(pydantic.BaseModel):
+    code: str
+    a: int
+    b: int
+    c: int = 0
+
+
+@pytest.fixture
+def existing(create_tables) -> IntegrityModel:
+    create_tables(IntegrityModel)
+    return IntegrityModel.objects.create(code="taken", a=1, b=1, c=1)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"code": "taken", "a": 2, "b": 2},
+        {"code": "free", "a": 1, "b": 1, "c": 2},
+        {"code": "free", "a": 2, "b": 1, "c": 1},
+        {"code": "free", "a": -1, "b": 2},
+    ],
+)
+def test_save_errors_same_as_validation(existing: IntegrityModel, data: dict) -> None:
+    with pytest.raises(pydantic.ValidationError) as validation_exc:
+        IntegrityValidator.model_validate(data)
+    with pytest.raises(pydantic.ValidationError) as save_exc:
+        save(IntegrityModel(**data))
+    assert save_exc.value.errors() == validation_exc.value.errors()
+    assert isinstance(save_exc.value.__cause__, django.db.IntegrityError)
+
+
+def test_save_valid(existing: IntegrityModel) -> None:
+    instance = save(IntegrityModel(code="free", a=2, b=2))
+    assert instance.pk is not None
+
+
+def test_translate_bulk_create_and_update(existing: IntegrityModel) -> None:
+    with pytest.raises(pydantic.ValidationError) as exc, translate_integrity_errors(IntegrityModel):
+        IntegrityModel.objects.bulk_create([IntegrityModel(code="free", a=2, b=2), IntegrityModel(code="taken", a=3, b=3)])
+    assert [error["loc"] for error in exc.value.errors()] == [("code",)]
+    assert not IntegrityModel.objects.filter(code="free").exists()
+
+    with pytest.raises(pydantic.ValidationError) as exc, translate_integrity_errors(IntegrityModel):
+        IntegrityModel.objects.filter(pk=existing.pk).update(a=-1)
+    assert exc.value.errors()[0]["msg"] == "Constraint “integrity_a_gte_0” is violated."
+
+
+def test_outer_transaction_usable_after_error(existing: IntegrityModel) -> None:
+    with transaction.atomic():
+        with pytest.raises(pydantic.ValidationError):
+            save(IntegrityModel(code="taken", a=2, b=2))
+        save(IntegrityModel(code="free", a=2, b=2))
+    assert IntegrityModel.objects.count() == 2
+
+
+def test_unmatched_integrity_error_is_reraised(existing: IntegrityModel) -> None:
+    with pytest.raises(django.db.IntegrityError), translate_integrity_errors(IntegrityModel):
+        IntegrityModel.objects.filter(pk=existing.pk).update(code=None)
+
+
+@pytest.mark.parametrize(
+    ("message", "loc"),
+    [
+        # PostgreSQL
+        ('duplicate key value violates unique constraint "integrity_unique_b_c"', ()),
+        ('duplicate key value violates unique constraint "x"\nDETAIL:  Key (code)=(taken) already exists.', ("code",)),
+        ('new row for relation "t" violates check constraint "integrity_a_gte_0"', ()),
+        # MySQL
+        ("(1062, \"Duplicate entry 'taken' for key 'test_django_integritymodel.code'\")", ("code",)),
+        ("(3819, \"Check constraint 'integrity_a_gte_0' is violated.\")", ()),
+    ],
+)
+def test_integrity_error_messages_of_other_backends(message: str, loc: tuple) -> None:
+    validation_error = integrity_error_to_validation_error(IntegrityModel, django.db.IntegrityError(message))
+    assert validation_error is not None
+    assert [error["loc"] for error in validation_error.errors()] == [loc]
+    assert integrity_error_to_validation_error(IntegrityModel, django.db.IntegrityError("something else")) is None
+
+
+def test_database_routed_by_model(mocker: pytest_mock.MockFixture) -> None:
+    db_for_write = mocker.spy(django.db.router, "db_for_write")
+    with pytest.raises(pydantic.ValidationError), translate_integrity_errors(IntegrityModel, savepoint=False):
+        raise django.db.IntegrityError("UNIQUE constraint failed: test_django_integritymodel.code")
+    db_for_write.assert_called_once_with(IntegrityModel)
@@ -0,0 +1,66 @@
+import json
+import typing
+
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+import pydbull.codegen
+
+
+class OrderItem(pydantic.BaseModel):
+    sku: str
+    quantity: pydantic.PositiveInt
+
+
+class Document(pydantic.BaseModel):
+    items: list[OrderItem]
+
+
+class JSONModel(models.Model):
+    data = models.JSONField()
+    document = models.JSONField(null=True, blank=True)
+    document.__json_type__ = Document
+
+
+def test_json_field_accepts_parsed_and_raw_values() -> None:
+    pyd_model = pydbull.model_to_pydantic(JSONModel, fields=["data"])
+
+    assert pyd_model.__pydantic_fields__["data"].annotation is typing.Any
+    assert pyd_model(data={"a": [1, 2]}).data == {"a": [1, 2]}
+    assert pyd_model(data=b"[1, 2]").data == [1, 2]
+    assert pyd_model.model_validate_json('{"data": {"a": 1}}').data == {"a": 1}
+
+
+@pytest.mark.parametrize("value", ["text", '{"a": [1, 2]}', "42", "true", "1e3", "null"])
+def test_json_field_str_is_document(value: str) -> None:
+    pyd_model = pydbull.model_to_pydantic(JSONModel, fields=["data"])
+
+    # Any string is a JSON document itself, not the raw JSON.
+    assert pyd_model(data=value).data == value
+    assert pyd_model.model_validate_json(json.dumps({"data": value})).data == value
+
+
+def test_json_field_nested_type() -> None:
+    pyd_model = pydbull.model_to_pydantic(JSONModel, fields=["document"])
+    document = {"items": [{"sku": "A-1", "quantity": 2}]}
+
+    assert pyd_model(document=document).document == Document(items=[OrderItem(sku="A-1", quantity=2)])
+    assert pyd_model(document='{"items": [{"sku": "A-1", "quantity": "2"}]}').document.items[0].quantity == 2
+    assert pyd_model(document=None).document is None
+    assert pyd_model(document=document).model_dump() == {"document": document}
+    # Stored as the JSON document, not the pydantic model.
+    assert pydbull.get_adapter(pyd_model).get_model_instance(pyd_model(document=document)).document == document
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pyd_model(document='{"items": [{"sku": "A-1", "quantity": 0}]}')
+    assert {error["type"] for error in exc_info.value.errors()} == {"greater_than", "model_type"}
+
+
+def test_json_field_generated() -> None:
+    source = pydbull.codegen.render_module([pydbull.model_to_pydantic(JSONModel)])
+    assert (
+        "    data: typing.Annotated[typing.Any, pydantic.Field(description=''), "
+        "*pydbull.codegen.field_metadata(_jsonmodel_adapter, 'data')]"
+    ) in source
+    assert f"    document: typing.Annotated[{__name__}.Document | None" in source
@@ -0,0 +1,136 @@
+import threading
+import types
+
+import pydantic
+import pytest
+import pytest_mock
+from django.db import models
+
+import pydbull
+
+
+class LazyUser(models.Model):
+    name = models.CharField(max_length=5)
+
+
+def test_lazy_model_is_built_on_first_use(mocker: pytest_mock.MockFixture) -> None:
+    create_model = mocker.spy(pydantic, "create_model")
+
+    @pydbull.model_validator(LazyUser, lazy=True)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    assert isinstance(LazyUserValidator, pydbull.LazyModel)
+    assert not LazyUserValidator.is_built
+    assert LazyUserValidator.__name__ == "LazyUser"
+    assert create_model.call_count == 0
+
+    user = LazyUserValidator(name="John")
+    assert LazyUserValidator.is_built
+    assert LazyUserValidator.build_time > 0
+    assert isinstance(user, LazyUserValidator)
+    assert isinstance(user, pydbull.PydbullModelMixin)
+    assert pydbull.get_model(user) is LazyUser
+    with pytest.raises(pydantic.ValidationError):
+        LazyUserValidator(name="Too long")
+    assert create_model.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda model: model.model_validate({"name": "John"}),
+        lambda model: model.model_json_schema(),
+        lambda model: types.new_class("LazySubclass", (model,)),
+    ],
+    ids=["validate", "schema", "subclass"],
+)
+def test_lazy_model_builds_on(use) -> None:
+    @pydbull.model_validator(LazyUser, lazy=True)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    use(LazyUserValidator)
+    assert LazyUserValidator.is_built
+
+
+def test_lazy_model_class_checks() -> None:
+    @pydbull.model_validator(LazyUser, lazy=True)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    # The checks against the stand-in are supported, even before it's built
+    assert not isinstance(object(), LazyUserValidator)
+    assert not issubclass(int, LazyUserValidator)
+    assert not LazyUserValidator.is_built
+    assert issubclass(LazyUserValidator.build(), LazyUserValidator)
+    # The stand-in isn't a class, the built model is
+    assert not isinstance(LazyUserValidator, type)
+    assert issubclass(LazyUserValidator.build(), pydantic.BaseModel)
+    assert issubclass(LazyUserValidator.build(), pydbull.PydbullModelMixin)
+
+
+def test_lazy_model_subclass() -> None:
+    @pydbull.model_validator(LazyUser, lazy=True)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    class LazyUserSubclass(LazyUserValidator):
+        age: int
+
+    assert issubclass(LazyUserSubclass, LazyUserValidator)
+    assert issubclass(LazyUserSubclass, LazyUserValidator.build())
+    with pytest.raises(pydantic.ValidationError):
+        LazyUserSubclass(name="Too long", age=1)
+
+
+def test_lazy_model_global_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pydbull.settings, "lazy", True)
+
+    @pydbull.model_validator(LazyUser)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    @pydbull.model_validator(LazyUser, lazy=False)
+    class EagerUserValidator(pydantic.BaseModel):
+        name: str
+
+    assert isinstance(LazyUserValidator, pydbull.LazyModel)
+    assert not isinstance(EagerUserValidator, pydbull.LazyModel)
+
+
+def test_lazy_model_is_built_once_across_threads(mocker: pytest_mock.MockFixture) -> None:
+    create_model = mocker.spy(pydantic, "create_model")
+
+    @pydbull.model_validator(LazyUser, lazy=True)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    barrier = threading.Barrier(8)
+    models_: list[type[pydantic.BaseModel]] = []
+
+    def build() -> None:
+        barrier.wait()
+        models_.append(LazyUserValidator.build())
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(model is models_[0] for model in models_)
+    assert create_model.call_count == 1
+
+
+def test_lazy_model_as_field_annotation() -> None:
+    @pydbull.model_validator(LazyUser, lazy=True)
+    class LazyUserValidator(pydantic.BaseModel):
+        name: str
+
+    class Team(pydantic.BaseModel):
+        user: LazyUserValidator
+
+    assert isinstance(Team(user={"name": "John"}).user, LazyUserValidator)
+    with pytest.raises(pydantic.ValidationError):
+        Team(user={"name": "Too long"})
@@ -0,0 +1,149 @@
+import threading
+
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+from pydbull import cache
+
+
+@pytest.fixture
+def model_cache(monkeypatch: pytest.MonkeyPatch) -> pydbull.ModelCache:
+    model_cache = pydbull.ModelCache(maxsize=2)
+    monkeypatch.setattr(cache, "model_cache", model_cache)
+    return model_cache
+
+
+def test_model_to_pydantic_returns_cached_model(model_cache: pydbull.ModelCache) -> None:
+    class CachedModel(models.Model):
+        name = models.CharField(max_length=5)
+        age = models.IntegerField()
+
+    pyd_model = pydbull.model_to_pydantic(CachedModel, exclude=["id"])
+    assert pydbull.model_to_pydantic(CachedModel, exclude=("id",)) is pyd_model
+    assert pydbull.DjangoAdapter(CachedModel).model_to_pydantic(exclude={"id"}) is pyd_model
+    assert pydbull.model_to_pydantic(CachedModel, fields=["name"]) is not pyd_model
+    assert model_cache.info() == cache.CacheInfo(hits=2, misses=2, maxsize=2, currsize=2)
+
+
+def test_model_to_pydantic_cache_field_annotations(model_cache: pydbull.ModelCache) -> None:
+    class CachedAnnotationsModel(models.Model):
+        age = models.IntegerField()
+
+    pyd_model = pydbull.model_to_pydantic(CachedAnnotationsModel, field_annotations={"age": pydantic.Field(ge=2)})
+    # Equal field annotations are created on every call, but they share the cached model.
+    assert (
+        pydbull.model_to_pydantic(CachedAnnotationsModel, field_annotations={"age": pydantic.Field(ge=2)}) is pyd_model
+    )
+    assert (
+        pydbull.model_to_pydantic(CachedAnnotationsModel, field_annotations={"age": pydantic.Field(ge=3)})
+        is not pyd_model
+    )
+    assert model_cache.info().hits == 1
+
+
+def test_model_cache_evicts_least_recently_used(model_cache: pydbull.ModelCache) -> None:
+    class EvictedModel(models.Model):
+        name = models.CharField(max_length=5)
+
+    first = pydbull.model_to_pydantic(EvictedModel, name="First")
+    second = pydbull.model_to_pydantic(EvictedModel, name="Second")
+    assert pydbull.model_to_pydantic(EvictedModel, name="First") is first
+    pydbull.model_to_pydantic(EvictedModel, name="Third")  # evicts "Second"
+
+    assert pydbull.model_to_pydantic(EvictedModel, name="First") is first
+    assert pydbull.model_to_pydantic(EvictedModel, name="Second") is not second
+
+    model_cache.maxsize = 0
+    assert model_cache.info().currsize == 0
+    assert pydbull.model_to_pydantic(EvictedModel, name="First") is not first
+    assert model_cache.info().currsize == 0
+
+    with pytest.raises(ValueError):
+        model_cache.maxsize = -1
+
+
+def test_model_cache_builds_model_once_across_threads(model_cache: pydbull.ModelCache) -> None:
+    class ThreadedModel(models.Model):
+        name = models.CharField(max_length=5)
+
+    barrier = threading.Barrier(8)
+    results: list[type[pydantic.BaseModel]] = []
+
+    def build() -> None:
+        barrier.wait()
+        results.append(pydbull.model_to_pydantic(ThreadedModel))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert model_cache.info().misses == 1
+    assert model_cache.info().hits == 7
+
+
+def test_model_cache_builds_outside_lock() -> None:
+    model_cache = pydbull.ModelCache()
+    cached = pydantic.create_model("Cached")
+    model_cache.get_or_build("cached", lambda: cached)
+    building = threading.Event()
+    release = threading.Event()
+    slow = pydantic.create_model("Slow")
+
+    def build_slow() -> type[pydantic.BaseModel]:
+        building.set()
+        release.wait(5)
+        return slow
+
+    results: list[type[pydantic.BaseModel]] = []
+    threads = [threading.Thread(target=lambda: results.append(model_cache.get_or_build("slow", build_slow)))]
+    threads[0].start()
+    assert building.wait(5)
+    # Neither the other models nor the other keys wait for the model being built.
+    lookup = threading.Thread(
+        target=lambda: results.extend(
+            (
+                model_cache.get_or_build("cached", lambda: pytest.fail("cached")),
+                model_cache.get_or_build("other", lambda: cached),
+            ),
+        ),
+    )
+    lookup.start()
+    lookup.join(1)
+    assert results == [cached, cached]
+    results.clear()
+    threads.append(threading.Thread(target=lambda: results.append(model_cache.get_or_build("slow", build_slow))))
+    threads[1].start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [slow, slow]
+    assert model_cache.info() == cache.CacheInfo(hits=2, misses=3, maxsize=cache.DEFAULT_MAXSIZE, currsize=3)
+
+
+def test_model_cache_nested_models_cached_with_outermost() -> None:
+    model_cache = pydbull.ModelCache()
+    inner = pydantic.create_model("Inner")
+    outer = pydantic.create_model("Outer")
+    currsize: list[int] = []
+
+    def build_outer() -> type[pydantic.BaseModel]:
+        assert model_cache.get_or_build("inner", lambda: inner) is inner
+        # Not completed yet (e.g., resolving the forward references).
+        currsize.append(model_cache.info().currsize)
+        return outer
+
+    assert model_cache.get_or_build("outer", build_outer) is outer
+    assert currsize == [0]
+    assert model_cache.get_or_build("inner", lambda: pytest.fail("inner")) is inner
+    assert model_cache.info().currsize == 2
+
+    with pytest.raises(ValueError):
+        model_cache.get_or_build("failed", lambda: (_ for _ in ()).throw(ValueError))
+    assert model_cache.get_or_build("failed", lambda: outer) is outer
@@ -1,3 +1,4 @@
+import decimal
 import typing
 
 import django.core.exceptions
@@ -13,17 +14,21 @@ import pydbull
 def test_model_validator_attributes_set() -> None:
     class DjangoModelModelValidator(models.Model):
         field_1 = models.IntegerField()
+        field_2 = models.IntegerField(validators=[lambda value: None])
 
     @pydbull.model_validator(DjangoModelModelValidator)
     class PydbullDjangoModel(pydantic.BaseModel):
         field_1: str
+        field_2: int
 
     assert issubclass(PydbullDjangoModel, pydantic.BaseModel)
     assert PydbullDjangoModel.__pydbull_model__ == DjangoModelModelValidator
     assert type(PydbullDjangoModel.__pydbull_adapter__) is pydbull.DjangoAdapter
     assert PydbullDjangoModel.__pydbull_adapter__.model is DjangoModelModelValidator
     assert PydbullDjangoModel.__name__ == "PydbullDjangoModel"
-    assert hasattr(PydbullDjangoModel, "pydbull_field_1_field_extra_validators")
+    # All the validators of `field_1` are enforced by pydantic field constraints, so no extra validators are needed.
+    assert not hasattr(PydbullDjangoModel, "pydbull_field_1_field_extra_validators")
+    assert hasattr(PydbullDjangoModel, "pydbull_field_2_field_extra_validators")
     assert hasattr(PydbullDjangoModel, "pydbull_model_extra_validators")
 
 
@@ -255,3 +260,58 @@ def test_custom_computed_property_on_pydantic_model() -> None:
     rectangle = RectangleModel(width=10, length=5)
     assert rectangle.area == 50
 
+
+
+def test_model_validator_non_dict_context() -> None:
+    class NonDictContextModel(models.Model):
+        name = models.CharField(max_length=5)
+
+    @pydbull.model_validator(NonDictContextModel, constraint_strategy="skip")
+    class NonDictContextValidator(pydantic.BaseModel):
+        name: str
+
+    assert NonDictContextValidator.model_validate({"name": "ok"}, context=object()).name == "ok"
+
+
+def test_model_validator_null_converted_to_empty_string() -> None:
+    class NullToEmptyModel(models.Model):
+        name = models.CharField(max_length=10, blank=True)
+        nullable = models.CharField(max_length=10, blank=True, null=True)
+
+    @pydbull.model_validator(NullToEmptyModel)
+    class NullToEmptyValidator(pydantic.BaseModel):
+        name: str | None = None
+        nullable: str | None = None
+
+    # No Django validator is left to run in Python, but the null is still converted for the non-nullable field.
+    validated = NullToEmptyValidator(name=None, nullable=None)
+    assert validated.name == ""
+    assert validated.nullable is None
+
+
+class DecimalPriceModel(models.Model):
+    price = models.DecimalField(max_digits=5, decimal_places=2)
+
+
+@pydbull.model_validator(DecimalPriceModel, constraint_strategy="skip")
+class DecimalPriceValidator(pydantic.BaseModel):
+    price: decimal.Decimal
+
+
+@pytest.mark.parametrize("value", ["1.000", "123.450", "999.990", "1.2300", "0E-7", "1.5", "999.99", "1000"])
+def test_model_validator_decimal_matches_django(value: str) -> None:
+    # pydantic normalizes the trailing zeros and the exponent before checking the digits, Django doesn't.
+    field = DecimalPriceModel._meta.get_field("price")
+    try:
+        field.clean(decimal.Decimal(value), None)
+    except django.core.exceptions.ValidationError:
+        django_valid = False
+    else:
+        django_valid = True
+    try:
+        DecimalPriceValidator(price=value)
+    except pydantic.ValidationError:
+        pydbull_valid = False
+    else:
+        pydbull_valid = True
+    assert pydbull_valid is django_valid
@@ -0,0 +1,173 @@
+import re
+import typing
+import unicodedata
+
+import django.core.exceptions
+import pydantic
+import pytest
+from django.core import validators
+from django.core.files.base import ContentFile
+from django.db import models
+
+import pydbull
+import pydbull.codegen
+from pydbull.django import _native, _unicode
+from pydbull.django._native import NativeValidators, compute_unicode_data, native_checks, rust_pattern
+
+SLUGS: tuple[str, ...] = ("slug", "some-slug_1", "", "with space", "slug\n", "\nslug", "žluťoučký", "a.b", "١٢٣", "½")
+IP_ADDRESSES: tuple[str, ...] = (
+    "1.2.3.4",
+    "255.255.255.255",
+    "256.1.1.1",
+    "01.2.3.4",
+    "1.2.3",
+    "1.2.3.4\n",
+    "::",
+    "::1",
+    "1::",
+    "2001:db8::1",
+    "2001:DB8:0:0:0:0:0:1",
+    "1:2:3:4:5:6:7:8",
+    "1:2:3:4:5:6:7:8::",
+    "1:2:3:4:5:6:7::",
+    "1:2:3:4:5:6:7:8:9",
+    "::ffff:1.2.3.4",
+    "1:2:3:4:5:6:1.2.3.4",
+    "1:2:3:4:5:6:7:1.2.3.4",
+    "::1.2.3",
+    "12345::",
+    "1:::2",
+    "fe80::1%eth0",
+    "fe80::1%",
+    "fe80::1%a%b",
+    "ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff%eth0",
+    "",
+)
+FILE_NAMES: tuple[str, ...] = (
+    "file.txt",
+    "FILE.TXT",
+    "file.pdf",
+    "file.txt.pdf",
+    "file.",
+    "file",
+    ".txt",
+    "..txt",
+    "a.b.txt",
+    "dir.txt/file",
+    "dir/file.txt",
+    "/file.txt",
+    "file.txt/",
+    "file.txt/.",
+    "file.txt/..",
+    "file.tx",
+    "file.kml",
+    "file.Kml",  # Kelvin sign lowercased to "k"
+    "",
+)
+
+
+def _accepts(validate: typing.Callable[[typing.Any], typing.Any], value: typing.Any) -> bool:
+    try:
+        validate(value)
+    except (django.core.exceptions.ValidationError, pydantic.ValidationError):
+        return False
+    return True
+
+
+def _native_adapter(
+    validator: typing.Callable[[typing.Any], None],
+    max_length: int | None = None,
+) -> pydantic.TypeAdapter:
+    return pydantic.TypeAdapter(
+        typing.Annotated[str, pydantic.Field(max_length=max_length), NativeValidators(native_checks([validator]))],
+    )
+
+
+@pytest.mark.parametrize("validator", [validators.validate_slug, validators.validate_unicode_slug])
+def test_regex_validator_parity(validator: validators.RegexValidator) -> None:
+    pattern = rust_pattern(validator.regex)
+    pattern_adapter = pydantic.TypeAdapter(typing.Annotated[str, pydantic.Field(pattern=pattern)])
+    for value in SLUGS:
+        assert _accepts(pattern_adapter.validate_python, value) == _accepts(validator, value), value
+
+
+@pytest.mark.skipif(unicodedata.unidata_version != _unicode.UNIDATA_VERSION, reason="Other Unicode version.")
+def test_unicode_data_up_to_date() -> None:
+    # Regenerate `pydbull.django._unicode` from `compute_unicode_data()` if it fails.
+    assert _native._unicode_data() == compute_unicode_data()
+
+
+def test_rust_pattern_not_translatable() -> None:
+    assert rust_pattern(validators.RegexValidator(r"^[a-z]+$", flags=re.IGNORECASE).regex) is None
+    assert rust_pattern(validators.RegexValidator(r"^(?=a)").regex) is None
+    assert rust_pattern(validators.RegexValidator(r"(a)\1").regex) is None
+    assert rust_pattern(validators.RegexValidator(r"\bword\b").regex) is None
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [validators.validate_ipv4_address, validators.validate_ipv6_address, validators.validate_ipv46_address],
+)
+def test_ip_address_validator_parity(validator: typing.Callable[[typing.Any], None]) -> None:
+    # Field-level, `max_length` of `GenericIPAddressField` applies on both sides (older Django versions accept
+    # the longer scoped IPv6 addresses by the validator alone).
+    max_length_validator = validators.MaxLengthValidator(39)
+    native_adapter = _native_adapter(validator, max_length=39)
+    for value in IP_ADDRESSES:
+        django_accepts = _accepts(validator, value) and _accepts(max_length_validator, value)
+        assert _accepts(native_adapter.validate_python, value) == django_accepts, value
+
+
+@pytest.mark.parametrize("allowed_extensions", [["txt"], ["txt", "PDF"], ["kml"], None])
+def test_file_extension_validator_parity(allowed_extensions: list[str] | None) -> None:
+    validator = validators.FileExtensionValidator(allowed_extensions)
+    native_adapter = _native_adapter(validator)
+    for name in FILE_NAMES:
+        assert _accepts(native_adapter.validate_python, name) == _accepts(validator, ContentFile(b"", name=name)), name
+
+
+def test_prohibit_null_characters_validator_parity() -> None:
+    validator = validators.ProhibitNullCharactersValidator()
+    native_adapter = _native_adapter(validator)
+    for value in ("value", "", "\x00", "va\x00lue", "\n"):
+        assert _accepts(native_adapter.validate_python, value) == _accepts(validator, value), value
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        native_adapter.validate_python("\x00")
+    assert exc_info.value.errors()[0]["type"] == "null_characters_not_allowed"
+
+
+class NativeValidatorsModel(models.Model):
+    slug = models.SlugField()
+    ip = models.GenericIPAddressField(null=True, blank=True)
+    name = models.CharField(max_length=10, validators=[validators.ProhibitNullCharactersValidator()])
+    extension = models.CharField(max_length=10, validators=[validators.FileExtensionValidator(["txt"])])
+
+
+def test_validators_enforced_natively() -> None:
+    adapter = pydbull.DjangoAdapter(NativeValidatorsModel)
+    pyd_model = adapter.model_to_pydantic(fields=["slug", "ip", "name", "extension"])
+    pyd_fields = pyd_model.__pydantic_fields__
+
+    for field_name in ("slug", "ip", "name", "extension"):
+        model_field = NativeValidatorsModel._meta.get_field(field_name)
+        assert adapter.get_extra_field_validators(model_field, pyd_fields[field_name]) == ()
+    # Allowing the files without an extension has no native equivalent.
+    assert native_checks([validators.FileExtensionValidator(["txt", ""])]) == ()
+
+    assert pyd_model(slug="some-slug", ip=None, name="name", extension="file.txt").slug == "some-slug"
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pyd_model(slug="some slug", ip="1.2.3", name="na\x00me", extension="file.pdf")
+    assert {error["loc"][0]: error["type"] for error in exc_info.value.errors()} == {
+        "slug": "string_pattern_mismatch",
+        "ip": "invalid",
+        "name": "null_characters_not_allowed",
+        "extension": "invalid_extension",
+    }
+
+
+def test_native_validators_generated() -> None:
+    source = pydbull.codegen.render_module([pydbull.model_to_pydantic(NativeValidatorsModel)])
+    assert (
+        "    name: typing.Annotated[str, pydantic.Field(max_length=10, description=''), "
+        "*pydbull.codegen.field_metadata(_nativevalidatorsmodel_adapter, 'name')]"
+    ) in source
@@ -0,0 +1,105 @@
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+
+
+class NestedPublisher(models.Model):
+    name = models.CharField(max_length=50)
+
+
+class NestedAuthor(models.Model):
+    name = models.CharField(max_length=50)
+    publisher = models.ForeignKey(NestedPublisher, on_delete=models.CASCADE, null=True, blank=True)
+
+
+class NestedTag(models.Model):
+    label = models.CharField(max_length=20)
+
+
+class NestedBook(models.Model):
+    title = models.CharField(max_length=50)
+    author = models.ForeignKey(NestedAuthor, on_delete=models.CASCADE, related_name="books")
+    editor = models.ForeignKey(NestedAuthor, on_delete=models.CASCADE, related_name="edited_books")
+    tags = models.ManyToManyField(NestedTag, blank=True, related_name="books")
+
+
+def test_depth_zero_relations_are_primary_keys() -> None:
+    pyd_model = pydbull.model_to_pydantic(NestedAuthor)
+
+    # The reverse relations are left out, unless listed in `fields`.
+    assert list(pyd_model.__pydantic_fields__) == ["id", "name", "publisher"]
+    assert pyd_model.__pydantic_fields__["publisher"].annotation == int | None
+    pyd_model = pydbull.model_to_pydantic(NestedAuthor, fields=["name", "books"])
+    assert pyd_model.__pydantic_fields__["books"].annotation == list[int] | None
+
+
+def test_depth_keyword_only() -> None:
+    class NestedBase(pydantic.BaseModel):
+        pass
+
+    # `__base__` stays the 6th positional argument
+    pyd_model = pydbull.model_to_pydantic(NestedPublisher, "NestedPublisherBase", None, None, None, NestedBase)
+    assert issubclass(pyd_model, NestedBase)
+    with pytest.raises(TypeError):
+        pydbull.model_to_pydantic(NestedPublisher, None, None, None, None, None, 1)  # type: ignore[misc]
+
+
+def test_nested_relations() -> None:
+    pyd_model = pydbull.model_to_pydantic(NestedBook, depth=1)
+    fields = pyd_model.__pydantic_fields__
+
+    author_model = fields["author"].annotation
+    assert pydbull.get_model(author_model) is NestedAuthor
+    # Deeper relations are primary keys.
+    assert author_model.__pydantic_fields__["publisher"].annotation == int | None
+    assert pydbull.get_model(fields["tags"].annotation.__args__[0].__args__[0]) is NestedTag
+
+    book = pyd_model(title="Dune", author={"name": "Frank"}, editor={"name": "John"}, tags=[{"label": "sci-fi"}])
+    assert book.author.name == "Frank"
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pyd_model(title="Dune", author={"name": "x" * 51}, editor={"name": "John"})
+    assert exc_info.value.errors()[0]["loc"] == ("author", "name")
+
+    instance = pydbull.get_adapter(book).get_model_instance(book)
+    assert instance.author.name == "Frank"
+
+
+def test_nested_reverse_relations() -> None:
+    pyd_model = pydbull.model_to_pydantic(NestedAuthor, depth=1)
+    book_model = pyd_model.__pydantic_fields__["books"].annotation.__args__[0].__args__[0]
+
+    # The relation pointing back to the author is set by the reverse relation.
+    assert "author" not in book_model.__pydantic_fields__
+    author = pyd_model(name="Frank", books=[{"title": "Dune", "editor": 1}])
+    assert author.books[0].title == "Dune"
+    assert pyd_model(name="Frank").books is None
+    assert pydbull.get_adapter(author).get_model_instance(author).name == "Frank"
+
+
+def test_related_models_built_once_per_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pydbull.model_cache, "maxsize", 0)
+    built: list[type[models.Model]] = []
+    build_pydantic_model = pydbull.DjangoAdapter._build_pydantic_model
+
+    def spy(self: pydbull.DjangoAdapter, **kwargs) -> type[pydantic.BaseModel]:
+        built.append(self.model)
+        return build_pydantic_model(self, **kwargs)
+
+    monkeypatch.setattr(pydbull.DjangoAdapter, "_build_pydantic_model", spy)
+    pyd_model = pydbull.model_to_pydantic(NestedBook, depth=1)
+
+    assert pyd_model.__pydantic_fields__["author"].annotation is pyd_model.__pydantic_fields__["editor"].annotation
+    assert built.count(NestedAuthor) == 1
+
+
+def test_unlimited_depth_cycles() -> None:
+    pyd_model = pydbull.model_to_pydantic(NestedAuthor, depth=None)
+    book_model = pyd_model.__pydantic_fields__["books"].annotation.__args__[0].__args__[0]
+
+    # Resolved by a forward reference to the model being built.
+    assert book_model.__pydantic_fields__["editor"].annotation is pyd_model
+    author = pyd_model(name="Frank", books=[{"title": "Dune", "editor": {"name": "John", "edited_books": []}}])
+    assert author.books[0].editor.edited_books == []
+    assert "NestedBook" in str(pyd_model.model_json_schema())
@@ -0,0 +1,88 @@
+import gc
+import os
+import pickle
+import subprocess
+import sys
+
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+from pydbull import cache, generated
+
+
+class PickleModel(models.Model):
+    name = models.CharField(max_length=10)
+    age = models.IntegerField(null=True)
+
+
+@pydbull.model_validator(PickleModel)
+class PickleValidator(pydantic.BaseModel):
+    name: str
+    age: int | None = None
+
+
+class PickleBase(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+
+@pydbull.model_validator(PickleModel, lazy=True)
+class LazyPickleValidator(pydantic.BaseModel):
+    name: str
+
+
+def test_pickle_decorated_model() -> None:
+    assert pickle.loads(pickle.dumps(PickleValidator)) is PickleValidator
+    pyd_model = PickleValidator(name="John")
+    unpickled = pickle.loads(pickle.dumps(pyd_model))
+    assert unpickled == pyd_model
+    assert unpickled.model_fields_set == {"name"}
+
+    lazy_pyd_model = LazyPickleValidator(name="John")
+    assert pickle.loads(pickle.dumps(lazy_pyd_model)) == lazy_pyd_model
+
+
+def test_pickle_model_to_pydantic() -> None:
+    pyd_model_cls = pydbull.model_to_pydantic(PickleModel, fields=["name"])
+    other_pyd_model_cls = pydbull.model_to_pydantic(PickleModel, fields=["age"])
+    assert pyd_model_cls.__qualname__ != other_pyd_model_cls.__qualname__
+    assert pickle.loads(pickle.dumps(pyd_model_cls(name="John"))) == pyd_model_cls(name="John")
+
+
+def test_model_to_pydantic_not_kept_alive(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "model_cache", pydbull.ModelCache(maxsize=0))
+    name = pydbull.model_to_pydantic(PickleModel, fields=["name"], name="Unreferenced").__qualname__
+    gc.collect()
+    assert name not in generated._models
+    # Built again when unpickled.
+    assert getattr(generated, name).__qualname__ == name
+
+
+def test_pickle_adapter() -> None:
+    adapter = pickle.loads(pickle.dumps(pydbull.get_adapter(PickleValidator)))
+    assert type(adapter) is pydbull.DjangoAdapter
+    assert adapter.model is PickleModel
+
+
+def test_unpickle_in_new_process() -> None:
+    built = pydbull.model_to_pydantic(PickleModel, exclude=["id"], name="BuiltPickle", __base__=PickleBase)
+    data = pickle.dumps(
+        [PickleValidator(name="John", age=6), LazyPickleValidator(name="Pepa"), built(name="Jan", age=3)],
+    )
+    code = (
+        "import pickle, sys, django; django.setup();"
+        "pyd_models = pickle.loads(sys.stdin.buffer.read());"
+        "print([(type(m).__name__, m.model_dump()) for m in pyd_models])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        input=data,
+        capture_output=True,
+        check=True,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "tests.test_django.settings"},
+    ).stdout
+    assert output.decode().strip() == (
+        "[('Pickle', {'name': 'John', 'age': 6}), ('LazyPickle', {'name': 'Pepa'}), "
+        "('BuiltPickle', {'name': 'Jan', 'age': 3})]"
+    )
@@ -0,0 +1,98 @@
+import django.core.exceptions
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+from pydbull.tracing import PhaseTiming, Tracer
+
+
+def validate_lowercase(value: str) -> None:
+    if value != value.lower():
+        raise django.core.exceptions.ValidationError("Must be lowercase.", code="lowercase")
+
+
+class TracingBook(models.Model):
+    title = models.CharField(max_length=20, unique=True, validators=[validate_lowercase])
+    pages = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = (models.UniqueConstraint(fields=["title", "pages"], name="tracing_book_title_pages"),)
+
+
+class TracingBookValidator(pydantic.BaseModel):
+    id: int | None = None
+    title: str
+    pages: int
+
+
+@pytest.fixture
+def timings(create_tables) -> list[PhaseTiming]:
+    create_tables(TracingBook)
+    timings: list[PhaseTiming] = []
+    pydbull.settings.tracer = Tracer(timings.append)
+    yield timings
+    pydbull.settings.tracer = None
+
+
+@pytest.fixture
+def book_validator(timings: list[PhaseTiming]) -> type[TracingBookValidator]:
+    # Only the models built with the tracer set are traced.
+    return pydbull.model_validator(TracingBook)(TracingBookValidator)
+
+
+def test_tracer_receives_phases(timings: list[PhaseTiming], book_validator: type[TracingBookValidator]) -> None:
+    book_validator.model_validate({"title": "dune", "pages": 412})
+
+    assert [(timing.phase, timing.field) for timing in timings] == [
+        ("field_validators", "title"),
+        ("get_model_instance", None),
+        ("validate_unique", None),
+        ("validate_constraints", None),
+        ("parse", None),
+    ]
+    assert all(timing.model == "TracingBook" and timing.duration >= 0 for timing in timings)
+    queries = {timing.phase: timing.queries for timing in timings}
+    assert queries == {
+        "field_validators": 0,
+        "get_model_instance": 0,
+        "validate_unique": 1,
+        "validate_constraints": 1,
+        "parse": 0,
+    }
+
+
+def test_tracer_receives_error_conversion(
+    timings: list[PhaseTiming],
+    book_validator: type[TracingBookValidator],
+) -> None:
+    TracingBook.objects.create(title="dune", pages=412)
+
+    with pytest.raises(pydantic.ValidationError):
+        book_validator.model_validate({"title": "dune", "pages": 412})
+
+    assert "error_conversion" in [timing.phase for timing in timings]
+
+
+def test_tracer_not_sampled(timings: list[PhaseTiming], book_validator: type[TracingBookValidator]) -> None:
+    pydbull.settings.tracer = Tracer(timings.append, sample_rate=0)
+
+    book_validator.model_validate({"title": "dune", "pages": 412})
+
+    assert timings == []
+
+
+def test_tracer_not_set_when_built(timings: list[PhaseTiming]) -> None:
+    pydbull.settings.tracer = None
+    book_validator = pydbull.model_validator(TracingBook)(TracingBookValidator)
+
+    pydbull.settings.tracer = Tracer(timings.append)
+    book_validator.model_validate({"title": "dune", "pages": 412})
+
+    assert timings == []
+    assert "pydbull_trace" not in book_validator.__pydantic_decorators__.model_validators
+
+
+def test_tracer_invalid_sample_rate() -> None:
+    with pytest.raises(ValueError, match="sample_rate"):
+        Tracer(print, sample_rate=2)
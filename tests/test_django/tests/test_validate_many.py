@@ -0,0 +1,226 @@
+import typing
+
+import pydantic
+import pytest
+from django.db import models
+
+import pydbull
+
+
+def test_validate_many_returns_models_and_errors_in_order() -> None:
+    class ValidateManyModel(models.Model):
+        name = models.CharField(max_length=5)
+
+    @pydbull.model_validator(ValidateManyModel)
+    class ValidateManyValidator(pydantic.BaseModel):
+        name: str
+
+    results = ValidateManyValidator.validate_many([{"name": "ok"}, {"name": "too long"}], chunk_size=1)
+    assert isinstance(results[0], ValidateManyValidator)
+    assert results[0].name == "ok"
+    assert isinstance(results[1], pydantic.ValidationError)
+    assert results[1].errors()[0]["type"] == "string_too_long"
+
+
+def test_validate_many_unique_fields_single_query_per_chunk(
+    create_tables,
+    django_assert_num_queries,
+) -> None:
+    class UniqueManyModel(models.Model):
+        code = models.CharField(max_length=10, unique=True)
+        a = models.IntegerField()
+        b = models.IntegerField()
+
+        class Meta:
+            unique_together = [("a", "b")]
+            constraints = [
+                models.UniqueConstraint(fields=["b", "code"], name="unique_many_b_code"),
+            ]
+
+    create_tables(UniqueManyModel)
+    UniqueManyModel.objects.create(code="taken", a=1, b=1)
+
+    @pydbull.model_validator(UniqueManyModel)
+    class UniqueManyValidator(pydantic.BaseModel):
+        code: str
+        a: int
+        b: int
+
+    records = [
+        {"code": "free", "a": 1, "b": 2},
+        {"code": "taken", "a": 2, "b": 2},
+        {"code": "other", "a": 1, "b": 1},
+        {"code": "free", "a": 3, "b": 3},
+    ]
+    # 1 query for `unique=True`, `unique_together` and `UniqueConstraint` each
+    with django_assert_num_queries(3):
+        results = UniqueManyValidator.validate_many(records)
+
+    assert isinstance(results[0], UniqueManyValidator)
+    with pytest.raises(pydantic.ValidationError) as single_exc:
+        UniqueManyValidator(**records[1])
+    assert results[1].errors() == single_exc.value.errors()
+    assert results[1].title == single_exc.value.title
+    assert results[2].errors() == [
+        {
+            "ctx": {},
+            "input": None,
+            "loc": (),
+            "msg": "Unique many model with this A and B already exists.",
+            "type": "unique_together",
+        },
+    ]
+    # Collides with the first record of the batch
+    assert [error["loc"] for error in results[3].errors()] == [("code",)]
+
+
+def test_validate_many_excludes_updated_instance(create_tables) -> None:
+    class UniqueUpdateManyModel(models.Model):
+        code = models.CharField(max_length=10, unique=True)
+
+    create_tables(UniqueUpdateManyModel)
+    instance = UniqueUpdateManyModel.objects.create(code="taken")
+
+    @pydbull.model_validator(UniqueUpdateManyModel)
+    class UniqueUpdateManyValidator(pydantic.BaseModel):
+        id: int | None = None
+        code: str
+
+    results = UniqueUpdateManyValidator.validate_many([{"id": instance.pk, "code": "taken"}, {"code": "taken"}])
+    assert isinstance(results[0], UniqueUpdateManyValidator)
+    assert isinstance(results[1], pydantic.ValidationError)
+
+
+def test_validate_many_errors_in_single_record_order(create_tables) -> None:
+    class UniqueOrderManyModel(models.Model):
+        code = models.CharField(max_length=10, unique=True)
+        a = models.IntegerField()
+
+        class Meta:
+            constraints = [
+                models.UniqueConstraint(fields=["a"], name="unique_order_many_a"),
+            ]
+
+    create_tables(UniqueOrderManyModel)
+    UniqueOrderManyModel.objects.create(code="taken", a=1)
+
+    @pydbull.model_validator(UniqueOrderManyModel)
+    class UniqueOrderManyValidator(pydantic.BaseModel):
+        code: str
+        a: int
+
+    record = {"code": "taken", "a": 1}
+    (result,) = UniqueOrderManyValidator.validate_many([record])
+    with pytest.raises(pydantic.ValidationError) as single_exc:
+        UniqueOrderManyValidator(**record)
+    # `unique=True` by `validate_unique()` first, `UniqueConstraint` by `validate_constraints()` after
+    assert [error["loc"] for error in single_exc.value.errors()] == [("code",), ("a",)]
+    assert result.errors() == single_exc.value.errors()
+
+
+def test_validate_many_unique_case_insensitive_collation(create_tables) -> None:
+    class UniqueCollationManyModel(models.Model):
+        email = models.CharField(max_length=20, unique=True, db_collation="NOCASE")
+
+    create_tables(UniqueCollationManyModel)
+    UniqueCollationManyModel.objects.create(email="Foo@x.com")
+
+    @pydbull.model_validator(UniqueCollationManyModel)
+    class UniqueCollationManyValidator(pydantic.BaseModel):
+        email: str
+
+    results = UniqueCollationManyValidator.validate_many([{"email": "foo@x.com"}, {"email": "bar@x.com"}])
+    # The database compares the emails case-insensitively, so does the batch check
+    with pytest.raises(pydantic.ValidationError) as single_exc:
+        UniqueCollationManyValidator(email="foo@x.com")
+    assert results[0].errors() == single_exc.value.errors()
+    assert isinstance(results[1], UniqueCollationManyValidator)
+
+
+def test_iter_validate_lazily_per_chunk(create_tables, django_assert_num_queries) -> None:
+    class IterValidateModel(models.Model):
+        code = models.CharField(max_length=10, unique=True)
+        a = models.IntegerField()
+
+    create_tables(IterValidateModel)
+    IterValidateModel.objects.create(code="taken", a=1)
+
+    @pydbull.model_validator(IterValidateModel)
+    class IterValidateValidator(pydantic.BaseModel):
+        code: str
+        a: int
+
+    consumed: list[object] = []
+
+    def records() -> typing.Iterator[object]:
+        lines = [
+            '{"code": "a", "a": 1}',
+            b'{"code": "taken", "a": 2}',
+            "",
+            {"code": "b", "a": "1"},  # e.g., a `csv.DictReader` row
+            '{"code": "c", "a": "x"}',
+            {"code": "d", "a": 4},
+        ]
+        for line in lines:
+            consumed.append(line)
+            yield line
+
+    results = IterValidateValidator.iter_validate(records(), chunk_size=2)
+    # a query for the unique check per chunk
+    with django_assert_num_queries(1):
+        assert next(results)[0] == 0
+        assert len(consumed) == 2
+        index, error = next(results)
+    assert index == 1
+    assert isinstance(error, pydantic.ValidationError)
+    assert error.title == "IterValidate"
+
+    with django_assert_num_queries(2):
+        rest = list(results)
+    # The blank line is invalid, so the results stay aligned with the records.
+    assert [index for index, _ in rest] == [2, 3, 4, 5]
+    assert [type(result) for _, result in rest] == [
+        pydantic.ValidationError,
+        IterValidateValidator,
+        pydantic.ValidationError,
+        IterValidateValidator,
+    ]
+    assert rest[0][1].errors()[0]["type"] == "json_invalid"
+
+
+def test_validate_many_nested_models_checked(create_tables, django_assert_num_queries) -> None:
+    class NestedParentModel(models.Model):
+        code = models.CharField(max_length=10, unique=True)
+
+    class NestedChildModel(models.Model):
+        name = models.CharField(max_length=10, unique=True)
+        parent = models.ForeignKey(NestedParentModel, on_delete=models.CASCADE)
+
+    create_tables(NestedParentModel, NestedChildModel)
+    NestedParentModel.objects.create(code="taken")
+
+    @pydbull.model_validator(NestedParentModel)
+    class NestedParentValidator(pydantic.BaseModel):
+        code: str
+
+    @pydbull.model_validator(NestedChildModel)
+    class NestedChildValidator(pydantic.BaseModel):
+        name: str
+        parent: NestedParentValidator
+
+    records = [
+        {"name": "a", "parent": {"code": "free"}},
+        {"name": "b", "parent": {"code": "taken"}},
+        {"name": "c", "parent": {"code": "other"}},
+    ]
+    # A query for the unique check of the nested models and of the models
+    with django_assert_num_queries(2):
+        results = NestedChildValidator.validate_many(records)
+
+    assert [type(result) for result in results] == [NestedChildValidator, pydantic.ValidationError, NestedChildValidator]
+    with pytest.raises(pydantic.ValidationError) as single_exc:
+        NestedChildValidator.model_validate(records[1])
+    assert results[1].errors() == single_exc.value.errors()
+    assert [error["loc"] for error in results[1].errors()] == [("parent", "code")]
+    assert results[1].title == single_exc.value.title
+
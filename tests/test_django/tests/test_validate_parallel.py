@@ -0,0 +1,103 @@
+import multiprocessing
+
+import pydantic
+import pytest
+from django.core.validators import RegexValidator
+from django.db import models
+
+import pydbull
+
+
+class ParallelModel(models.Model):
+    code = models.CharField(max_length=10, unique=True, validators=[RegexValidator(r"^[a-z]+$")])
+    email = models.EmailField()
+    url = models.URLField(blank=True)
+
+
+@pydbull.model_validator(ParallelModel)
+class ParallelValidator(pydantic.BaseModel):
+    code: str
+    email: str
+    url: str = ""
+
+
+class ParallelChildModel(models.Model):
+    name = models.CharField(max_length=10)
+    parent = models.ForeignKey(ParallelModel, on_delete=models.CASCADE)
+
+
+@pydbull.model_validator(ParallelChildModel)
+class ParallelChildValidator(pydantic.BaseModel):
+    name: str
+    parents: list[ParallelValidator]
+
+
+def test_validate_parallel_same_as_sequential(create_tables) -> None:
+    create_tables(ParallelModel)
+    ParallelModel.objects.create(code="taken", email="taken@example.com")
+    records = [
+        {"code": "ok", "email": "ok@example.com", "url": "https://example.com"},
+        {"code": "taken", "email": "other@example.com"},
+        {"code": "not a slug", "email": "invalid"},
+        '{"code": "json", "email": "json@example.com"}',
+        {"code": "x" * 11, "email": "long@example.com", "url": "invalid"},
+        {"email": "missing@example.com"},
+        {"code": "last", "email": "last@example.com"},
+    ]
+
+    results = ParallelValidator.validate_parallel(records, workers=2, chunk_size=2)
+    expected = ParallelValidator.validate_many(records)
+    assert len(results) == len(expected)
+    for result, expected_result in zip(results, expected, strict=True):
+        assert type(result) is type(expected_result)
+        if isinstance(result, pydantic.ValidationError):
+            assert result.title == expected_result.title
+            assert result.errors() == expected_result.errors()
+        else:
+            assert result == expected_result
+            assert result.model_fields_set == expected_result.model_fields_set
+
+
+def test_validate_parallel_requires_importable_model() -> None:
+    class LocalModel(models.Model):
+        code = models.CharField(max_length=10)
+
+    @pydbull.model_validator(LocalModel)
+    class LocalValidator(pydantic.BaseModel):
+        code: str
+
+    with pytest.raises(TypeError, match="module level"):
+        LocalValidator.validate_parallel([{"code": "x"}])
+
+
+def test_validate_parallel_nested_models_checked(create_tables) -> None:
+    create_tables(ParallelModel)
+    ParallelModel.objects.create(code="taken", email="taken@example.com")
+    records = [
+        {"name": "a", "parents": [{"code": "free", "email": "free@example.com"}]},
+        {"name": "b", "parents": [{"code": "ok", "email": "ok@example.com"}, {"code": "taken", "email": "x@y.cz"}]},
+    ]
+
+    results = ParallelChildValidator.validate_parallel(records, workers=2, chunk_size=1)
+    assert isinstance(results[0], ParallelChildValidator)
+    with pytest.raises(pydantic.ValidationError) as single_exc:
+        ParallelChildValidator.model_validate(records[1])
+    assert results[1].errors() == single_exc.value.errors()
+    assert [error["loc"] for error in results[1].errors()] == [("parents", 1, "code")]
+
+
+def test_validate_parallel_spawn(create_tables) -> None:
+    create_tables(ParallelModel)
+    ParallelModel.objects.create(code="taken", email="taken@example.com")
+    records = [{"code": "ok", "email": "ok@example.com"}, {"code": "taken", "email": "other@example.com"}]
+
+    # The spawned worker processes set up Django (`DjangoAdapter.worker_initializer`) before importing the model.
+    results = ParallelValidator.validate_parallel(
+        records,
+        workers=1,
+        chunk_size=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    assert results[0] == ParallelValidator(code="ok", email="ok@example.com")
+    assert isinstance(results[1], pydantic.ValidationError)
+    assert results[1].errors()[0]["loc"] == ("code",)
@@ -99,3 +99,12 @@ def test_get_fail_fast() -> None:
     assert PYD_ADAPTER.get_fail_fast(pydantic.Field()) == PydanticUndefined
     assert PYD_ADAPTER.get_fail_fast(pydantic.Field(fail_fast=False)) is False
     assert PYD_ADAPTER.get_fail_fast(pydantic.Field(fail_fast=True)) is True
+
+
+def test_build_field_spec() -> None:
+    spec = PYD_ADAPTER.build_field_spec(pydantic.Field(max_length=5, ge=1, description="Description"))
+    assert spec.max_length == 5
+    assert spec.ge == 1
+    assert spec.le == PydanticUndefined
+    assert spec.description == "Description"
+    assert spec.validators == ()